@@ -20,7 +20,7 @@ class ChannelType(str, Enum):
     WEBCHAT = "webchat"
 
 
-@dataclass
+@dataclass(slots=True)
 class IncomingMessage:
     """Normalized incoming message from any channel."""
     id: str = field(default_factory=lambda: str(uuid4()))
@@ -37,6 +37,11 @@ COMMANDS = {
     "/help":     "Mostra esta lista de comandos",
 }
 
+# /help output never changes at runtime (COMMANDS is static), so format it once
+_HELP_TEXT = "\n".join(
+    ["📖 **Comandos Disponíveis**\n"] + [f"• `{cmd}` — {desc}" for cmd, desc in COMMANDS.items()]
+)
+
 
 class ChatCommandHandler:
     """
@@ -44,6 +49,24 @@ class ChatCommandHandler:
     Returns CommandResult with formatted response.
     """
 
+    # Command → method name, built once per class instead of per execute() call
+    _HANDLERS = {
+        "/status":   "_cmd_status",
+        "/think":    "_cmd_think",
+        "/agents":   "_cmd_agents",
+        "/task":     "_cmd_task",
+        "/learn":    "_cmd_learn",
+        "/memory":   "_cmd_memory",
+        "/tools":    "_cmd_tools",
+        "/activity": "_cmd_activity",
+        "/compact":  "_cmd_compact",
+        "/clear":    "_cmd_clear",
+        "/new":      "_cmd_new",
+        "/help":     "_cmd_help",
+        "/standup":  "_cmd_standup",
+        "/cron":     "_cmd_cron",
+    }
+
     def is_command(self, text: str) -> bool:
         """Check if text starts with a slash command."""
         return text.strip().startswith("/")
@@ -58,30 +81,14 @@ class ChatCommandHandler:
         command = parts[0].lower()
         args = parts[1] if len(parts) > 1 else ""
 
-        handler = {
-            "/status":   self._cmd_status,
-            "/think":    self._cmd_think,
-            "/agents":   self._cmd_agents,
-            "/task":     self._cmd_task,
-            "/learn":    self._cmd_learn,
-            "/memory":   self._cmd_memory,
-            "/tools":    self._cmd_tools,
-            "/activity": self._cmd_activity,
-            "/compact":  self._cmd_compact,
-            "/clear":    self._cmd_clear,
-            "/new":      self._cmd_new,
-            "/help":     self._cmd_help,
-            "/standup":  self._cmd_standup,
-            "/cron":     self._cmd_cron,
-        }.get(command)
-
-        if not handler:
+        method_name = self._HANDLERS.get(command)
+        if not method_name:
             return CommandResult(
                 text=f"❓ Comando desconhecido: `{command}`\nUse `/help` para ver os comandos disponíveis.",
             )
 
         try:
-            return await handler(args, message)
+            return await getattr(self, method_name)(args, message)
         except Exception as e:
             logger.error(f"Command {command} failed: {e}")
             return CommandResult(text=f"❌ Erro ao executar `{command}`: {str(e)}")
@@ -219,10 +226,7 @@ class ChatCommandHandler:
 
     async def _cmd_help(self, args: str, msg: IncomingMessage) -> CommandResult:
         """Show available commands."""
-        lines = ["📖 **Comandos Disponíveis**\n"]
-        for cmd, desc in COMMANDS.items():
-            lines.append(f"• `{cmd}` — {desc}")
-        return CommandResult(text="\n".join(lines))
+        return CommandResult(text=_HELP_TEXT)
 
     async def _cmd_standup(self, args: str, msg: IncomingMessage) -> CommandResult:
         """Generate team standup."""
@@ -296,6 +300,7 @@ class ChatCommandHandler:
                 cron_scheduler._save()
                 state = "ativado ✅" if job.enabled else "pausado ⏸️"
                 results.append(f"**{job.name}** {state}")
+            cron_scheduler.wake()
 
             return CommandResult(text="⏰ " + "\n".join(results))
 
@@ -4,7 +4,10 @@ Stream of system events: task changes, messages, agent actions.
 """
 
 import logging
-from datetime import datetime, timezone
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -42,19 +45,19 @@ class ActivityFeed:
     """
 
     def __init__(self, max_size: int = 10_000):
-        self._activities: list[Activity] = []
+        # Bounded FIFO: appends past max_size drop the oldest entry in O(1)
+        self._activities: deque[Activity] = deque(maxlen=max_size)
         self._max_size = max_size
 
-    async def record(
-        self,
+    @staticmethod
+    def _new_activity(
         activity_type: str,
         message: str,
         agent_name: str = "",
         task_id: UUID | None = None,
         metadata: dict | None = None,
     ) -> Activity:
-        """Record a new activity event."""
-        activity = Activity(
+        return Activity(
             type=activity_type,
             agent_name=agent_name,
             task_id=task_id,
@@ -62,11 +65,18 @@ class ActivityFeed:
             metadata=metadata or {},
         )
 
-        self._activities.append(activity)
+    async def record(
+        self,
+        activity_type: str,
+        message: str,
+        agent_name: str = "",
+        task_id: UUID | None = None,
+        metadata: dict | None = None,
+    ) -> Activity:
+        """Record a new activity event."""
+        activity = self._new_activity(activity_type, message, agent_name, task_id, metadata)
 
-        # Trim if over max size (FIFO)
-        if len(self._activities) > self._max_size:
-            self._activities = self._activities[-self._max_size:]
+        self._activities.append(activity)
 
         logger.debug(f"Activity recorded: {activity_type}", extra={"props": {
             "type": activity_type, "agent": agent_name, "message_preview": message[:100],
@@ -74,33 +84,52 @@ class ActivityFeed:
 
         return activity
 
+    async def record_many(self, items: Iterable[Mapping]) -> list[Activity]:
+        """
+        Record a batch of activities. Each item maps record()'s argument names to
+        values, e.g. {"activity_type": "task_created", "message": "T1"}.
+        """
+        activities = [self._new_activity(**item) for item in items]
+        self._activities.extend(activities)
+        logger.debug(f"Activities recorded: {len(activities)}")
+        return activities
+
     async def get_recent(self, limit: int = 50) -> list[Activity]:
         """Get most recent activities."""
-        return sorted(self._activities, key=lambda a: a.created_at, reverse=True)[:limit]
+        # Appends happen in creation order, so newest-first is just a reverse walk
+        return list(islice(reversed(self._activities), limit))
 
     async def get_by_agent(self, agent_name: str, limit: int = 50) -> list[Activity]:
         """Get activities for a specific agent."""
-        agent_activities = [a for a in self._activities if a.agent_name == agent_name]
-        return sorted(agent_activities, key=lambda a: a.created_at, reverse=True)[:limit]
+        return self._latest_matching(lambda a: a.agent_name == agent_name, limit)
 
     async def get_by_task(self, task_id: UUID, limit: int = 50) -> list[Activity]:
         """Get activities for a specific task."""
-        task_activities = [a for a in self._activities if a.task_id == task_id]
-        return sorted(task_activities, key=lambda a: a.created_at, reverse=True)[:limit]
+        return self._latest_matching(lambda a: a.task_id == task_id, limit)
 
     async def get_by_type(self, activity_type: str, limit: int = 50) -> list[Activity]:
         """Get activities of a specific type."""
-        typed = [a for a in self._activities if a.type == activity_type]
-        return sorted(typed, key=lambda a: a.created_at, reverse=True)[:limit]
+        return self._latest_matching(lambda a: a.type == activity_type, limit)
+
+    def _latest_matching(self, predicate: Callable[[Activity], bool], limit: int) -> list[Activity]:
+        """Newest-first matches, walking back from the tail and stopping at `limit`."""
+        return list(islice(filter(predicate, reversed(self._activities)), limit))
 
     async def get_daily_summary(self, date: str | None = None) -> dict:
         """Get summary of activities for a date (YYYY-MM-DD)."""
         target_date = date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-        day_activities = [
-            a for a in self._activities
-            if a.created_at.strftime("%Y-%m-%d") == target_date
-        ]
+        # Compare against the day's UTC bounds instead of formatting every timestamp
+        try:
+            day_start = datetime.strptime(target_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            day_activities = []
+        else:
+            day_end = day_start + timedelta(days=1)
+            day_activities = [
+                a for a in self._activities
+                if day_start <= a.created_at < day_end
+            ]
 
         # Count by type
         by_type: dict[str, int] = {}
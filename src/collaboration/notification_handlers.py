@@ -6,7 +6,7 @@ Call Path:
   TaskManager.create()
     → EventBus.emit("task.created")
       → on_task_created(event)
-        → notification_service.send_task_assigned(target_agent, ...)
+        → notification_service.send_task_assigned_many(assignee_ids, ...)
 """
 
 import logging
@@ -34,17 +34,19 @@ async def on_task_created(event: Event):
     except ValueError:
         task_id = None
 
-    for assignee_id in assignee_ids:
-        try:
-            await notification_service.send_task_assigned(
-                target_agent=assignee_id,
-                task_title=title,
-                task_id=task_id,
-                source_agent=created_by,
-            )
-            logger.info(f"Notification sent: task assigned to {assignee_id}")
-        except Exception as e:
-            logger.error(f"Failed to send task notification to {assignee_id}: {e}")
+    if not assignee_ids:
+        return
+
+    try:
+        sent = await notification_service.send_task_assigned_many(
+            target_agents=assignee_ids,
+            task_title=title,
+            task_id=task_id,
+            source_agent=created_by,
+        )
+        logger.info(f"Notification sent: task assigned to {', '.join(n.target_agent for n in sent)}")
+    except Exception as e:
+        logger.error(f"Failed to send task notifications to {assignee_ids}: {e}")
 
 
 async def on_task_updated(event: Event):
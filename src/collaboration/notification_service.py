@@ -5,6 +5,7 @@ Real-time notifications via event queue. Prepared for Supabase Real-time integra
 
 import logging
 from datetime import datetime, timezone
+from itertools import islice
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -69,6 +70,42 @@ class NotificationService:
 
         return notification
 
+    async def send_many(
+        self,
+        target_agents: list[str],
+        notification_type: str,
+        content: str,
+        source_agent: str = "",
+        task_id: UUID | None = None,
+    ) -> list[Notification]:
+        """
+        Send the same notification to several agents in one pass.
+        A recipient that fails is logged and skipped; the others still get theirs.
+        """
+        notifications = []
+        for target_agent in dict.fromkeys(target_agents):
+            try:
+                notification = Notification(
+                    type=notification_type,
+                    target_agent=target_agent,
+                    source_agent=source_agent,
+                    task_id=task_id,
+                    content=content,
+                )
+            except Exception as e:
+                logger.error(f"Failed to send notification to {target_agent}: {e}")
+                continue
+            self._queue.setdefault(target_agent, []).append(notification)
+            notifications.append(notification)
+
+        if notifications:
+            logger.info(f"Notification sent to {len(notifications)} agents", extra={"props": {
+                "type": notification_type, "to": [n.target_agent for n in notifications],
+                "from": source_agent, "content_preview": content[:100],
+            }})
+
+        return notifications
+
     async def send_mention(self, target_agent: str, source_agent: str, task_id: UUID, message_preview: str):
         """Convenience: send a @mention notification."""
         return await self.send(
@@ -89,6 +126,18 @@ class NotificationService:
             task_id=task_id,
         )
 
+    async def send_task_assigned_many(
+        self, target_agents: list[str], task_title: str, task_id: UUID, source_agent: str = "",
+    ):
+        """Convenience: send a task assignment notification to every assignee at once."""
+        return await self.send_many(
+            target_agents,
+            notification_type=NotificationType.TASK_ASSIGNED,
+            content=f"Nova task atribuída: {task_title}",
+            source_agent=source_agent,
+            task_id=task_id,
+        )
+
     async def send_to_subscribers(
         self,
         subscribers: list[str],
@@ -99,9 +148,10 @@ class NotificationService:
         task_id: UUID | None = None,
     ):
         """Send notification to all subscribers of a thread (except the sender)."""
-        for agent in subscribers:
-            if agent != exclude_agent:
-                await self.send(agent, notification_type, content, source_agent, task_id)
+        return await self.send_many(
+            [agent for agent in subscribers if agent != exclude_agent],
+            notification_type, content, source_agent, task_id,
+        )
 
     # ============================================
     # Retrieval
@@ -114,8 +164,8 @@ class NotificationService:
 
     async def get_all(self, agent_name: str, limit: int = 50) -> list[Notification]:
         """Get all notifications for an agent."""
-        notifications = self._queue.get(agent_name, [])
-        return sorted(notifications, key=lambda n: n.created_at, reverse=True)[:limit]
+        # Queues are appended in creation order; walk back only `limit` entries
+        return list(islice(reversed(self._queue.get(agent_name, ())), limit))
 
     async def mark_delivered(self, notification_id: UUID, agent_name: str) -> bool:
         """Mark a notification as delivered."""
@@ -93,7 +93,7 @@ class StandupGenerator:
         summary = await self._feed.get_daily_summary(today)
 
         # Team header
-        report = f"""# 🤖 Team Standup — Agent Optimus
+        parts = [f"""# 🤖 Team Standup — Agent Optimus
 **Data:** {today}
 **Agents Ativos:** {', '.join(summary.get('active_agents', ['nenhum']))}
 
@@ -104,13 +104,13 @@ class StandupGenerator:
 - **Agents ativos:** {len(summary.get('active_agents', []))}
 
 ### Atividades por Tipo
-"""
+"""]
         for activity_type, count in sorted(summary.get("by_type", {}).items()):
-            report += f"- `{activity_type}`: {count}\n"
+            parts.append(f"- `{activity_type}`: {count}\n")
 
-        report += "\n### Atividades por Agent\n"
+        parts.append("\n### Atividades por Agent\n")
         for agent, count in sorted(summary.get("by_agent", {}).items()):
-            report += f"- **{agent}**: {count}\n"
+            parts.append(f"- **{agent}**: {count}\n")
 
         # All tasks summary
         all_tasks = await self._tasks.list_tasks()
@@ -118,21 +118,21 @@ class StandupGenerator:
         for t in all_tasks:
             status_counts[t.status.value] = status_counts.get(t.status.value, 0) + 1
 
-        report += "\n### Status de Tasks\n"
+        parts.append("\n### Status de Tasks\n")
         for status, count in sorted(status_counts.items()):
             emoji = {"inbox": "📥", "assigned": "📌", "in_progress": "🔄",
                      "review": "👀", "done": "✅", "blocked": "🚧"}.get(status, "❓")
-            report += f"- {emoji} `{status}`: {count}\n"
+            parts.append(f"- {emoji} `{status}`: {count}\n")
 
         # Individual standups
         agents = agent_names or summary.get("active_agents", [])
         if agents:
-            report += "\n---\n"
+            parts.append("\n---\n")
             for agent in agents:
                 agent_standup = await self.generate_agent_standup(agent)
-                report += f"\n{agent_standup}\n"
+                parts.append(f"\n{agent_standup}\n")
 
-        return report
+        return "".join(parts)
 
 
 # Singleton
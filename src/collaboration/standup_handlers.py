@@ -11,6 +11,7 @@ Call Path:
           → report stored in ActivityFeed (type: "standup_generated")
 """
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -24,16 +25,9 @@ STANDUP_DIR = Path(__file__).parent.parent.parent / "workspace" / "standups"
 
 async def on_standup_cron_triggered(event: Event) -> None:
     """Generate team standup when the daily_standup cron job fires."""
-    data = event.data
-    job_name = data.get("job_name", "")
-
-    if job_name != "daily_standup":
-        return  # Not our job — ignore
-
     logger.info("FASE 0 #23: Daily standup cron triggered — generating report")
 
     from src.collaboration.standup_generator import standup_generator
-    from datetime import datetime, timezone
 
     try:
         report = await standup_generator.generate_team_standup()
@@ -46,11 +40,11 @@ async def on_standup_cron_triggered(event: Event) -> None:
             metadata={"report_preview": report[:200]},
         )
 
-        # Persist to workspace/standups/<date>.md
+        # Persist to workspace/standups/<date>.md, dated by the cron tick that fired
         STANDUP_DIR.mkdir(parents=True, exist_ok=True)
-        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        date_str = event.timestamp.strftime("%Y-%m-%d")
         report_file = STANDUP_DIR / f"{date_str}.md"
-        report_file.write_text(report, encoding="utf-8")
+        await asyncio.to_thread(report_file.write_text, report, encoding="utf-8")
 
         logger.info(f"FASE 0 #23: Standup report saved to {report_file}")
 
@@ -80,6 +74,8 @@ def register_standup_handlers() -> None:
     Register standup and reminder cron handlers on EventBus.
     Called from main.py lifespan startup (FASE 0 #23).
     """
-    event_bus.on(EventType.CRON_TRIGGERED.value, on_standup_cron_triggered)
+    event_bus.on_keyed(EventType.CRON_TRIGGERED.value, "daily_standup", on_standup_cron_triggered)
+    # Reminder jobs are named "Lembrete: <text>", one name per reminder, so there is
+    # no fixed key to dispatch on; the handler stays generic and filters by prefix
     event_bus.on(EventType.CRON_TRIGGERED.value, on_reminder_cron_triggered)
     logger.info("FASE 0 #23: Standup + reminder handlers registered on EventBus")
@@ -8,6 +8,7 @@ import json
 import logging
 from datetime import datetime, timezone
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from uuid import UUID, uuid4
 
@@ -26,6 +27,15 @@ def _get_event_bus():
     return event_bus, EventType
 
 
+def _emit_task_events(events: list[tuple[str, dict]]) -> None:
+    """Fire (event_type, data) pairs as one background dispatch."""
+    from src.core.events import Event
+    event_bus, _ = _get_event_bus()
+    event_bus.emit_nowait(*(
+        Event(type=event_type, source="task_manager", data=data) for event_type, data in events
+    ))
+
+
 class TaskStatus(str, Enum):
     INBOX = "inbox"
     ASSIGNED = "assigned"
@@ -157,20 +167,15 @@ class TaskManager:
         }})
 
         # FASE 0 #20: Emit TASK_CREATED event for NotificationService
-        event_bus, EventType = _get_event_bus()
-        import asyncio
-        asyncio.create_task(event_bus.emit_simple(
-            EventType.TASK_CREATED.value,
-            source="task_manager",
-            data={
-                "task_id": str(task.id),
-                "title": task.title,
-                "status": task.status.value,
-                "priority": task.priority.value,
-                "assignee_ids": [str(aid) for aid in task.assignee_ids],
-                "created_by": task.created_by,
-            }
-        ))
+        _, EventType = _get_event_bus()
+        _emit_task_events([(EventType.TASK_CREATED.value, {
+            "task_id": str(task.id),
+            "title": task.title,
+            "status": task.status.value,
+            "priority": task.priority.value,
+            "assignee_ids": [str(aid) for aid in task.assignee_ids],
+            "created_by": task.created_by,
+        })])
 
         return task
 
@@ -240,51 +245,81 @@ class TaskManager:
         if not task:
             return None
 
-        allowed = STATUS_TRANSITIONS.get(task.status, [])
-        if new_status not in allowed:
-            logger.warning(f"Invalid transition: {task.status} → {new_status}", extra={
-                "props": {"task_id": str(task_id), "allowed": [s.value for s in allowed]}
-            })
+        if not self._is_allowed(task, task.status, new_status):
             return None
 
+        _emit_task_events(self._apply_transition(task, new_status, agent_name))
+        self._save()
+        return task
+
+    async def bulk_transition(
+        self, task_id: UUID, statuses: list[TaskStatus], agent_name: str = "",
+    ) -> Task | None:
+        """
+        Walk a task through several statuses in order, persisting once.
+        The whole path is validated first; an invalid step leaves the task untouched.
+        """
+        task = self._tasks.get(task_id)
+        if not task:
+            return None
+
+        current = task.status
+        for new_status in statuses:
+            if not self._is_allowed(task, current, new_status):
+                return None
+            current = new_status
+
+        events: list[tuple[str, dict]] = []
+        for new_status in statuses:
+            events.extend(self._apply_transition(task, new_status, agent_name))
+        if statuses:
+            _emit_task_events(events)
+            self._save()
+        return task
+
+    @staticmethod
+    def _is_allowed(task: Task, old_status: TaskStatus, new_status: TaskStatus) -> bool:
+        allowed = STATUS_TRANSITIONS.get(old_status, [])
+        if new_status not in allowed:
+            logger.warning(f"Invalid transition: {old_status} → {new_status}", extra={
+                "props": {"task_id": str(task.id), "allowed": [s.value for s in allowed]}
+            })
+            return False
+        return True
+
+    def _apply_transition(self, task: Task, new_status: TaskStatus, agent_name: str) -> list[tuple[str, dict]]:
+        """
+        Set the new status and return its (event_type, data) pairs.
+        The caller validates, persists and emits.
+        """
+        task_id = task.id
         old_status = task.status
         task.status = new_status
         task.updated_at = datetime.now(timezone.utc)
-        self._save()
 
         logger.info(f"Task transitioned: {old_status} → {new_status}", extra={"props": {
             "task_id": str(task_id), "title": task.title, "agent": agent_name,
         }})
 
-        # FASE 0 #20: Emit TASK_UPDATED event
-        event_bus, EventType = _get_event_bus()
-        import asyncio
-        asyncio.create_task(event_bus.emit_simple(
-            EventType.TASK_UPDATED.value,
-            source="task_manager",
-            data={
+        # FASE 0 #20: TASK_UPDATED event
+        _, EventType = _get_event_bus()
+        events = [(EventType.TASK_UPDATED.value, {
+            "task_id": str(task_id),
+            "title": task.title,
+            "old_status": old_status.value,
+            "new_status": new_status.value,
+            "agent": agent_name,
+        })]
+
+        # FASE 0 #20: TASK_COMPLETED event when task is marked done
+        if new_status == TaskStatus.DONE:
+            events.append((EventType.TASK_COMPLETED.value, {
                 "task_id": str(task_id),
                 "title": task.title,
-                "old_status": old_status.value,
-                "new_status": new_status.value,
-                "agent": agent_name,
-            }
-        ))
-
-        # FASE 0 #20: Emit TASK_COMPLETED event when task is marked done
-        if new_status == TaskStatus.DONE:
-            asyncio.create_task(event_bus.emit_simple(
-                EventType.TASK_COMPLETED.value,
-                source="task_manager",
-                data={
-                    "task_id": str(task_id),
-                    "title": task.title,
-                    "created_by": task.created_by,
-                    "assignee_ids": [str(aid) for aid in task.assignee_ids],
-                }
-            ))
-
-        return task
+                "created_by": task.created_by,
+                "assignee_ids": [str(aid) for aid in task.assignee_ids],
+            }))
+        return events
 
     async def get_subtasks(self, parent_id: UUID) -> list[Task]:
         """Get all subtasks of a parent task."""
@@ -298,6 +333,15 @@ class TaskManager:
         """Get tasks assigned to a specific agent."""
         return await self.list_tasks(assignee_id=agent_id)
 
+    async def count(self) -> int:
+        """Total number of tasks, without materializing a list."""
+        return len(self._tasks)
+
+    async def latest(self, limit: int = 10) -> list[Task]:
+        """Most recently created tasks, newest first."""
+        # _tasks is insertion-ordered (create() appends), so walk it backwards
+        return list(islice(reversed(self._tasks.values()), limit))
+
     async def get_pending_count(self, agent_name: str = "") -> int:
         """Count tasks that are not done or blocked."""
         active_statuses = {TaskStatus.INBOX, TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS, TaskStatus.REVIEW}
@@ -59,7 +59,12 @@ class A2AProtocol:
 
     def __init__(self):
         self._agents: dict[str, AgentCard] = {}
+        # capability → agent names (dict as an ordered set, registration order)
+        self._by_capability: dict[str, dict[str, None]] = {}
         self._message_log: list[A2AMessage] = []
+        # Indexed at send time so get_messages never scans the whole log; like the
+        # log, each (agent, type) inbox is unbounded ("*" holds every type)
+        self._inbox: dict[tuple[str, str], list[A2AMessage]] = {}
         self._pending_delegations: dict[UUID, DelegationRequest] = {}
 
     # ============================================
@@ -67,13 +72,32 @@ class A2AProtocol:
     # ============================================
 
     def register_agent(self, card: AgentCard):
-        """Register an agent in the discovery service."""
+        """Register an agent in the discovery service.
+
+        Capabilities are indexed here; replace the card via register_agent
+        rather than mutating its capabilities in place.
+        """
+        previous = self._agents.get(card.name)
+        if previous is not None:
+            self._unindex_capabilities(card.name, set(previous.capabilities) - set(card.capabilities))
         self._agents[card.name] = card
+        for capability in card.capabilities:
+            self._by_capability.setdefault(capability, {})[card.name] = None
         logger.info(f"A2A: Agent registered: {card.name} ({card.role})")
 
     def unregister_agent(self, agent_name: str):
         """Remove an agent from discovery."""
-        self._agents.pop(agent_name, None)
+        card = self._agents.pop(agent_name, None)
+        if card is not None:
+            self._unindex_capabilities(agent_name, card.capabilities)
+
+    def _unindex_capabilities(self, agent_name: str, capabilities) -> None:
+        for capability in capabilities:
+            names = self._by_capability.get(capability)
+            if names is not None:
+                names.pop(agent_name, None)
+                if not names:
+                    del self._by_capability[capability]
 
     def discover(
         self,
@@ -82,12 +106,14 @@ class A2AProtocol:
         available_only: bool = True,
     ) -> list[AgentCard]:
         """Discover agents matching criteria."""
-        agents = list(self._agents.values())
+        if capability:
+            names = self._by_capability.get(capability, {})
+            agents = [self._agents[name] for name in names]
+        else:
+            agents = list(self._agents.values())
 
         if available_only:
             agents = [a for a in agents if a.status == "available"]
-        if capability:
-            agents = [a for a in agents if capability in a.capabilities]
         if level:
             agents = [a for a in agents if a.level == level]
 
@@ -129,6 +155,8 @@ class A2AProtocol:
             return False
 
         self._message_log.append(message)
+        for key in ((message.to_agent, message.message_type), (message.to_agent, "*")):
+            self._inbox.setdefault(key, []).append(message)
 
         logger.info(f"A2A message sent", extra={"props": {
             "from": message.from_agent, "to": message.to_agent,
@@ -158,12 +186,10 @@ class A2AProtocol:
         message_type: str | None = None,
     ) -> list[A2AMessage]:
         """Get messages for an agent."""
-        messages = [m for m in self._message_log if m.to_agent == agent_name]
+        messages = self._inbox.get((agent_name, message_type or "*"), ())
 
         if since:
             messages = [m for m in messages if m.timestamp > since]
-        if message_type:
-            messages = [m for m in messages if m.message_type == message_type]
 
         return sorted(messages, key=lambda m: m.timestamp, reverse=True)
 
@@ -5,8 +5,10 @@ Generates contextual greetings and time-sensitive suggestions.
 """
 
 import logging
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 from src.memory.daily_notes import daily_notes
 
@@ -64,6 +66,58 @@ class AmbientContext:
     today_activity_count: int = 0
 
 
+def _time_slot(hour: int) -> str:
+    """Classify hour into time slot."""
+    if 6 <= hour < 12:
+        return "morning"
+    elif 12 <= hour < 18:
+        return "afternoon"
+    elif 18 <= hour < 23:
+        return "evening"
+    return "night"
+
+
+def _time_sensitivity(time_slot: str, day_number: int) -> str:
+    """Determine time sensitivity based on time and day."""
+    if day_number >= 5:
+        return "relaxed"
+    if time_slot == "morning":
+        return "normal"
+    elif time_slot == "afternoon":
+        return "normal"
+    elif time_slot in ("evening", "night"):
+        return "relaxed"
+    return "normal"
+
+
+@lru_cache(maxsize=64)
+def _ambient_snapshot(timezone_offset: int, minute: int) -> AmbientContext:
+    """
+    Time-derived context for one UTC minute. Every field is formatted to
+    minute precision, so all calls within the same minute produce the same
+    snapshot. Callers get a copy (enrich_with_activity mutates it).
+    """
+    utc_now = datetime.fromtimestamp(minute * 60, timezone.utc)
+    now = utc_now.astimezone(timezone(timedelta(hours=timezone_offset)))
+
+    day_number = now.weekday()
+    time_slot = _time_slot(now.hour)
+
+    return AmbientContext(
+        timezone_offset=timezone_offset,
+        local_time=now.strftime("%H:%M"),
+        utc_time=utc_now.strftime("%H:%M UTC"),
+        day_of_week=DAY_NAMES.get(day_number, ""),
+        day_number=day_number,
+        time_slot=time_slot,
+        is_business_hours=9 <= now.hour <= 18 and day_number < 5,
+        is_weekend=day_number >= 5,
+        greeting=GREETINGS.get(time_slot, "Olá"),
+        day_suggestion=DAY_CONTEXT.get(day_number, ""),
+        time_sensitivity=_time_sensitivity(time_slot, day_number),
+    )
+
+
 class ContextAwareness:
     """
     Builds ambient context for the agent.
@@ -74,13 +128,7 @@ class ContextAwareness:
 
     def _get_time_slot(self, hour: int) -> str:
         """Classify hour into time slot."""
-        if 6 <= hour < 12:
-            return "morning"
-        elif 12 <= hour < 18:
-            return "afternoon"
-        elif 18 <= hour < 23:
-            return "evening"
-        return "night"
+        return _time_slot(hour)
 
     def build_context(self, timezone_offset: int = -3) -> AmbientContext:
         """
@@ -89,40 +137,11 @@ class ContextAwareness:
         Args:
             timezone_offset: UTC offset in hours (default: -3 for BRT)
         """
-        tz = timezone(timedelta(hours=timezone_offset))
-        now = datetime.now(tz)
-        utc_now = datetime.now(timezone.utc)
-
-        day_number = now.weekday()
-        time_slot = self._get_time_slot(now.hour)
-
-        ctx = AmbientContext(
-            timezone_offset=timezone_offset,
-            local_time=now.strftime("%H:%M"),
-            utc_time=utc_now.strftime("%H:%M UTC"),
-            day_of_week=DAY_NAMES.get(day_number, ""),
-            day_number=day_number,
-            time_slot=time_slot,
-            is_business_hours=9 <= now.hour <= 18 and day_number < 5,
-            is_weekend=day_number >= 5,
-            greeting=GREETINGS.get(time_slot, "Olá"),
-            day_suggestion=DAY_CONTEXT.get(day_number, ""),
-            time_sensitivity=self.get_time_sensitivity_from_slot(time_slot, day_number),
-        )
-
-        return ctx
+        return replace(_ambient_snapshot(timezone_offset, int(time.time() // 60)))
 
     def get_time_sensitivity_from_slot(self, time_slot: str, day_number: int) -> str:
         """Determine time sensitivity based on time and day."""
-        if day_number >= 5:
-            return "relaxed"
-        if time_slot == "morning":
-            return "normal"
-        elif time_slot == "afternoon":
-            return "normal"
-        elif time_slot in ("evening", "night"):
-            return "relaxed"
-        return "normal"
+        return _time_sensitivity(time_slot, day_number)
 
     def generate_greeting(self, user_name: str, ctx: AmbientContext | None = None) -> str:
         """Generate a contextual greeting."""
@@ -5,6 +5,7 @@ Jobs survive restarts (JSON persistence). Agents can self-schedule via MCP tools
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 from dataclasses import asdict, dataclass, field
@@ -19,6 +20,13 @@ logger = logging.getLogger(__name__)
 CRON_DIR = Path(__file__).parent.parent.parent / "workspace" / "cron"
 JOBS_FILE = CRON_DIR / "jobs.json"
 
+# Longest the loop sleeps without re-checking, even with no job due sooner.
+# Bounds the delay for edits that bypass add()/remove() (e.g. toggling enabled).
+MAX_IDLE_SECONDS = 60.0
+# Shortest sleep between passes, so a job whose next_run fails to advance
+# (e.g. a handler error mid-run) cannot turn the loop into a busy spin.
+MIN_IDLE_SECONDS = 1.0
+
 
 @dataclass
 class CronJob:
@@ -56,7 +64,8 @@ class CronScheduler:
     Features:
     - Jobs persist in JSON (survive restarts)
     - Supports: one-shot (at), recurring (every), cron expressions
-    - Background loop checks every 60s for due jobs
+    - Background loop sleeps until the next job is due (at most 60s);
+      add() wakes it early to re-arm
     - Emits CRON_TRIGGERED events on the EventBus
     """
 
@@ -64,6 +73,7 @@ class CronScheduler:
         self._jobs: dict[str, CronJob] = {}
         self._task: asyncio.Task | None = None
         self._running = False
+        self._wake: asyncio.Event | None = None  # created by start(), on the running loop
         CRON_DIR.mkdir(parents=True, exist_ok=True)
         self._load()
 
@@ -91,12 +101,28 @@ class CronScheduler:
 
         Returns the job ID.
         """
-        # Calculate next_run based on schedule
-        job.next_run = self._calculate_next_run(job)
-        self._jobs[job.id] = job
-        self._save()
-        logger.info(f"Cron: job '{job.name}' ({job.id}) added, next_run={job.next_run}")
-        return job.id
+        return self.add_many([job])[0]
+
+    def add_many(self, jobs: list[CronJob]) -> list[str]:
+        """
+        Add several jobs, writing the jobs file once instead of once per job.
+
+        Returns the job IDs in input order.
+        """
+        for job in jobs:
+            # Calculate next_run based on schedule
+            job.next_run = self._calculate_next_run(job)
+            self._jobs[job.id] = job
+            logger.info(f"Cron: job '{job.name}' ({job.id}) added, next_run={job.next_run}")
+        if jobs:
+            self._save()
+            self.wake()
+        return [job.id for job in jobs]
+
+    def wake(self) -> None:
+        """Make the scheduler loop recompute its next wake-up now."""
+        if self._wake is not None:
+            self._wake.set()
 
     def remove(self, job_id: str) -> bool:
         """Remove a job by ID."""
@@ -104,6 +130,7 @@ class CronScheduler:
             name = self._jobs[job_id].name
             del self._jobs[job_id]
             self._save()
+            self.wake()
             logger.info(f"Cron: job '{name}' ({job_id}) removed")
             return True
         logger.warning(f"Cron: job {job_id} not found")
@@ -116,6 +143,11 @@ class CronScheduler:
             jobs = [j for j in jobs if j.enabled]
         return sorted(jobs, key=lambda j: j.next_run or "")
 
+    @property
+    def job_count(self) -> int:
+        """Number of registered jobs (no list is built)."""
+        return len(self._jobs)
+
     def get(self, job_id: str) -> CronJob | None:
         """Get a job by ID."""
         return self._jobs.get(job_id)
@@ -172,23 +204,38 @@ class CronScheduler:
         logger.warning(f"Cron: invalid interval '{value}'")
         return None
 
-    def _is_due(self, job: CronJob) -> bool:
-        """Check if a job is due to run."""
+    def _next_run_at(self, job: CronJob) -> datetime | None:
+        """Parsed next_run of an enabled job, or None if it is not scheduled."""
         if not job.enabled or not job.next_run:
-            return False
+            return None
 
         try:
             next_run = datetime.fromisoformat(job.next_run)
-            # Handle naive datetimes by assuming UTC
-            if next_run.tzinfo is None:
-                next_run = next_run.replace(tzinfo=timezone.utc)
-            return datetime.now(timezone.utc) >= next_run
         except (ValueError, TypeError):
-            return False
+            return None
+        # Handle naive datetimes by assuming UTC
+        if next_run.tzinfo is None:
+            next_run = next_run.replace(tzinfo=timezone.utc)
+        return next_run
+
+    def _is_due(self, job: CronJob) -> bool:
+        """Check if a job is due to run."""
+        next_run = self._next_run_at(job)
+        return next_run is not None and datetime.now(timezone.utc) >= next_run
+
+    def _seconds_until_next_due(self) -> float:
+        """Delay until the earliest scheduled job, clamped to [MIN_IDLE_SECONDS, MAX_IDLE_SECONDS]."""
+        upcoming = [t for t in map(self._next_run_at, self._jobs.values()) if t is not None]
+        if not upcoming:
+            return MAX_IDLE_SECONDS
+        delay = (min(upcoming) - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, MIN_IDLE_SECONDS), MAX_IDLE_SECONDS)
 
     async def _execute_job(self, job: CronJob) -> None:
         """Execute a single job and emit event."""
         logger.info(f"Cron: executing job '{job.name}' ({job.id})")
+        # run_now() may fire a job ahead of schedule; only a due run consumes it
+        was_due = self._is_due(job)
 
         # Update job state
         job.last_run = datetime.now(timezone.utc).isoformat()
@@ -212,10 +259,22 @@ class CronScheduler:
         if job.delete_after_run:
             del self._jobs[job.id]
             logger.info(f"Cron: one-shot job '{job.name}' completed and removed")
-        elif job.schedule_type == "every":
-            # Reschedule recurring jobs
-            job.next_run = self._calculate_next_run(job)
-            logger.debug(f"Cron: job '{job.name}' rescheduled for {job.next_run}")
+        elif job.schedule_type in ("every", "cron"):
+            # Reschedule recurring jobs; one whose schedule cannot produce a future
+            # time (e.g. invalid interval) is parked instead of re-firing every pass
+            next_run = self._calculate_next_run(job)
+            if datetime.fromisoformat(next_run) > datetime.now(timezone.utc):
+                job.next_run = next_run
+                logger.debug(f"Cron: job '{job.name}' rescheduled for {job.next_run}")
+            else:
+                job.next_run = ""
+                logger.warning(
+                    f"Cron: job '{job.name}' has no valid schedule "
+                    f"('{job.schedule_value}'), not rescheduled"
+                )
+        elif job.schedule_type == "at" and was_due:
+            # Kept one-shot: clear next_run so the sweep does not re-fire it every 60s
+            job.next_run = ""
 
         self._save()
 
@@ -224,6 +283,7 @@ class CronScheduler:
         if self._running:
             return
         self._running = True
+        self._wake = asyncio.Event()
         self._task = asyncio.create_task(self._scheduler_loop())
         logger.info("Cron scheduler started")
 
@@ -239,7 +299,7 @@ class CronScheduler:
         logger.info("Cron scheduler stopped")
 
     async def _scheduler_loop(self) -> None:
-        """Background loop — checks for due jobs every 60 seconds."""
+        """Background loop — runs due jobs, then sleeps until the next one (or a wake())."""
         while self._running:
             try:
                 due_jobs = [j for j in self._jobs.values() if self._is_due(j)]
@@ -252,7 +312,10 @@ class CronScheduler:
             except Exception as e:
                 logger.error(f"Cron scheduler error: {e}")
 
-            await asyncio.sleep(60)
+            # Clear before measuring, so an add() racing with this pass still wakes us
+            self._wake.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self._seconds_until_next_due())
 
 
 # Singleton
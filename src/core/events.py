@@ -6,6 +6,7 @@ heartbeats, and webhook receiver.
 
 import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -36,7 +37,7 @@ class EventType(str, Enum):
     CRON_TRIGGERED = "cron.triggered"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """System event."""
     id: str = field(default_factory=lambda: str(uuid4()))
@@ -49,56 +50,112 @@ class Event:
 # Type alias for event handlers
 EventHandler = Callable[[Event], Coroutine[Any, Any, None]]
 
+# event.data field that selects handlers registered with EventBus.on_keyed()
+DISPATCH_KEY = "job_name"
+
 
 class EventBus:
     """
     Pub/sub event bus for internal event-driven communication.
     Prepared for Supabase Real-time integration in production.
+
+    Handlers that only care about one job (e.g. CRON_TRIGGERED for
+    "daily_standup") subscribe with on_keyed(); emit() then looks them up by
+    (type, data["job_name"]) instead of waking every handler to compare names.
     """
 
     def __init__(self):
-        self._handlers: dict[str, list[EventHandler]] = {}
-        self._event_log: list[Event] = []
+        # Tuples are rebuilt on on()/off(), so emit() can iterate a snapshot
+        # without copying even if a handler (un)subscribes mid-dispatch.
+        self._handlers: dict[str, tuple[EventHandler, ...]] = {}
+        self._keyed_handlers: dict[tuple[str, str], tuple[EventHandler, ...]] = {}
         self._max_log_size = 10_000
+        # Bounded: the oldest event drops off in O(1) once the log is full
+        self._event_log: deque[Event] = deque(maxlen=self._max_log_size)
+        # Strong refs to fire-and-forget emits so they are not GC'd mid-flight
+        self._background: set[asyncio.Task] = set()
 
     def on(self, event_type: str, handler: EventHandler):
-        """Subscribe a handler to an event type."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        """Subscribe a handler to an event type (no-op if already subscribed)."""
+        handlers = self._handlers.get(event_type, ())
+        if handler in handlers:
+            return
+        self._handlers[event_type] = handlers + (handler,)
         logger.debug(f"EventBus: handler registered for '{event_type}'")
 
     def off(self, event_type: str, handler: EventHandler):
         """Unsubscribe a handler."""
-        if event_type in self._handlers:
-            self._handlers[event_type] = [
-                h for h in self._handlers[event_type] if h != handler
-            ]
+        handlers = self._handlers.get(event_type)
+        if handlers:
+            self._handlers[event_type] = tuple(h for h in handlers if h != handler)
+
+    def on_keyed(self, event_type: str, key: str, handler: EventHandler):
+        """Subscribe a handler to events of this type whose data["job_name"] equals key."""
+        handlers = self._keyed_handlers.get((event_type, key), ())
+        if handler in handlers:
+            return
+        self._keyed_handlers[(event_type, key)] = handlers + (handler,)
+        logger.debug(f"EventBus: handler registered for '{event_type}' [{key}]")
+
+    def off_keyed(self, event_type: str, key: str, handler: EventHandler):
+        """Unsubscribe a keyed handler."""
+        handlers = self._keyed_handlers.get((event_type, key))
+        if handlers:
+            self._keyed_handlers[(event_type, key)] = tuple(h for h in handlers if h != handler)
 
     async def emit(self, event: Event):
         """Emit an event to all subscribed handlers."""
         self._event_log.append(event)
-        if len(self._event_log) > self._max_log_size:
-            self._event_log = self._event_log[-self._max_log_size:]
 
         event_type = event.type if isinstance(event.type, str) else event.type.value
-        handlers = self._handlers.get(event_type, [])
-
         # Also notify wildcard handlers
-        wildcard_handlers = self._handlers.get("*", [])
-        all_handlers = handlers + wildcard_handlers
+        handlers = self._handlers.get(event_type, ()) + self._handlers.get("*", ())
+        if self._keyed_handlers and event.data:
+            key = event.data.get(DISPATCH_KEY)
+            if isinstance(key, str):
+                handlers += self._keyed_handlers.get((event_type, key), ())
+        if not handlers:
+            return
 
-        if not all_handlers:
+        # A lone handler is awaited inline; gather would wrap it in a Task.
+        if len(handlers) == 1:
+            try:
+                await handlers[0](event)
+            except Exception as e:
+                logger.error(f"EventBus handler error: {e}")
             return
 
         # Execute handlers concurrently
-        tasks = [h(event) for h in all_handlers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*(h(event) for h in handlers), return_exceptions=True)
 
-        for i, result in enumerate(results):
+        for result in results:
             if isinstance(result, Exception):
                 logger.error(f"EventBus handler error: {result}")
 
+    async def emit_many(self, events: list[Event]):
+        """Emit several events concurrently; each is logged in list order."""
+        if len(events) == 1:
+            await self.emit(events[0])
+        elif events:
+            await asyncio.gather(*(self.emit(e) for e in events))
+
+    def emit_nowait(self, *events: Event) -> asyncio.Task:
+        """
+        Schedule events for dispatch without awaiting handlers (needs a running loop).
+        Callers that can await should use emit()/emit_many(): handlers then finish
+        before the call returns, with no extra loop iteration.
+        """
+        coro = self.emit(events[0]) if len(events) == 1 else self.emit_many(list(events))
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def flush(self) -> None:
+        """Wait for every emit_nowait() dispatch, including ones scheduled while waiting."""
+        while self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
     async def emit_simple(self, event_type: str, source: str = "", data: dict | None = None):
         """Convenience method to emit a simple event."""
         await self.emit(Event(type=event_type, source=source, data=data or {}))
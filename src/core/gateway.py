@@ -25,10 +25,18 @@ _MAX_TOPIC_LEN = 80
 _SKIP_PREFIXES = ("/", "ok", "sim", "não", "nao", "obrigado", "thanks", "oi", "olá", "hello", "ok!")
 
 
+def _maybe_command(message: str) -> bool:
+    """Cheap pre-check so plain messages never touch the chat command module."""
+    head = message[:1]
+    if head == "/":
+        return True
+    return head.isspace() and message.lstrip().startswith("/")
+
+
 def _should_auto_share(message: str, response: str) -> bool:
     """Decide if a response is substantive enough to auto-share as a learning."""
     msg_lower = message.strip().lower()
-    if any(msg_lower.startswith(p) for p in _SKIP_PREFIXES):
+    if msg_lower.startswith(_SKIP_PREFIXES):
         return False
     if len(response.strip()) < _MIN_LEARNING_LEN:
         return False
@@ -162,10 +170,10 @@ class Gateway:
 
             # FASE 0 #17: Chat Commands Integration
             # Check for slash commands BEFORE routing to agents
-            from src.channels.chat_commands import chat_commands
-            from src.channels.base_channel import IncomingMessage, ChannelType
+            if _maybe_command(message):
+                from src.channels.chat_commands import chat_commands
+                from src.channels.base_channel import IncomingMessage, ChannelType
 
-            if chat_commands.is_command(message):
                 # Create IncomingMessage for command handler
                 cmd_message = IncomingMessage(
                     channel=ChannelType.WEBCHAT,
@@ -177,7 +185,7 @@ class Gateway:
 
                 cmd_result = await chat_commands.execute(cmd_message)
                 if cmd_result:
-                    trace_event("chat_command_executed", {"command": message.split()[0]})
+                    trace_event("chat_command_executed", {"command": message.split(maxsplit=1)[0]})
                     return {
                         "content": cmd_result.text,
                         "agent": "chat_commands",
@@ -192,16 +200,17 @@ class Gateway:
             intent_result = intent_classifier.classify(message)
 
             # FASE 0 #22: Emit MESSAGE_RECEIVED for ActivityFeed
-            from src.core.events import event_bus, EventType
-            await event_bus.emit_simple(
-                EventType.MESSAGE_RECEIVED.value,
+            # Fire-and-forget: activity logging must not delay the reply
+            from src.core.events import Event, event_bus, EventType
+            event_bus.emit_nowait(Event(
+                type=EventType.MESSAGE_RECEIVED.value,
                 source="gateway",
                 data={
                     "user_id": user_id,
                     "agent_name": agent_name,
                     "message_preview": message[:200],
                 },
-            )
+            ))
 
             # 1. Initialize/Refresh Session Context
             from src.memory.session_bootstrap import session_bootstrap
@@ -473,10 +482,10 @@ class Gateway:
         await self.initialize()
 
         # FASE 0 #17: Chat Commands Integration (Streaming)
-        from src.channels.chat_commands import chat_commands
-        from src.channels.base_channel import IncomingMessage, ChannelType
+        if _maybe_command(message):
+            from src.channels.chat_commands import chat_commands
+            from src.channels.base_channel import IncomingMessage, ChannelType
 
-        if chat_commands.is_command(message):
             cmd_message = IncomingMessage(
                 channel=ChannelType.WEBCHAT,
                 text=message,
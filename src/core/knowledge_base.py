@@ -3,10 +3,12 @@ Agent Optimus — Knowledge Base Service (Phase 17).
 Handles document ingestion, chunking, embedding, and hybrid retrieval.
 """
 
+import asyncio
 import io
 import hashlib
 import logging
 import json
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -16,6 +18,7 @@ from uuid import UUID
 from sqlalchemy import text
 
 # from src.core.config import settings
+from src.core.pdf_worker import extract_pdf_pages, get_pdf_pool, spill_pdf
 from src.infra.model_router import model_router
 from src.infra.supabase_client import get_async_session
 
@@ -32,6 +35,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# PDFs with at least this many pages are extracted across worker processes
+# (pypdf is pure Python and holds the GIL, so threads would not help).
+PDF_PARALLEL_MIN_PAGES = 16
+
+
+def _extract_all_pages(reader) -> list[str]:
+    return [page.extract_text() or "" for page in reader.pages]
+
 
 @dataclass
 class KnowledgeChunk:
@@ -112,15 +123,33 @@ class KnowledgeBase:
     def __init__(self):
         self.splitter = SimpleTextSplitter(chunk_size=1000, chunk_overlap=150)
 
-    def _extract_text_from_pdf(self, content: bytes) -> str:
+    async def _extract_text_from_pdf(self, content: bytes) -> str:
         if not pypdf:
             raise RuntimeError("pypdf not installed")
         
-        text_out = []
         try:
-            reader = pypdf.PdfReader(io.BytesIO(content))
-            for page in reader.pages:
-                text_out.append(page.extract_text() or "")
+            # Parsing is CPU-bound pure Python: keep it off the event loop
+            reader = await asyncio.to_thread(pypdf.PdfReader, io.BytesIO(content))
+            page_count = len(reader.pages)
+
+            if page_count < PDF_PARALLEL_MIN_PAGES:
+                text_out = await asyncio.to_thread(_extract_all_pages, reader)
+            else:
+                # One contiguous page range per worker, so each re-parses the PDF once
+                workers = min(os.cpu_count() or 1, page_count)
+                step = -(-page_count // workers)
+                ranges = [(i, min(i + step, page_count)) for i in range(0, page_count, step)]
+                path = await asyncio.to_thread(spill_pdf, content)
+                try:
+                    loop = asyncio.get_running_loop()
+                    pool = get_pdf_pool()
+                    parts = await asyncio.gather(*(
+                        loop.run_in_executor(pool, extract_pdf_pages, path, start, stop)
+                        for start, stop in ranges
+                    ))
+                finally:
+                    os.unlink(path)
+                text_out = [page_text for part in parts for page_text in part]
             return "\n".join(text_out)
         except Exception as e:
             logger.error(f"PDF parsing error: {e}")
@@ -160,7 +189,7 @@ class KnowledgeBase:
             ext = filename.lower().split('.')[-1] if '.' in filename else ""
             
             if mime_type == "application/pdf" or ext == "pdf":
-                parsed_text = self._extract_text_from_pdf(content_bytes)
+                parsed_text = await self._extract_text_from_pdf(content_bytes)
             elif mime_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document" or ext == "docx":
                 parsed_text = self._extract_text_from_docx(content_bytes)
             elif mime_type and mime_type.startswith("audio/"):
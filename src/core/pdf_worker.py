@@ -0,0 +1,53 @@
+"""
+Agent Optimus — PDF extraction worker pool.
+Kept free of app imports: spawned workers import only this module (and pypdf)
+to unpickle the task function, not the knowledge base or its DB client.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+_pdf_pool: ProcessPoolExecutor | None = None
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Long-lived worker pool for PDF extraction, created on first use.
+    Workers are spawned, not forked, so they never inherit the server's threads or locks.
+    """
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pdf_pool
+
+
+async def shutdown_pdf_pool() -> None:
+    """Stop the worker processes, if the pool was ever started (safe to call more than once)."""
+    global _pdf_pool
+    pool, _pdf_pool = _pdf_pool, None
+    if pool is not None:
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+
+def extract_pdf_pages(path: str, start: int, stop: int) -> list[str]:
+    """Extract text from pages [start, stop). Runs in a worker process, so it re-opens the PDF."""
+    reader = pypdf.PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def spill_pdf(content: bytes) -> str:
+    """Write the PDF to a temp file so workers read it from disk instead of receiving a pickled copy."""
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+        tmp.write(content)
+    return tmp.name
@@ -3,12 +3,56 @@ Agent Optimus — Performance Manager.
 Session pruning, context compacting, and caching utilities.
 """
 
+import asyncio
+import hashlib
+import heapq
 import logging
+import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
+# Sentence punctuation trimmed from the ends of a cache key; punctuation inside
+# the query is kept, since it can carry meaning ("C++" vs "C", "2+2" vs "22")
+_TRAILING_PUNCTUATION = "?!.…"
+_LEADING_PUNCTUATION = "¿¡"
+
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+# Lines rendered by ContextCompactor._summarize_messages before the "... e mais" suffix
+SUMMARY_MAX_LINES = 30
+# Content chars noise-pruned per message to build its 200-char summary preview
+SUMMARY_SCAN_CHARS = 2_000
+
+# QueryCache keys at least this long are stored as a 128-bit BLAKE2b hex digest
+HASHED_KEY_MIN_LEN = 256
+
+
+def prune_noise_lines(text: str) -> str:
+    """
+    Delete low-signal lines verbatim (never rewrite): ANSI escapes, blank lines and
+    immediate repeats such as duplicated stack frames. Other lines keep their exact text.
+    """
+    if "\n" not in text and "\x1b" not in text:
+        return text
+    kept: list[str] = []
+    previous = None
+    for line in _ANSI_ESCAPE.sub("", text).splitlines():
+        if line.strip() and line != previous:
+            kept.append(line)
+        previous = line
+    return "\n".join(kept)
+
+
+def normalize_query(query: str) -> str:
+    """Casefold, collapse whitespace and trim end punctuation: 'What is  Python?' → 'what is python'."""
+    collapsed = " ".join(query.casefold().split())
+    return collapsed.lstrip(_LEADING_PUNCTUATION).rstrip(_TRAILING_PUNCTUATION).strip()
+
 
 @dataclass
 class SessionInfo:
@@ -107,6 +151,7 @@ class ContextCompactor:
                 "messages": messages,
                 "compacted": False,
                 "original_count": len(messages),
+                "compression_ratio": 1.0,
             }
 
         # Keep the last N messages intact
@@ -127,12 +172,14 @@ class ContextCompactor:
             "props": {"agent": agent_name, "original": len(messages), "compacted": len(compacted_messages)}
         })
 
+        before = self.estimate_tokens(messages)
         return {
             "messages": compacted_messages,
             "compacted": True,
             "original_count": len(messages),
             "compacted_count": len(compacted_messages),
             "summarized_count": len(older),
+            "compression_ratio": round(self.estimate_tokens(compacted_messages) / before, 3) if before else 1.0,
         }
 
     def _summarize_messages(self, messages: list[dict]) -> str:
@@ -140,16 +187,34 @@ class ContextCompactor:
         if not messages:
             return ""
 
-        lines = []
+        # Consecutive messages with identical previews (repeated tool output...) fold
+        # into one line; previews that differ at all, even only in numbers, stay
+        # separate so no ids or counts are lost. Scanning stops once
+        # SUMMARY_MAX_LINES lines are filled. Noise lines are pruned from a bounded
+        # prefix (SUMMARY_SCAN_CHARS) so the 200-char preview carries signal without
+        # scanning whole tool outputs.
+        lines: list[list] = []  # [role, preview, count]
+        last_key = None
+        consumed = 0
         for msg in messages:
             role = msg.get("role", "unknown")
-            content = msg.get("content", "")[:200]
-            lines.append(f"- [{role}]: {content}")
-
-        # Limit summary length
-        summary = "\n".join(lines[:30])
-        if len(lines) > 30:
-            summary += f"\n... e mais {len(lines) - 30} mensagens."
+            preview = prune_noise_lines(msg.get("content", "")[:SUMMARY_SCAN_CHARS])[:200]
+            key = (role, preview)
+            if key == last_key:
+                lines[-1][2] += 1
+            elif len(lines) == SUMMARY_MAX_LINES:
+                break
+            else:
+                lines.append([role, preview, 1])
+                last_key = key
+            consumed += 1
+
+        summary = "\n".join(
+            f"- [{role}]: {preview}" + (f" (×{count})" if count > 1 else "")
+            for role, preview, count in lines
+        )
+        if consumed < len(messages):
+            summary += f"\n... e mais {len(messages) - consumed} mensagens."
 
         return summary
 
@@ -163,50 +228,167 @@ class QueryCache:
     """
     In-memory LRU cache for frequent queries.
     Reduces redundant LLM calls for repeated questions.
+    Recent misses are remembered in a short-lived negative cache so repeated
+    lookups of unknown keys skip the positive-cache TTL check.
+
+    Entries carry a monotonic deadline. A min-heap of (deadline, key) lets get()
+    and set() drop everything already expired in O(log n) per entry, without
+    scanning; an optional background purger (start_purger) also sweeps both
+    tiers once per interval.
+
+    With normalize_keys=True, keys pass through normalize_query() so rephrasings
+    that differ only in case, spacing or end punctuation share one entry. Keys of
+    HASHED_KEY_MIN_LEN chars or more (prompts with embedded RAG context) are
+    stored as a fixed 32-char digest, so hits compare and retain 32 chars
+    instead of the whole prompt.
     """
 
-    def __init__(self, max_size: int = 500, ttl_seconds: int = 3600):
-        self._cache: dict[str, dict] = {}  # key → {value, timestamp}
+    def __init__(
+        self,
+        max_size: int = 500,
+        ttl_seconds: int = 3600,
+        negative_ttl_seconds: int = 60,
+        normalize_keys: bool = False,
+    ):
+        self._cache: OrderedDict[str, tuple[str, float]] = OrderedDict()  # key → (value, deadline), LRU order
+        self._neg: OrderedDict[str, float] = OrderedDict()  # key → deadline of the recorded miss
+        # (deadline, key); stale pairs (key re-set or evicted) are skipped on pop
+        self._expiry: list[tuple[float, str]] = []
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.normalize_keys = normalize_keys
         self._hits = 0
         self._misses = 0
+        self._neg_hits = 0
+        self._running = False
+        self._task: asyncio.Task | None = None
 
     def get(self, key: str) -> str | None:
         """Get cached value if exists and not expired."""
+        key = self._key(key)
+        now = time.monotonic()
+        self._expire(now)
+
+        neg_deadline = self._neg.get(key)
+        if neg_deadline is not None:
+            if now <= neg_deadline:
+                self._neg_hits += 1
+                self._misses += 1
+                return None
+            del self._neg[key]
+
         entry = self._cache.get(key)
-        if not entry:
-            self._misses += 1
+        if entry is None:
+            self._remember_miss(key, now)
             return None
 
-        age = (datetime.now(timezone.utc) - entry["timestamp"]).total_seconds()
-        if age > self.ttl_seconds:
+        value, deadline = entry
+        if now > deadline:
             del self._cache[key]
-            self._misses += 1
+            self._remember_miss(key, now)
             return None
 
+        self._cache.move_to_end(key)
         self._hits += 1
-        return entry["value"]
+        return value
+
+    def _key(self, key: str) -> str:
+        if self.normalize_keys:
+            key = normalize_query(key)
+        if len(key) >= HASHED_KEY_MIN_LEN:
+            key = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return key
+
+    def _expire(self, now: float) -> int:
+        """Pop expired heap entries, deleting those that still match the live deadline."""
+        heap = self._expiry
+        removed = 0
+        while heap and heap[0][0] < now:
+            deadline, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == deadline:
+                del self._cache[key]
+                removed += 1
+        return removed
+
+    def _remember_miss(self, key: str, now: float):
+        self._misses += 1
+        self._neg[key] = now + self.negative_ttl_seconds
+        self._neg.move_to_end(key)
+        if len(self._neg) > self.max_size:
+            self._neg.popitem(last=False)
 
     def set(self, key: str, value: str):
         """Cache a value."""
-        # Evict oldest if at capacity
-        if len(self._cache) >= self.max_size:
-            oldest = min(self._cache, key=lambda k: self._cache[k]["timestamp"])
-            del self._cache[oldest]
-
-        self._cache[key] = {
-            "value": value,
-            "timestamp": datetime.now(timezone.utc),
-        }
+        key = self._key(key)
+        now = time.monotonic()
+        self._expire(now)
+        self._neg.pop(key, None)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self.max_size:
+            # Evict least recently used
+            self._cache.popitem(last=False)
+
+        deadline = now + self.ttl_seconds
+        self._cache[key] = (value, deadline)
+        heapq.heappush(self._expiry, (deadline, key))
+        # Re-sets and evictions leave stale heap pairs; rebuild once they dominate
+        if len(self._expiry) > 2 * self.max_size:
+            self._expiry = [(d, k) for k, (_, d) in self._cache.items()]
+            heapq.heapify(self._expiry)
 
     def invalidate(self, key: str):
         """Remove a specific cache entry."""
+        key = self._key(key)
         self._cache.pop(key, None)
 
     def clear(self):
         """Clear entire cache."""
         self._cache.clear()
+        self._neg.clear()
+        self._expiry.clear()
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry from both tiers. Returns how many were removed."""
+        now = time.monotonic()
+        removed = self._expire(now)
+        # Misses are re-appended on record with a fixed TTL, so _neg is in deadline order
+        neg = self._neg
+        while neg:
+            key, deadline = next(iter(neg.items()))
+            if now <= deadline:
+                break
+            del neg[key]
+            removed += 1
+        return removed
+
+    async def start_purger(self, interval_seconds: float = 60):
+        """Start the single background task that periodically purges expired entries."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._purge_loop(interval_seconds))
+
+    async def stop_purger(self):
+        """Stop the background purger."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _purge_loop(self, interval_seconds: float):
+        while self._running:
+            try:
+                await asyncio.sleep(interval_seconds)
+                removed = self.purge_expired()
+                if removed:
+                    logger.debug(f"QueryCache purged {removed} expired entries")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"QueryCache purge loop error: {e}")
 
     def get_stats(self) -> dict:
         total = self._hits + self._misses
@@ -216,6 +398,7 @@ class QueryCache:
             "max_size": self.max_size,
             "hits": self._hits,
             "misses": self._misses,
+            "neg_hits": self._neg_hits,
             "hit_rate": f"{hit_rate:.1f}%",
         }
 
@@ -223,4 +406,4 @@ class QueryCache:
 # Singletons
 session_pruner = SessionPruner()
 context_compactor = ContextCompactor()
-query_cache = QueryCache()
+query_cache = QueryCache(normalize_keys=True)
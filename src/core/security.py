@@ -4,13 +4,18 @@ Permission matrix, audit trail, and sandbox levels for agents.
 """
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from itertools import islice
 from uuid import uuid4
 
 logger = logging.getLogger(__name__)
 
+# Denied checks kept per agent for get_denied_actions(agent_name=...)
+MAX_DENIED_PER_AGENT = 1_000
+
 
 class SandboxLevel(str, Enum):
     FULL_ACCESS = "full_access"    # lead agents
@@ -29,27 +34,39 @@ class Permission(str, Enum):
     SYSTEM_CONFIG = "system_config"
 
 
-# Permission matrix by agent level
-PERMISSION_MATRIX: dict[str, set[Permission]] = {
-    "lead": {
+# Permission matrix by agent level (immutable: checked on every tool call)
+PERMISSION_MATRIX: dict[str, frozenset[Permission]] = {
+    "lead": frozenset({
         Permission.DB_READ, Permission.DB_WRITE,
         Permission.FS_READ, Permission.FS_WRITE,
         Permission.NETWORK, Permission.MCP_EXECUTE,
         Permission.AGENT_DELEGATE, Permission.SYSTEM_CONFIG,
-    },
-    "specialist": {
+    }),
+    "specialist": frozenset({
         Permission.DB_READ, Permission.DB_WRITE,
         Permission.FS_READ, Permission.FS_WRITE,
         Permission.NETWORK, Permission.MCP_EXECUTE,
         Permission.AGENT_DELEGATE,
-    },
-    "intern": {
+    }),
+    "intern": frozenset({
         Permission.DB_READ,
         Permission.FS_READ,
         Permission.MCP_EXECUTE,
-    },
+    }),
+}
+_NO_PERMISSIONS: frozenset[Permission] = frozenset()
+
+# Bitmask form of the matrix: check_permission is a single AND per call
+PERMISSION_BITS: dict[Permission, int] = {p: 1 << i for i, p in enumerate(Permission)}
+LEVEL_MASKS: dict[str, int] = {
+    level: sum(PERMISSION_BITS[p] for p in perms)
+    for level, perms in PERMISSION_MATRIX.items()
 }
 
+
+def _mask_to_permissions(mask: int) -> frozenset[Permission]:
+    return frozenset(p for p, bit in PERMISSION_BITS.items() if mask & bit)
+
 SANDBOX_BY_LEVEL: dict[str, SandboxLevel] = {
     "lead": SandboxLevel.FULL_ACCESS,
     "specialist": SandboxLevel.RESTRICTED,
@@ -78,9 +95,12 @@ class SecurityManager:
     """
 
     def __init__(self):
-        self._audit_log: list[AuditEntry] = []
-        self._custom_permissions: dict[str, set[Permission]] = {}  # agent-specific overrides
         self._max_audit_size = 50_000
+        # Bounded FIFOs: appends past maxlen drop the oldest entry
+        self._audit_log: deque[AuditEntry] = deque(maxlen=self._max_audit_size)
+        self._denied: deque[AuditEntry] = deque(maxlen=self._max_audit_size)
+        self._denied_by_agent: dict[str, deque[AuditEntry]] = {}
+        self._custom_masks: dict[str, int] = {}  # agent-specific overrides
 
     # ============================================
     # Permission Checks
@@ -94,12 +114,11 @@ class SecurityManager:
         resource: str = "",
     ) -> bool:
         """Check if an agent has a specific permission."""
-        # Check custom permissions first
-        if agent_name in self._custom_permissions:
-            allowed = permission in self._custom_permissions[agent_name]
-        else:
-            level_perms = PERMISSION_MATRIX.get(agent_level, set())
-            allowed = permission in level_perms
+        # Custom permissions override the level matrix; one dict lookup either way
+        mask = self._custom_masks.get(agent_name)
+        if mask is None:
+            mask = LEVEL_MASKS.get(agent_level, 0)
+        allowed = bool(mask & PERMISSION_BITS[permission])
 
         # Audit the check
         self._audit(AuditEntry(
@@ -122,17 +141,16 @@ class SecurityManager:
         """Get the sandbox level for an agent level."""
         return SANDBOX_BY_LEVEL.get(agent_level, SandboxLevel.ISOLATED)
 
-    def get_permissions(self, agent_name: str, agent_level: str) -> set[Permission]:
+    def get_permissions(self, agent_name: str, agent_level: str) -> frozenset[Permission]:
         """Get all permissions for an agent."""
-        if agent_name in self._custom_permissions:
-            return self._custom_permissions[agent_name]
-        return PERMISSION_MATRIX.get(agent_level, set())
+        mask = self._custom_masks.get(agent_name)
+        if mask is None:
+            return PERMISSION_MATRIX.get(agent_level, _NO_PERMISSIONS)
+        return _mask_to_permissions(mask)
 
     def grant_permission(self, agent_name: str, permission: Permission):
         """Grant a custom permission to a specific agent."""
-        if agent_name not in self._custom_permissions:
-            self._custom_permissions[agent_name] = set()
-        self._custom_permissions[agent_name].add(permission)
+        self._custom_masks[agent_name] = self._custom_masks.get(agent_name, 0) | PERMISSION_BITS[permission]
 
         self._audit(AuditEntry(
             action="permission_granted",
@@ -142,8 +160,8 @@ class SecurityManager:
 
     def revoke_permission(self, agent_name: str, permission: Permission):
         """Revoke a custom permission from a specific agent."""
-        if agent_name in self._custom_permissions:
-            self._custom_permissions[agent_name].discard(permission)
+        if agent_name in self._custom_masks:
+            self._custom_masks[agent_name] &= ~PERMISSION_BITS[permission]
 
         self._audit(AuditEntry(
             action="permission_revoked",
@@ -158,8 +176,12 @@ class SecurityManager:
     def _audit(self, entry: AuditEntry):
         """Record an audit entry."""
         self._audit_log.append(entry)
-        if len(self._audit_log) > self._max_audit_size:
-            self._audit_log = self._audit_log[-self._max_audit_size:]
+        if not entry.allowed:
+            self._denied.append(entry)
+            agent_denied = self._denied_by_agent.get(entry.agent_name)
+            if agent_denied is None:
+                agent_denied = self._denied_by_agent[entry.agent_name] = deque(maxlen=MAX_DENIED_PER_AGENT)
+            agent_denied.append(entry)
 
     def audit_action(
         self,
@@ -195,10 +217,11 @@ class SecurityManager:
 
         return sorted(entries, key=lambda e: e.timestamp, reverse=True)[:limit]
 
-    def get_denied_actions(self, limit: int = 50) -> list[AuditEntry]:
-        """Get recently denied permission checks."""
-        denied = [e for e in self._audit_log if not e.allowed]
-        return sorted(denied, key=lambda e: e.timestamp, reverse=True)[:limit]
+    def get_denied_actions(self, limit: int = 50, agent_name: str | None = None) -> list[AuditEntry]:
+        """Get recently denied permission checks, newest first."""
+        denied = self._denied if agent_name is None else self._denied_by_agent.get(agent_name, ())
+        # Entries are appended in time order, so only the returned slice is touched
+        return list(islice(reversed(denied), limit))
 
     def get_audit_stats(self) -> dict:
         """Get audit statistics."""
@@ -17,11 +17,6 @@ logger = logging.getLogger(__name__)
 
 async def on_decay_archiving_triggered(event: Event) -> None:
     """Handle CRON_TRIGGERED for 'decay_archiving' job."""
-    payload = event.data if hasattr(event, "data") else {}
-    job_name = payload.get("job_name", "")
-    if job_name != "decay_archiving":
-        return
-
     logger.info("FASE 14: Running weekly decay archiving cron...")
     try:
         from src.core.decay_service import ARCHIVE_THRESHOLD, decay_service
@@ -33,5 +28,5 @@ async def on_decay_archiving_triggered(event: Event) -> None:
 
 def register_decay_handlers() -> None:
     """Register CRON_TRIGGERED handler for 'decay_archiving' job."""
-    event_bus.on(EventType.CRON_TRIGGERED.value, on_decay_archiving_triggered)
+    event_bus.on_keyed(EventType.CRON_TRIGGERED.value, "decay_archiving", on_decay_archiving_triggered)
     logger.info("FASE 14: Decay archiving handler registered")
@@ -24,12 +24,6 @@ logger = logging.getLogger(__name__)
 
 async def on_pattern_learning_triggered(event: Event) -> None:
     """Learn behavioral patterns when the pattern_learning cron job fires."""
-    data = event.data
-    job_name = data.get("job_name", "")
-
-    if job_name != "pattern_learning":
-        return  # Not our job — ignore
-
     logger.info("FASE 0 #4: Pattern learning cron triggered — analyzing last 30 days")
 
     from src.engine.intent_predictor import intent_predictor
@@ -70,5 +64,5 @@ def register_intent_handlers() -> None:
     Register pattern learning cron handler on EventBus.
     Called from main.py lifespan startup (FASE 0 #4).
     """
-    event_bus.on(EventType.CRON_TRIGGERED.value, on_pattern_learning_triggered)
+    event_bus.on_keyed(EventType.CRON_TRIGGERED.value, "pattern_learning", on_pattern_learning_triggered)
     logger.info("FASE 0 #4: Pattern learning handler registered on EventBus")
@@ -4,6 +4,7 @@ Detects behavioral patterns from daily notes to predict user needs.
 Suggests proactive actions based on time-of-day and day-of-week patterns.
 """
 
+import asyncio
 import json
 import logging
 from collections import Counter
@@ -241,7 +242,9 @@ class IntentPredictor:
         """Save learned patterns to disk."""
         path = PATTERNS_DIR / f"{agent_name}.json"
         data = [p.to_dict() for p in patterns]
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        # Serialize on the loop; only the file write goes to a worker thread
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        await asyncio.to_thread(path.write_bytes, payload)
         logger.info(f"Patterns saved for {agent_name}: {len(patterns)} patterns")
         return path
 
@@ -6,6 +6,7 @@ for topics of interest and generates briefings. Rate-limited by source.
 Phase 11 completion: real fetchers for RSS, GitHub API, and URL scraping.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -405,11 +406,11 @@ class ProactiveResearcher:
 
         return "\n".join(lines)
 
-    async def save_briefing(self, briefing: str, agent_name: str = "optimus") -> Path:
-        """Save a briefing to the findings directory."""
-        date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    async def save_briefing(self, briefing: str, agent_name: str = "optimus", date: str | None = None) -> Path:
+        """Save a briefing to the findings directory (date: YYYY-MM-DD, defaults to today UTC)."""
+        date = date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
         path = FINDINGS_DIR / f"{agent_name}-{date}.md"
-        path.write_text(briefing, encoding="utf-8")
+        await asyncio.to_thread(path.write_text, briefing, encoding="utf-8")
         logger.info(f"Research: briefing saved to {path}")
         return path
 
@@ -4,6 +4,7 @@ Periodic analysis of recent interactions to identify knowledge gaps,
 frequent topics, and improvement suggestions. Zero LLM tokens.
 """
 
+import asyncio
 import logging
 import re
 from collections import Counter
@@ -223,7 +224,7 @@ class ReflectionEngine:
         # Use ISO week number for filename
         week = report.generated_at.strftime("%Y-W%W")
         path = agent_dir / f"{week}.md"
-        path.write_text(report.to_markdown(), encoding="utf-8")
+        await asyncio.to_thread(path.write_text, report.to_markdown(), encoding="utf-8")
 
         logger.info(f"Reflection report saved: {path}")
         return path
@@ -25,12 +25,6 @@ logger = logging.getLogger(__name__)
 
 async def on_reflection_cron_triggered(event: Event) -> None:
     """Generate weekly reflection report when the weekly_reflection cron job fires."""
-    data = event.data
-    job_name = data.get("job_name", "")
-
-    if job_name != "weekly_reflection":
-        return  # Not our job — ignore
-
     logger.info("FASE 0 #7: Weekly reflection cron triggered — analyzing last 7 days")
 
     from src.engine.reflection_engine import reflection_engine
@@ -62,5 +56,5 @@ def register_reflection_handlers() -> None:
     Register weekly reflection cron handler on EventBus.
     Called from main.py lifespan startup (FASE 0 #7).
     """
-    event_bus.on(EventType.CRON_TRIGGERED.value, on_reflection_cron_triggered)
+    event_bus.on_keyed(EventType.CRON_TRIGGERED.value, "weekly_reflection", on_reflection_cron_triggered)
     logger.info("FASE 0 #7: Weekly reflection handler registered on EventBus")
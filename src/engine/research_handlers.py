@@ -24,12 +24,6 @@ FINDINGS_DIR = Path(__file__).parent.parent.parent / "workspace" / "research" /
 
 async def on_research_cron_triggered(event: Event) -> None:
     """Run proactive research when the proactive_research cron job fires."""
-    data = event.data
-    job_name = data.get("job_name", "")
-
-    if job_name != "proactive_research":
-        return  # Not our job — ignore
-
     logger.info("FASE 0 #6: Proactive research cron triggered — checking sources")
 
     from src.engine.proactive_researcher import proactive_researcher
@@ -45,7 +39,9 @@ async def on_research_cron_triggered(event: Event) -> None:
 
         # Save briefing to workspace/research/findings/
         FINDINGS_DIR.mkdir(parents=True, exist_ok=True)
-        briefing_path = await proactive_researcher.save_briefing(briefing, agent_name="optimus")
+        briefing_path = await proactive_researcher.save_briefing(
+            briefing, agent_name="optimus", date=event.timestamp.strftime("%Y-%m-%d"),
+        )
 
         logger.info(f"FASE 0 #6: Research briefing saved to {briefing_path}")
 
@@ -78,5 +74,5 @@ def register_research_handlers() -> None:
     Register proactive research cron handler on EventBus.
     Called from main.py lifespan startup (FASE 0 #6).
     """
-    event_bus.on(EventType.CRON_TRIGGERED.value, on_research_cron_triggered)
+    event_bus.on_keyed(EventType.CRON_TRIGGERED.value, "proactive_research", on_research_cron_triggered)
     logger.info("FASE 0 #6: Proactive research handler registered on EventBus")
@@ -4,6 +4,7 @@ Selects persona style based on user intent for more contextual responses.
 """
 
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -62,11 +63,20 @@ class PersonaSelector:
         "debug": ["debug", "traceback", "error", "exception", "stack", "log", "investigate"],
     }
 
+    # Longer messages are classified directly instead of being kept in the cache
+    CACHE_MAX_CHARS = 512
+
     @classmethod
     def classify_intent(cls, message: str) -> str:
-        """Classify message intent using keyword matching (v1)."""
-        message_lower = message.lower()
+        """Classify message intent using keyword matching (v1), cached on normalized text."""
+        normalized = " ".join(message.lower().split())
+        if len(normalized) > cls.CACHE_MAX_CHARS:
+            return cls._score_intent(normalized)
+        return _classify_cached(normalized)
 
+    @classmethod
+    def _score_intent(cls, message_lower: str) -> str:
+        """Pick the intent whose keywords appear most often in the lowercased message."""
         best_intent = "default"
         best_score = 0
 
@@ -97,3 +107,9 @@ class PersonaSelector:
         """Get a persona instruction to prepend to the system prompt."""
         persona = cls.get_persona_for_message(message)
         return f"\n## Modo Atual: {persona['name']}\n{persona['style']}\n"
+
+
+@lru_cache(maxsize=4096)
+def _classify_cached(normalized: str) -> str:
+    """Memoized intent lookup — chat traffic repeats the same short prompts and commands."""
+    return PersonaSelector._score_intent(normalized)
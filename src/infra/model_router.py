@@ -4,6 +4,9 @@ Async routing via LiteLLM with native Google Generative AI fallback.
 Dynamic configuration via .env (MODEL_MAPPINGS and MODEL_FALLBACKS).
 """
 
+import asyncio
+import importlib
+import importlib.util
 import json
 import logging
 import os
@@ -19,25 +22,45 @@ class DummyModule:
     async def generate_content_async(self, *args, **kwargs):
         raise ImportError("Google Generative AI not installed")
 
-litellm = DummyModule()
-genai = DummyModule()
 
-LITELLM_AVAILABLE = False
-GOOGLE_GENAI_AVAILABLE = False
+class _LazyModule:
+    """
+    Stand-in for an optional SDK that imports it on first attribute access.
+    litellm alone takes seconds to import; deferring it keeps app boot and
+    test collection from paying for it until the first LLM call.
+    """
 
-try:
-    import litellm as _litellm
-    litellm = _litellm
-    LITELLM_AVAILABLE = True
-except (ImportError, ModuleNotFoundError):
-    pass
+    def __init__(self, name: str, on_load=None):
+        self._name = name
+        self._on_load = on_load
+        self._module = None
 
-try:
-    from google import genai as _genai
-    genai = _genai
-    GOOGLE_GENAI_AVAILABLE = True
-except (ImportError, ModuleNotFoundError):
-    pass
+    def _load(self):
+        if self._module is None:
+            try:
+                module = importlib.import_module(self._name)
+            except (ImportError, ModuleNotFoundError):
+                module = DummyModule()
+            else:
+                if self._on_load:
+                    self._on_load(module)
+            self._module = module
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+
+def _has_module(name: str) -> bool:
+    """Check that a module is installed without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+LITELLM_AVAILABLE = _has_module("litellm")
+GOOGLE_GENAI_AVAILABLE = _has_module("google.genai")
 
 _GENAI_CLIENT = None  # initialized in _configure_api_keys
 
@@ -45,13 +68,30 @@ from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Suppress litellm's verbose logging unless DEBUG
-if LITELLM_AVAILABLE:
-    litellm.suppress_debug_info = not settings.DEBUG
-    if not settings.DEBUG:
-        import logging as _logging
-        _logging.getLogger("LiteLLM").setLevel(_logging.ERROR)
-        _logging.getLogger("litellm").setLevel(_logging.ERROR)
+
+def _configure_litellm(module) -> None:
+    # Suppress litellm's verbose logging unless DEBUG
+    module.suppress_debug_info = not settings.DEBUG
+
+
+litellm = _LazyModule("litellm", on_load=_configure_litellm) if LITELLM_AVAILABLE else DummyModule()
+genai = _LazyModule("google.genai") if GOOGLE_GENAI_AVAILABLE else DummyModule()
+
+if LITELLM_AVAILABLE and not settings.DEBUG:
+    logging.getLogger("LiteLLM").setLevel(logging.ERROR)
+    logging.getLogger("litellm").setLevel(logging.ERROR)
+
+
+async def preload_sdks() -> None:
+    """
+    Import the lazily-loaded SDKs on a worker thread. Called from app startup so
+    the multi-second litellm import never runs on the event loop inside the
+    first LLM call; tests and CLI imports stay lazy.
+    """
+    for module in (litellm, genai):
+        if isinstance(module, _LazyModule):
+            await asyncio.to_thread(module._load)
+
 
 # ============================================
 # Default Model Configuration (Fallbacks)
@@ -161,6 +161,10 @@ async def lifespan(app: FastAPI):
 
     init_tracing()
 
+    # Import litellm/google-genai off the event loop before serving requests
+    from src.infra.model_router import preload_sdks
+    await preload_sdks()
+
     # Run DB migrations
     try:
         await run_migrations()
@@ -344,6 +348,16 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Channel stop error: {e}")
 
+    # Let fire-and-forget event dispatches finish before the loop closes
+    from src.core.events import event_bus
+    await event_bus.flush()
+
+    from src.skills.mcp_tools import mcp_tools
+    await mcp_tools.close()
+
+    from src.core.pdf_worker import shutdown_pdf_pool
+    await shutdown_pdf_pool()
+
 
 app = FastAPI(
     title="Agent Optimus",
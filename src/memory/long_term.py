@@ -18,6 +18,13 @@ logger = logging.getLogger(__name__)
 LONG_TERM_DIR = Path(__file__).parent.parent.parent / "workspace" / "memory" / "long_term"
 
 
+def _invalidate_bootstrap(agent_name: str) -> None:
+    """Drop the agent's cached bootstrap so the next turn sees this process's MEMORY.md write."""
+    # Local import: session_bootstrap imports this module
+    from src.memory.session_bootstrap import session_bootstrap
+    session_bootstrap.invalidate(agent_name)
+
+
 class LongTermMemory:
     """
     Manages MEMORY.md — curated long-term knowledge per agent.
@@ -48,6 +55,7 @@ class LongTermMemory:
             header = f"# MEMORY.md — {agent_name}\n_Memória de longo prazo curada._\n\n"
             full_content = header + db_content
             path.write_text(full_content, encoding="utf-8")
+            _invalidate_bootstrap(agent_name)
             logger.info(f"✅ [LongTermMemory] Rebuilt {agent_name} from DB")
             return full_content
 
@@ -80,6 +88,7 @@ class LongTermMemory:
 
         with open(path, "a", encoding="utf-8") as f:
             f.write(entry)
+        _invalidate_bootstrap(agent_name)
 
         logger.info(f"Learning added for {agent_name}: {category}")
 
@@ -6,6 +6,7 @@ Injects accumulated context into the system prompt before any response.
 
 import hashlib
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -20,6 +21,9 @@ WORKSPACE_DIR = Path(__file__).parent.parent.parent / "workspace"
 SOULS_DIR = WORKSPACE_DIR / "souls"
 USER_FILE = WORKSPACE_DIR / "USER.md"
 
+# A cached context younger than this is served without re-hashing its files
+STALE_CHECK_TTL_SECONDS = 60.0
+
 
 @dataclass
 class BootstrapContext:
@@ -82,11 +86,13 @@ class SessionBootstrap:
 
     On init: reads SOUL.md + MEMORY.md + daily notes (today + yesterday).
     Caches results with hash-based invalidation — only re-reads if file changed.
+    The hash check itself runs at most once per STALE_CHECK_TTL_SECONDS per agent.
     """
 
     def __init__(self):
         self._cache: dict[str, BootstrapContext] = {}
         self._file_hashes: dict[str, str] = {}
+        self._checked_at: dict[str, float] = {}  # agent → monotonic time of last load/check
 
     def _hash_file(self, path: Path) -> str:
         """Compute quick hash to detect file changes."""
@@ -122,9 +128,15 @@ class SessionBootstrap:
         Returns:
             BootstrapContext with all loaded sections
         """
-        if not force and not self._is_stale(agent_name):
-            logger.debug(f"Bootstrap cache hit for {agent_name}")
-            return self._cache[agent_name]
+        if not force and agent_name in self._cache:
+            now = time.monotonic()
+            if now - self._checked_at.get(agent_name, float("-inf")) < STALE_CHECK_TTL_SECONDS:
+                logger.debug(f"Bootstrap cache hit for {agent_name} (within TTL)")
+                return self._cache[agent_name]
+            if not self._is_stale(agent_name):
+                self._checked_at[agent_name] = now
+                logger.debug(f"Bootstrap cache hit for {agent_name}")
+                return self._cache[agent_name]
 
         logger.info(f"Loading bootstrap context for {agent_name}")
 
@@ -167,6 +179,7 @@ class SessionBootstrap:
 
         # Cache the result
         self._cache[agent_name] = ctx
+        self._checked_at[agent_name] = time.monotonic()
 
         logger.info(
             f"Bootstrap loaded for {agent_name}: "
@@ -180,12 +193,14 @@ class SessionBootstrap:
     def invalidate(self, agent_name: str) -> None:
         """Invalidate cached context for an agent."""
         self._cache.pop(agent_name, None)
+        self._checked_at.pop(agent_name, None)
         logger.debug(f"Bootstrap cache invalidated for {agent_name}")
 
     def invalidate_all(self) -> None:
         """Invalidate all cached contexts."""
         self._cache.clear()
         self._file_hashes.clear()
+        self._checked_at.clear()
         logger.info("Bootstrap cache fully cleared")
 
 
@@ -6,9 +6,10 @@ Native MCP tool definitions for agent capabilities.
 import importlib.util
 import logging
 import sys
+from collections.abc import Callable, Coroutine, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Coroutine
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +54,28 @@ class MCPToolRegistry:
         self._tools: dict[str, MCPTool] = {}
         self._before_hooks: list = []  # Callable(tool_name, params, user_id) → dict|None
         self._after_hooks: list = []   # Callable(tool_name, result, user_id) → None
+        self._http = None  # Shared httpx.AsyncClient, created lazily by _get_http()
         self._register_native_tools()
         self.load_plugins()
 
+    async def _get_http(self):
+        """Return the shared pooled HTTP client, creating it on first use."""
+        import httpx
+
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=15,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+        return self._http
+
+    async def close(self) -> None:
+        """Close the shared HTTP client (called on app shutdown)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     def add_before_hook(self, fn) -> None:
         """Register a before_tool_call hook."""
         self._before_hooks.append(fn)
@@ -159,22 +179,24 @@ class MCPToolRegistry:
 
         return result
 
-    def generate_manifest(self) -> str:
-        """Generate TOOLS.md manifest with all registered tools."""
-        lines = ["# 🔧 MCP Tools Manifest\n", "_Auto-generated_\n"]
+    def iter_manifest(self) -> Iterator[str]:
+        """Yield the TOOLS.md manifest one section (header, category, tool) at a time."""
+        yield "# 🔧 MCP Tools Manifest\n\n_Auto-generated_\n"
 
         categories = sorted(set(t.category for t in self._tools.values()))
 
         for category in categories:
-            lines.append(f"\n## {category.upper()}\n")
+            yield f"\n\n## {category.upper()}\n"
             tools = [t for t in self._tools.values() if t.category == category]
 
             for tool in sorted(tools, key=lambda t: t.name):
                 approval = " ⚠️ **requires approval**" if tool.requires_approval else ""
                 levels = ", ".join(tool.agent_levels)
-                lines.append(f"### `{tool.name}`{approval}")
-                lines.append(f"{tool.description}")
-                lines.append(f"_Levels: {levels}_\n")
+                lines = [
+                    f"### `{tool.name}`{approval}",
+                    f"{tool.description}",
+                    f"_Levels: {levels}_\n",
+                ]
 
                 if tool.parameters:
                     lines.append("**Parameters:**")
@@ -185,7 +207,11 @@ class MCPToolRegistry:
                         lines.append(f"- `{param_name}` ({param_type}){required}: {desc}")
                     lines.append("")
 
-        return "\n".join(lines)
+                yield "\n" + "\n".join(lines)
+
+    def generate_manifest(self) -> str:
+        """Generate TOOLS.md manifest with all registered tools."""
+        return "".join(self.iter_manifest())
 
     # ============================================
     # Native Tools Registration
@@ -1090,7 +1116,9 @@ class MCPToolRegistry:
             p = Path(path)
             if not p.exists():
                 return f"File not found: {path}"
-            return p.read_text(encoding="utf-8")[:10_000]
+            # Bounded read: never load more than we return, whatever the file size
+            with p.open("r", encoding="utf-8", errors="replace") as f:
+                return f.read(10_000)
 
         return await asyncio.to_thread(_read)
 
@@ -1245,34 +1273,37 @@ class MCPToolRegistry:
         Uses Jina Reader (r.jina.ai) — free, no API key, handles JS pages.
         Falls back to raw httpx if Jina fails.
         """
-        import httpx
+        client = await self._get_http()
 
         # ── Jina Reader (free, converts any URL to clean markdown) ─────
         jina_url = f"https://r.jina.ai/{url}"
         try:
-            async with httpx.AsyncClient(timeout=20, follow_redirects=True) as client:
-                resp = await client.get(
-                    jina_url,
-                    headers={
-                        "Accept": "text/plain",
-                        "User-Agent": "AgentOptimus/1.0",
-                    },
-                )
-                if resp.status_code == 200:
-                    content = resp.text.strip()
-                    if content and len(content) > 100:
-                        return content[:12_000]
+            resp = await client.get(
+                jina_url,
+                headers={
+                    "Accept": "text/plain",
+                    "User-Agent": "AgentOptimus/1.0",
+                },
+                timeout=20,
+            )
+            if resp.status_code == 200:
+                content = resp.text.strip()
+                if content and len(content) > 100:
+                    return content[:12_000]
         except Exception as e:
             logger.warning(f"Jina Reader failed for {url}: {e} — falling back to raw fetch")
 
-        # ── Raw httpx fallback ─────────────────────────────────────────
+        # ── Raw httpx fallback (streamed, stops after 10k chars) ───────
         try:
-            async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-                resp = await client.get(
-                    url,
-                    headers={"User-Agent": "AgentOptimus/1.0"},
-                )
-                return resp.text[:10_000]
+            chunks: list[str] = []
+            size = 0
+            async with client.stream("GET", url, headers={"User-Agent": "AgentOptimus/1.0"}) as resp:
+                async for chunk in resp.aiter_text():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= 10_000:
+                        break
+            return "".join(chunks)[:10_000]
         except Exception as e:
             return f"❌ Não foi possível acessar {url}: {e}"
 
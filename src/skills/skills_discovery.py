@@ -7,7 +7,6 @@ graceful fallback to TF-IDF keyword search.
 """
 
 import logging
-from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -45,7 +44,8 @@ class SkillsDiscovery:
     })
 
     def __init__(self):
-        self._index: dict[str, Counter] = {}
+        self._index: dict[str, dict[str, int]] = {}
+        self._fingerprint: int = 0
 
     def _tokenize(self, text: str) -> list[str]:
         """Split text into lowercase tokens, removing stopwords."""
@@ -56,10 +56,21 @@ class SkillsDiscovery:
         """Rebuild the search index from current registry."""
         from src.skills.skills_registry import skills_registry
 
+        skills = skills_registry.list_skills(enabled_only=False)
+
+        # Skip re-tokenizing when no skill content changed since the last build
+        fingerprint = hash(tuple(sorted((s.name, s.description, s.category) for s in skills)))
+        if self._index and fingerprint == self._fingerprint:
+            return
+
         self._index.clear()
-        for skill in skills_registry.list_skills(enabled_only=False):
+        self._fingerprint = fingerprint
+        for skill in skills:
             tokens = self._tokenize(f"{skill.name} {skill.description} {skill.category}")
-            self._index[skill.name] = Counter(tokens)
+            term_freq: dict[str, int] = {}
+            for token in tokens:
+                term_freq[token] = term_freq.get(token, 0) + 1
+            self._index[skill.name] = term_freq
         logger.debug(f"Skills index rebuilt: {len(self._index)} skills indexed")
 
     def search(self, query: str, top_k: int = 5) -> list[SkillMatch]:
@@ -3,27 +3,145 @@ Agent Optimus — Skills Registry.
 Catalogue, install/uninstall, and manage agent skills dynamically.
 """
 
+import asyncio
+import bisect
+import io
 import logging
-from dataclasses import dataclass, field
+import os
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on SKILL.md files open at once during load_from_directory. Reads run
+# through asyncio.to_thread, so this matches the default executor's worker count
+# (ThreadPoolExecutor's min(32, cpu + 4)); a higher bound would only queue there.
+MAX_CONCURRENT_READS = min(32, (os.cpu_count() or 1) + 4)
 
-@dataclass
+# SKILL.md parsing: optional YAML-style front matter, then one line-oriented scan
+_FRONTMATTER_RE = re.compile(r"\A---[ \t]*\n(.*?)\n---[ \t]*(?:\n|\Z)", re.DOTALL)
+_SKILL_LINE_RE = re.compile(
+    r"^[ \t]*(?:Description:[ \t]*(?P<desc>.*?)|Category:[ \t]*(?P<cat>.*?)|(?P<text>[^#\s].*?))[ \t]*$",
+    re.MULTILINE,
+)
+
+
+@dataclass(slots=True)
 class Skill:
     """A registered skill definition."""
     name: str
     description: str
     version: str = "1.0.0"
     category: str = "general"  # general, code, research, analysis, creative, security
-    agent_compatibility: list[str] = field(default_factory=lambda: ["all"])
-    tools: list[str] = field(default_factory=list)
+    agent_compatibility: tuple[str, ...] = ("all",)
+    tools: tuple[str, ...] = ()
     mcp_server: str | None = None  # Associated MCP server module
     enabled: bool = True
     installed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     skill_md_path: str | None = None  # Path to SKILL.md
+    _rendered: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def render_markdown(self) -> str:
+        """Render this skill's catalogue entry (memoized until invalidated)."""
+        if self._rendered is None:
+            status = "✅" if self.enabled else "⏸️"
+            agents = ", ".join(self.agent_compatibility)
+            rendered = f"\n### {status} {self.name} (v{self.version})\n{self.description}\n_Agents: {agents}_\n"
+            if self.tools:
+                rendered += f"\n**Tools:** {', '.join(self.tools)}\n"
+            self._rendered = rendered
+        return self._rendered
+
+
+def _iter_skill_files(root: str) -> Iterator[str]:
+    """Yield paths of SKILL.md files under root (scandir walk, symlinks not followed)."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "SKILL.md":
+                        yield entry.path
+        except OSError as e:
+            logger.warning(f"Skipping unreadable skills directory {directory}: {e}")
+
+
+# Built-in skill definitions, constructed once at import. Registries install
+# shallow copies, so the immutable tuple fields are shared, never re-allocated.
+_BUILTIN_INSTALLED_AT = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_BUILTIN_SKILLS: tuple[Skill, ...] = (
+    Skill(
+        name="code_generation",
+        description="Geração de código em múltiplas linguagens",
+        category="code",
+        agent_compatibility=("friday", "all"),
+        tools=("fs_read", "fs_write", "db_query"),
+        installed_at=_BUILTIN_INSTALLED_AT,
+    ),
+    Skill(
+        name="code_review",
+        description="Análise e review de código com sugestões",
+        category="code",
+        agent_compatibility=("friday", "guardian", "all"),
+        tools=("fs_read",),
+        installed_at=_BUILTIN_INSTALLED_AT,
+    ),
+    Skill(
+        name="web_research",
+        description="Pesquisa web e síntese de informações",
+        category="research",
+        agent_compatibility=("fury", "all"),
+        tools=("research_search", "research_fetch_url"),
+        installed_at=_BUILTIN_INSTALLED_AT,
+    ),
+    Skill(
+        name="data_analysis",
+        description="Análise de dados e geração de insights",
+        category="analysis",
+        agent_compatibility=("analyst", "all"),
+        tools=("db_query", "memory_search"),
+        installed_at=_BUILTIN_INSTALLED_AT,
+    ),
+    Skill(
+        name="content_writing",
+        description="Redação de conteúdo, copy e documentação",
+        category="creative",
+        agent_compatibility=("writer", "all"),
+        tools=("fs_write",),
+        installed_at=_BUILTIN_INSTALLED_AT,
+    ),
+    Skill(
+        name="security_audit",
+        description="Auditoria de segurança e compliance",
+        category="security",
+        agent_compatibility=("guardian", "all"),
+        tools=("fs_read", "db_query"),
+        installed_at=_BUILTIN_INSTALLED_AT,
+    ),
+    Skill(
+        name="task_management",
+        description="Criação e gerenciamento de tasks",
+        category="general",
+        agent_compatibility=("all",),
+        tools=("memory_search", "memory_learn"),
+        installed_at=_BUILTIN_INSTALLED_AT,
+    ),
+    Skill(
+        name="deep_thinking",
+        description="Análise profunda com Tree-of-Thought",
+        category="analysis",
+        agent_compatibility=("optimus", "all"),
+        tools=("memory_search",),
+        installed_at=_BUILTIN_INSTALLED_AT,
+    ),
+)
 
 
 class SkillsRegistry:
@@ -32,27 +150,92 @@ class SkillsRegistry:
     Supports dynamic install/uninstall and SKILL.md documentation.
     """
 
-    def __init__(self):
+    __slots__ = (
+        "_skills",
+        "_by_category",
+        "_category_order",
+        "_agent_ids",
+        "_agent_masks",
+        "_enabled",
+        "_sorted_names",
+        "_catalogue_cache",
+        "_cache_version",
+    )
+
+    def __init__(self, install_builtins: bool = True):
         self._skills: dict[str, Skill] = {}
-        self._register_builtin_skills()
+        # Secondary indexes kept in sync by install/uninstall/enable/disable
+        self._by_category: dict[str, set[str]] = {}
+        self._category_order: list[str] = []  # sorted keys of _by_category
+        # Agent names interned to bit positions; bit 0 is "all"
+        self._agent_ids: dict[str, int] = {"all": 0}
+        # Skill name -> compatibility bitmask over _agent_ids. Kept here, not on the
+        # Skill, so one Skill object installed in two registries can't mix bit layouts
+        self._agent_masks: dict[str, int] = {}
+        self._enabled: set[str] = set()
+        self._sorted_names: list[str] = []
+        # Rendered SKILLS.md, dropped on every mutation
+        self._catalogue_cache: str | None = None
+        self._cache_version: int = 0
+        if install_builtins:
+            self._register_builtin_skills()
 
     def install(self, skill: Skill) -> bool:
         """Install a new skill."""
         if skill.name in self._skills:
-            logger.warning(f"Skill '{skill.name}' already installed, updating")
+            logger.warning("Skill '%s' already installed, updating", skill.name)
+            self._unindex(self._skills[skill.name])
 
+        skill._rendered = None
         self._skills[skill.name] = skill
-        logger.info(f"Skill installed: {skill.name} v{skill.version}")
+        self._index(skill)
+        self._invalidate()
+        logger.info("Skill installed: %s v%s", skill.name, skill.version)
         return True
 
     def uninstall(self, name: str) -> bool:
         """Uninstall a skill."""
         if name in self._skills:
-            del self._skills[name]
-            logger.info(f"Skill uninstalled: {name}")
+            self._unindex(self._skills.pop(name))
+            self._invalidate()
+            logger.info("Skill uninstalled: %s", name)
             return True
         return False
 
+    def _invalidate(self) -> None:
+        """Drop cached renderings after a mutation."""
+        self._cache_version += 1
+        self._catalogue_cache = None
+
+    def _index(self, skill: Skill) -> None:
+        """Add a skill to the secondary indexes."""
+        bisect.insort(self._sorted_names, skill.name)
+        if skill.category not in self._by_category:
+            bisect.insort(self._category_order, skill.category)
+        self._by_category.setdefault(skill.category, set()).add(skill.name)
+        mask = 0
+        for agent in skill.agent_compatibility:
+            mask |= 1 << self._agent_ids.setdefault(agent, len(self._agent_ids))
+        self._agent_masks[skill.name] = mask
+        if skill.enabled:
+            self._enabled.add(skill.name)
+
+    def _unindex(self, skill: Skill) -> None:
+        """Remove a skill from the secondary indexes."""
+        i = bisect.bisect_left(self._sorted_names, skill.name)
+        if i < len(self._sorted_names) and self._sorted_names[i] == skill.name:
+            del self._sorted_names[i]
+        names = self._by_category.get(skill.category)
+        if names is not None:
+            names.discard(skill.name)
+            if not names:
+                del self._by_category[skill.category]
+                i = bisect.bisect_left(self._category_order, skill.category)
+                if i < len(self._category_order) and self._category_order[i] == skill.category:
+                    del self._category_order[i]
+        self._enabled.discard(skill.name)
+        self._agent_masks.pop(skill.name, None)
+
     def get(self, name: str) -> Skill | None:
         return self._skills.get(name)
 
@@ -62,22 +245,32 @@ class SkillsRegistry:
         agent: str | None = None,
         enabled_only: bool = True,
     ) -> list[Skill]:
-        """List skills with optional filters."""
-        skills = list(self._skills.values())
+        """List skills with optional filters, sorted by name."""
+        skills = self._skills
+        if not (enabled_only or category or agent):
+            return [skills[n] for n in self._sorted_names]
 
-        if enabled_only:
-            skills = [s for s in skills if s.enabled]
+        names = self._enabled if enabled_only else skills.keys()
         if category:
-            skills = [s for s in skills if s.category == category]
+            names = names & self._by_category.get(category, set())
         if agent:
-            skills = [s for s in skills if "all" in s.agent_compatibility or agent in s.agent_compatibility]
+            agent_id = self._agent_ids.get(agent)
+            query = 1 if agent_id is None else 1 | (1 << agent_id)
+            masks = self._agent_masks
+            names = {n for n in names if masks[n] & query}
 
-        return sorted(skills, key=lambda s: s.name)
+        # Few matches: sorting them beats a membership scan over every installed name
+        if len(names) * 8 < len(self._sorted_names):
+            return [skills[n] for n in sorted(names)]
+        return [skills[n] for n in self._sorted_names if n in names]
 
     def enable(self, name: str) -> bool:
         """Enable a disabled skill."""
         if name in self._skills:
             self._skills[name].enabled = True
+            self._skills[name]._rendered = None
+            self._enabled.add(name)
+            self._invalidate()
             return True
         return False
 
@@ -85,34 +278,31 @@ class SkillsRegistry:
         """Disable a skill without uninstalling."""
         if name in self._skills:
             self._skills[name].enabled = False
+            self._skills[name]._rendered = None
+            self._enabled.discard(name)
+            self._invalidate()
             return True
         return False
 
     def get_categories(self) -> list[str]:
         """Get all skill categories."""
-        return sorted(set(s.category for s in self._skills.values()))
+        return list(self._category_order)
 
     def generate_catalogue(self) -> str:
-        """Generate SKILLS.md catalogue."""
-        lines = ["# 🎯 Skills Catalogue\n", "_Agent Optimus — Available Skills_\n"]
-
-        categories = self.get_categories()
-        for category in categories:
-            skills = self.list_skills(category=category, enabled_only=False)
-            lines.append(f"\n## {category.upper()}\n")
+        """Generate SKILLS.md catalogue (cached until the registry changes)."""
+        if self._catalogue_cache is not None:
+            return self._catalogue_cache
 
-            for skill in skills:
-                status = "✅" if skill.enabled else "⏸️"
-                agents = ", ".join(skill.agent_compatibility)
-                lines.append(f"### {status} {skill.name} (v{skill.version})")
-                lines.append(f"{skill.description}")
-                lines.append(f"_Agents: {agents}_\n")
+        buf = io.StringIO()
+        buf.write("# 🎯 Skills Catalogue\n\n_Agent Optimus — Available Skills_\n")
 
-                if skill.tools:
-                    lines.append(f"**Tools:** {', '.join(skill.tools)}")
-                    lines.append("")
+        for category in self.get_categories():
+            buf.write(f"\n\n## {category.upper()}\n")
+            for skill in self.list_skills(category=category, enabled_only=False):
+                buf.write(skill.render_markdown())
 
-        return "\n".join(lines)
+        self._catalogue_cache = buf.getvalue()
+        return self._catalogue_cache
 
     async def load_from_directory(self, skills_dir: str) -> int:
         """Auto-discover and install skills from SKILL.md files."""
@@ -120,42 +310,70 @@ class SkillsRegistry:
         if not path.exists():
             return 0
 
+        # Walk the tree off the event loop, then read/parse all files concurrently
+        paths = await asyncio.to_thread(self._discover_paths, path)
+        sem = asyncio.Semaphore(MAX_CONCURRENT_READS)
+        results = await asyncio.gather(
+            *(self._read_and_parse(p, sem) for p in paths),
+            return_exceptions=True,
+        )
+
+        # Install on the calling task, in discovery order
         loaded = 0
-        for skill_md in path.rglob("SKILL.md"):
-            try:
-                content = skill_md.read_text(encoding="utf-8")
-                skill = self._parse_skill_md(content, str(skill_md))
-                if skill:
-                    self.install(skill)
-                    loaded += 1
-            except Exception as e:
-                logger.error(f"Failed to load skill from {skill_md}: {e}")
+        for skill_md, result in zip(paths, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("Failed to load skill from %s: %r", skill_md, result)
+            elif result:
+                self.install(result)
+                loaded += 1
 
         return loaded
 
+    @staticmethod
+    def _discover_paths(path: Path) -> list[str]:
+        """Find every SKILL.md under path (blocking — run in a thread)."""
+        return sorted(_iter_skill_files(str(path)))
+
+    async def _read_and_parse(self, skill_md: str, sem: asyncio.Semaphore) -> Skill | None:
+        """Read a SKILL.md off the event loop (at most sem-many at once) and parse it."""
+        async with sem:
+            content = await asyncio.to_thread(Path(skill_md).read_text, encoding="utf-8")
+        return self._parse_skill_md(content, skill_md)
+
     def _parse_skill_md(self, content: str, path: str) -> Skill | None:
-        """Parse a SKILL.md file into a Skill object."""
-        lines = content.strip().split("\n")
-        if not lines:
+        """Parse a SKILL.md file (optionally with front matter) into a Skill object."""
+        # The line regexes only know "\n"; normalize CRLF/CR so values carry no stray "\r"
+        content = content.replace("\r\n", "\n").replace("\r", "\n").strip()
+        meta: dict[str, str] = {}
+
+        frontmatter = _FRONTMATTER_RE.match(content)
+        if frontmatter:
+            for line in frontmatter.group(1).splitlines():
+                key, sep, value = line.partition(":")
+                if sep:
+                    meta[key.strip().lower()] = value.strip().strip("\"'")
+            content = content[frontmatter.end():].lstrip()
+
+        title, _, body = content.partition("\n")
+        name = meta.get("name") or title.lstrip("# ").strip()
+        if not name:
             return None
 
-        name = lines[0].lstrip("# ").strip()
-        description = ""
-        category = "general"
+        description = meta.get("description", "")
+        category = meta.get("category", "")
 
-        for line in lines[1:]:
-            line = line.strip()
-            if line.startswith("Description:"):
-                description = line.split(":", 1)[1].strip()
-            elif line.startswith("Category:"):
-                category = line.split(":", 1)[1].strip()
-            elif not description and line and not line.startswith("#"):
-                description = line
+        for m in _SKILL_LINE_RE.finditer(body):
+            if m.group("desc") is not None:
+                description = m.group("desc")
+            elif m.group("cat") is not None:
+                category = m.group("cat")
+            elif not description:
+                description = m.group("text")
 
         return Skill(
             name=name,
             description=description or name,
-            category=category,
+            category=category or "general",
             skill_md_path=path,
         )
 
@@ -164,68 +382,10 @@ class SkillsRegistry:
     # ============================================
 
     def _register_builtin_skills(self):
-        """Register built-in skills."""
-        builtins = [
-            Skill(
-                name="code_generation",
-                description="Geração de código em múltiplas linguagens",
-                category="code",
-                agent_compatibility=["friday", "all"],
-                tools=["fs_read", "fs_write", "db_query"],
-            ),
-            Skill(
-                name="code_review",
-                description="Análise e review de código com sugestões",
-                category="code",
-                agent_compatibility=["friday", "guardian", "all"],
-                tools=["fs_read"],
-            ),
-            Skill(
-                name="web_research",
-                description="Pesquisa web e síntese de informações",
-                category="research",
-                agent_compatibility=["fury", "all"],
-                tools=["research_search", "research_fetch_url"],
-            ),
-            Skill(
-                name="data_analysis",
-                description="Análise de dados e geração de insights",
-                category="analysis",
-                agent_compatibility=["analyst", "all"],
-                tools=["db_query", "memory_search"],
-            ),
-            Skill(
-                name="content_writing",
-                description="Redação de conteúdo, copy e documentação",
-                category="creative",
-                agent_compatibility=["writer", "all"],
-                tools=["fs_write"],
-            ),
-            Skill(
-                name="security_audit",
-                description="Auditoria de segurança e compliance",
-                category="security",
-                agent_compatibility=["guardian", "all"],
-                tools=["fs_read", "db_query"],
-            ),
-            Skill(
-                name="task_management",
-                description="Criação e gerenciamento de tasks",
-                category="general",
-                agent_compatibility=["all"],
-                tools=["memory_search", "memory_learn"],
-            ),
-            Skill(
-                name="deep_thinking",
-                description="Análise profunda com Tree-of-Thought",
-                category="analysis",
-                agent_compatibility=["optimus", "all"],
-                tools=["memory_search"],
-            ),
-        ]
-
-        for skill in builtins:
-            self.install(skill)
+        """Register built-in skills (fresh copies of the module-level definitions)."""
+        now = datetime.now(timezone.utc)
+        for skill in _BUILTIN_SKILLS:
+            self.install(replace(skill, installed_at=now))
 
 
 # Singleton
@@ -1,11 +1,7 @@
-import sys, os
+from tests import _bootstrap
 
-# Add local libs (priority)
-libs_path = os.path.join(os.getcwd(), "libs")
-if os.path.exists(libs_path):
-    sys.path.insert(0, libs_path)
-
-print(f"Libs path in sys.path: {libs_path in sys.path}")
+libs_path = _bootstrap.LIBS_PATH
+print(f"Libs path in sys.path: {_bootstrap.HAS_LIBS}")
 print(f"Libs path: {libs_path}")
 
 try:
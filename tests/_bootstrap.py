@@ -0,0 +1,17 @@
+"""
+One-time sys.path setup for the manual test scripts.
+Makes the project root importable and puts a local libs/ folder (if any)
+first. Safe to import repeatedly: each path is only added once.
+"""
+import os
+import sys
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBS_PATH = os.path.join(ROOT_PATH, "libs")
+HAS_LIBS = os.path.isdir(LIBS_PATH)
+
+if ROOT_PATH not in sys.path:
+    sys.path.append(ROOT_PATH)
+
+if HAS_LIBS and LIBS_PATH not in sys.path:
+    sys.path.insert(0, LIBS_PATH)
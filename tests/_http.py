@@ -0,0 +1,43 @@
+"""
+Shared HTTP client for the manual_*_test.py scripts.
+One pooled keep-alive client is reused across downloads instead of a
+fresh AsyncClient (and TLS handshake) per script.
+"""
+import asyncio
+import atexit
+import contextlib
+
+import httpx
+
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+    return _SHARED_CLIENT
+
+
+async def fetch(url: str, client: httpx.AsyncClient | None = None) -> httpx.Response:
+    """GET url with the given client, or the shared one."""
+    return await (client or _get_client()).get(url)
+
+
+async def close() -> None:
+    """Close the shared client (safe to call more than once)."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
+
+@atexit.register
+def _close_at_exit() -> None:
+    if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+        with contextlib.suppress(Exception):
+            asyncio.run(close())
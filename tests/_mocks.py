@@ -0,0 +1,26 @@
+"""
+Prebuilt mock graphs shared by tests/conftest.py fixtures and manual scripts.
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+
+def build_supabase_mock() -> MagicMock:
+    """Stand-in for src.infra.supabase_client: session.execute(...).scalar() → fake file id."""
+    mock_supabase = MagicMock()
+    mock_session = AsyncMock()
+
+    # Result object returned by `await session.execute(...)`
+    mock_result = MagicMock()
+    mock_result.scalar.return_value = "mock_file_id_123"
+
+    mock_session.execute.return_value = mock_result
+    mock_session.__aenter__.return_value = mock_session
+    mock_supabase.get_async_session.return_value = mock_session
+    return mock_supabase
+
+
+def build_router_mock() -> AsyncMock:
+    """Stand-in for model_router that returns a fake 768-d embedding without API calls."""
+    mock_router = AsyncMock()
+    mock_router.embed_text.return_value = [0.1] * 768
+    return mock_router
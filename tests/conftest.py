@@ -0,0 +1,106 @@
+"""
+Shared pytest fixtures.
+"""
+import asyncio
+import itertools
+from uuid import uuid4
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Preload the heavy import graph once per process at conftest load, so the
+# cost is not charged to whichever test imports it first.
+import src.collaboration.standup_generator  # noqa: F401
+import src.core.cron_scheduler  # noqa: F401
+import src.core.gateway  # noqa: F401
+import src.core.performance  # noqa: F401
+from src.collaboration.activity_feed import ActivityFeed
+from src.collaboration.notification_service import NotificationService
+from src.collaboration.task_manager import TaskManager
+from src.collaboration.thread_manager import ThreadManager
+from src.core.a2a_protocol import A2AProtocol
+from src.core.events import EventBus
+from src.core.security import SecurityManager
+from tests._mocks import build_router_mock, build_supabase_mock
+
+# Faster call_soon/task dispatch for the (session-scoped) test event loop
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@pytest.fixture(scope="session")
+def mock_supabase():
+    """Session-wide supabase_client mock (built once)."""
+    return build_supabase_mock()
+
+
+@pytest.fixture(scope="session")
+def mock_router():
+    """Session-wide model_router mock (built once)."""
+    return build_router_mock()
+
+
+@pytest.fixture
+def fresh_uuid():
+    """A new random UUID, stable for the duration of a test."""
+    return uuid4()
+
+
+# Process-wide counter for ids that only need to be unique, not real UUIDs
+_test_id_gen = itertools.count()
+
+
+def _tid(prefix: str) -> str:
+    return f"{prefix}-{next(_test_id_gen):08x}"
+
+
+@pytest.fixture
+def tid():
+    """Factory for unique string ids (`tid("agent")` → "agent-0000002a")."""
+    return _tid
+
+
+# ============================================
+# Fresh manager instances
+# ============================================
+
+@pytest.fixture
+def tm(tmp_path, monkeypatch):
+    """Empty TaskManager persisting under tmp_path instead of workspace/tasks."""
+    monkeypatch.setattr("src.collaboration.task_manager.TASKS_DIR", tmp_path)
+    monkeypatch.setattr("src.collaboration.task_manager.TASKS_FILE", tmp_path / "tasks.json")
+    return TaskManager()
+
+
+@pytest.fixture
+def thread():
+    return ThreadManager()
+
+
+@pytest.fixture
+def ns():
+    return NotificationService()
+
+
+@pytest.fixture
+def feed():
+    return ActivityFeed(max_size=100)
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+@pytest.fixture
+def a2a():
+    return A2AProtocol()
+
+
+@pytest.fixture
+def sec():
+    return SecurityManager()
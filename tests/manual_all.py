@@ -0,0 +1,35 @@
+"""
+Run the network-bound manual tests (audio, vision, ingestion) concurrently.
+Downloads share one pooled client from tests/_http.py.
+
+Usage: python tests/manual_all.py
+"""
+import asyncio
+from unittest.mock import patch
+
+try:
+    from tests import _bootstrap  # noqa: F401
+except ImportError:  # run as a script: tests/ itself is sys.path[0]
+    import _bootstrap  # noqa: F401
+
+from src.core import knowledge_base
+from tests import _http
+from tests._mocks import build_router_mock, build_supabase_mock
+from tests.manual_audio_test import test_audio_transcription
+from tests.manual_ingestion_test import run_pdf_ingestion
+from tests.manual_vision_test import test_vision
+
+
+async def main():
+    supabase = build_supabase_mock()
+    try:
+        # Only the ingestion path is mocked; audio and vision hit the real model_router
+        with patch.object(knowledge_base, "get_async_session", supabase.get_async_session), \
+                patch.object(knowledge_base, "model_router", build_router_mock()):
+            await asyncio.gather(test_audio_transcription(), test_vision(), run_pdf_ingestion())
+    finally:
+        await _http.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,18 +4,14 @@ Downloads a sample audio and tests transcription service.
 """
 import asyncio
 import logging
-import sys
-import os
 
-# Add project root to path
-sys.path.append(os.getcwd())
-
-# Add local libs (priority)
-libs_path = os.path.join(os.getcwd(), "libs")
-if os.path.exists(libs_path):
-    sys.path.insert(0, libs_path)
+try:
+    from tests import _bootstrap  # noqa: F401
+except ImportError:  # run as a script: tests/ itself is sys.path[0]
+    import _bootstrap  # noqa: F401
 
 from src.core.audio_service import audio_service, TranscriptionBackend
+from tests._http import fetch
 from src.core.config import settings
 
 # Configure logging
@@ -25,20 +21,17 @@ logger = logging.getLogger(__name__)
 async def test_audio_transcription():
     print("--- Starting Audio Transcription Test ---")
     
-    import httpx
-    
     # 1. Download Sample Audio (Wikipedia spoken article snippet)
     # A short clip is better.
     url = "https://upload.wikimedia.org/wikipedia/commons/d/dd/Armstrong_Small_Step.ogg" # Neil Armstrong
     print(f"Downloading Audio from {url}...")
     
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url)
-        if resp.status_code != 200:
-            print(f"❌ Failed to download Audio: {resp.status_code}")
-            return
-        audio_bytes = resp.content
-        print(f"Downloaded {len(audio_bytes)} bytes.")
+    resp = await fetch(url)
+    if resp.status_code != 200:
+        print(f"❌ Failed to download Audio: {resp.status_code}")
+        return
+    audio_bytes = resp.content
+    print(f"Downloaded {len(audio_bytes)} bytes.")
 
     # 2. Test Gemini
     print("\n--- Testing Gemini Backend ---")
@@ -2,70 +2,52 @@
 Manual test for Document Ingestion (PDF).
 Downloads a dummy PDF and ingests it into KnowledgeBase.
 """
-import asyncio
 import logging
 import sys
-import os
 
-# Add project root to path
-sys.path.append(os.getcwd())
+try:
+    from tests import _bootstrap  # noqa: F401
+except ImportError:  # run as a script: tests/ itself is sys.path[0]
+    import _bootstrap  # noqa: F401
 
-# Add local libs (priority)
-libs_path = os.path.join(os.getcwd(), "libs")
-if os.path.exists(libs_path):
-    sys.path.insert(0, libs_path)
+import pytest
 
-# Mocking modules BEFORE import
-import sys
-from unittest.mock import MagicMock, AsyncMock
-
-# Mock src.infra.supabase_client
-mock_supabase = MagicMock()
-mock_session = AsyncMock()
-
-# Configure the result object returned by await session.execute(...)
-mock_result = MagicMock()
-mock_result.scalar.return_value = "mock_file_id_123"
-
-# key point: AsyncMock return_value is what is returned after await
-mock_session.execute.return_value = mock_result
-mock_session.__aenter__.return_value = mock_session
-mock_supabase.get_async_session.return_value = mock_session
-
-# Inject into sys.modules
-sys.modules["src.infra.supabase_client"] = mock_supabase
-
-# Mock model_router to avoid API calls
-mock_router_module = MagicMock()
-mock_router_instance = AsyncMock()
-mock_router_instance.embed_text.return_value = [0.1] * 768  # Fake embedding
-mock_router_module.model_router = mock_router_instance
-sys.modules["src.infra.model_router"] = mock_router_module
-
-# Now import
+from src.core import knowledge_base
 from src.core.knowledge_base import KnowledgeBase
 from src.core.config import settings
+from tests._http import fetch
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def test_pdf_ingestion():
+
+@pytest.fixture
+def mocked_kb(mock_supabase, mock_router, monkeypatch):
+    """Point knowledge_base at the shared DB/embedding mocks; restored after the test."""
+    monkeypatch.setattr(knowledge_base, "get_async_session", mock_supabase.get_async_session)
+    monkeypatch.setattr(knowledge_base, "model_router", mock_router)
+
+
+@pytest.mark.asyncio
+async def test_pdf_ingestion(mocked_kb):
+    await run_pdf_ingestion()
+
+
+async def run_pdf_ingestion():
+    """Download the sample PDF and ingest it (DB and embeddings must be mocked)."""
     print("--- Starting PDF Ingestion Test (Mocked DB) ---")
     
-    import httpx
-    
     # 1. Download Dummy PDF
     url = "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf"
     print(f"Downloading PDF from {url}...")
     
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url)
-        if resp.status_code != 200:
-            print(f"❌ Failed to download PDF: {resp.status_code}")
-            return
-        pdf_bytes = resp.content
-        print(f"Downloaded {len(pdf_bytes)} bytes.")
+    resp = await fetch(url)
+    if resp.status_code != 200:
+        print(f"❌ Failed to download PDF: {resp.status_code}")
+        return
+    pdf_bytes = resp.content
+    print(f"Downloaded {len(pdf_bytes)} bytes.")
 
     # 2. Ingest
     kb = KnowledgeBase()
@@ -98,5 +80,5 @@ async def test_pdf_ingestion():
 if __name__ == "__main__":
     if not settings.GOOGLE_API_KEY:
         print("⚠️ GOOGLE_API_KEY not set. Embedding might fail.")
-    
-    asyncio.run(test_pdf_ingestion())
+
+    sys.exit(pytest.main([__file__, "-s", "-q"]))
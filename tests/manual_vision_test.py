@@ -4,16 +4,11 @@ Directly invokes ModelRouter with a multimodal message to verify image handling.
 """
 import asyncio
 import logging
-import sys
-import os
 
-# Add project root to path
-sys.path.append(os.getcwd())
-
-# Add local libs (priority)
-libs_path = os.path.join(os.getcwd(), "libs")
-if os.path.exists(libs_path):
-    sys.path.insert(0, libs_path)
+try:
+    from tests import _bootstrap  # noqa: F401
+except ImportError:  # run as a script: tests/ itself is sys.path[0]
+    import _bootstrap  # noqa: F401
 
 from src.infra.model_router import model_router
 
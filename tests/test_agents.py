@@ -81,6 +81,14 @@ class TestPersonaSelector:
         intent = PersonaSelector.classify_intent("Olá, tudo bem?")
         assert intent == "default"
 
+    def test_classify_normalizes_whitespace_and_case(self):
+        assert PersonaSelector.classify_intent("  URGENTE!\n  erro no   servidor ") == "alert"
+        assert PersonaSelector.classify_intent("urgente! erro no servidor") == "alert"
+
+    def test_classify_long_message_bypasses_cache(self):
+        message = ("texto neutro " * 60) + "roadmap da sprint"
+        assert PersonaSelector.classify_intent(message) == "planning"
+
     def test_get_persona_returns_dict(self):
         persona = PersonaSelector.get_persona("debug")
         assert "name" in persona
@@ -2,145 +2,197 @@
 Tests for Phase 3 — Collaboration: Tasks, Threads, Notifications, Activity, Standup.
 """
 
+import asyncio
+
 import pytest
-from uuid import uuid4
 
 from src.collaboration.task_manager import (
-    TaskCreate, TaskManager, TaskPriority, TaskStatus, TaskUpdate,
+    TaskCreate, TaskPriority, TaskStatus, TaskUpdate,
 )
-from src.collaboration.thread_manager import ThreadManager
-from src.collaboration.notification_service import NotificationService
 from src.collaboration.activity_feed import ActivityFeed
+from src.collaboration.notification_service import Notification
 from src.collaboration.standup_generator import StandupGenerator
 
+# Manager fixtures (tm, thread, ns, feed) live in tests/conftest.py
+
+
+@pytest.fixture
+def standup(feed, tm):
+    return StandupGenerator(feed=feed, tasks=tm)
+
+
+def _seed_pending(ns, agent: str, n: int) -> None:
+    """Queue n undelivered notifications for agent without going through send()."""
+    ns._queue.setdefault(agent, []).extend(
+        Notification(type="system", target_agent=agent, content=f"Seed {i}") for i in range(n)
+    )
+
+
+@pytest.fixture
+async def prioritized_tm(tm):
+    """TaskManager preloaded with one LOW, one URGENT and one HIGH task."""
+    await asyncio.gather(
+        tm.create(TaskCreate(title="Low", priority=TaskPriority.LOW)),
+        tm.create(TaskCreate(title="Urgent", priority=TaskPriority.URGENT)),
+        tm.create(TaskCreate(title="High", priority=TaskPriority.HIGH)),
+    )
+    return tm
+
 
 # ============================================
 # Task Manager Tests
 # ============================================
 class TestTaskManager:
-    def setup_method(self):
-        self.tm = TaskManager()
-
     @pytest.mark.asyncio
-    async def test_create_task(self):
+    async def test_create_task(self, tm):
         data = TaskCreate(title="Test Task", description="A test", created_by="optimus")
-        task = await self.tm.create(data)
+        task = await tm.create(data)
         assert task.title == "Test Task"
         assert task.status == TaskStatus.INBOX
 
     @pytest.mark.asyncio
-    async def test_create_with_assignee_auto_assigns(self):
-        agent_id = uuid4()
+    async def test_create_with_assignee_auto_assigns(self, tm, fresh_uuid):
+        agent_id = fresh_uuid
         data = TaskCreate(title="Assigned", assignee_ids=[agent_id])
-        task = await self.tm.create(data)
+        task = await tm.create(data)
         assert task.status == TaskStatus.ASSIGNED
 
     @pytest.mark.asyncio
-    async def test_get_task(self):
+    async def test_get_task(self, tm):
         data = TaskCreate(title="Findable")
-        task = await self.tm.create(data)
-        found = await self.tm.get(task.id)
+        task = await tm.create(data)
+        found = await tm.get(task.id)
         assert found is not None
         assert found.title == "Findable"
 
     @pytest.mark.asyncio
-    async def test_update_task(self):
+    async def test_update_task(self, tm):
         data = TaskCreate(title="Original")
-        task = await self.tm.create(data)
-        updated = await self.tm.update(task.id, TaskUpdate(title="Updated"))
+        task = await tm.create(data)
+        updated = await tm.update(task.id, TaskUpdate(title="Updated"))
         assert updated.title == "Updated"
 
     @pytest.mark.asyncio
-    async def test_delete_task(self):
+    async def test_count_and_latest(self, tm):
+        for title in ("Primeira", "Segunda", "Terceira"):
+            await tm.create(TaskCreate(title=title, priority=TaskPriority.LOW))
+        assert await tm.count() == 3
+        assert [t.title for t in await tm.latest(2)] == ["Terceira", "Segunda"]
+
+    @pytest.mark.asyncio
+    async def test_delete_task(self, tm):
         data = TaskCreate(title="Deletable")
-        task = await self.tm.create(data)
-        result = await self.tm.delete(task.id)
+        task = await tm.create(data)
+        result = await tm.delete(task.id)
         assert result is True
-        assert await self.tm.get(task.id) is None
+        assert await tm.get(task.id) is None
 
     @pytest.mark.asyncio
-    async def test_valid_transition(self):
+    async def test_valid_transition(self, tm):
         data = TaskCreate(title="Transition Test")
-        task = await self.tm.create(data)
-        result = await self.tm.transition(task.id, TaskStatus.ASSIGNED)
+        task = await tm.create(data)
+        result = await tm.transition(task.id, TaskStatus.ASSIGNED)
         assert result is not None
         assert result.status == TaskStatus.ASSIGNED
 
     @pytest.mark.asyncio
-    async def test_invalid_transition_returns_none(self):
+    async def test_invalid_transition_returns_none(self, tm):
         data = TaskCreate(title="Invalid")
-        task = await self.tm.create(data)
+        task = await tm.create(data)
         # INBOX → REVIEW is not valid
-        result = await self.tm.transition(task.id, TaskStatus.REVIEW)
+        result = await tm.transition(task.id, TaskStatus.REVIEW)
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_list_by_priority(self):
-        await self.tm.create(TaskCreate(title="Low", priority=TaskPriority.LOW))
-        await self.tm.create(TaskCreate(title="Urgent", priority=TaskPriority.URGENT))
-        urgent = await self.tm.list_tasks(priority=TaskPriority.URGENT)
-        assert len(urgent) == 1
-        assert urgent[0].title == "Urgent"
+    async def test_bulk_transition(self, tm):
+        task = await tm.create(TaskCreate(title="Bulk"))
+        path = [TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS, TaskStatus.REVIEW, TaskStatus.DONE]
+        result = await tm.bulk_transition(task.id, path)
+        assert result.status == TaskStatus.DONE
+
+    @pytest.mark.asyncio
+    async def test_bulk_transition_emits_events_in_one_batch(self, tm, monkeypatch):
+        from src.core.events import event_bus
+        batches = []
+
+        async def record(events):
+            batches.append([e.type for e in events])
+
+        task = await tm.create(TaskCreate(title="Bulk events"))
+        monkeypatch.setattr(event_bus, "emit_many", record)
+        await tm.bulk_transition(task.id, [TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS, TaskStatus.REVIEW, TaskStatus.DONE])
+        await event_bus.flush()
+        assert batches == [["task.updated"] * 4 + ["task.completed"]]
+
+    @pytest.mark.asyncio
+    async def test_bulk_transition_invalid_step_leaves_task_untouched(self, tm):
+        task = await tm.create(TaskCreate(title="Bulk invalid"))
+        # ASSIGNED → REVIEW is not valid
+        result = await tm.bulk_transition(task.id, [TaskStatus.ASSIGNED, TaskStatus.REVIEW])
+        assert result is None
+        assert (await tm.get(task.id)).status == TaskStatus.INBOX
 
     @pytest.mark.asyncio
-    async def test_list_sorted_by_priority(self):
-        await self.tm.create(TaskCreate(title="Low", priority=TaskPriority.LOW))
-        await self.tm.create(TaskCreate(title="Urgent", priority=TaskPriority.URGENT))
-        await self.tm.create(TaskCreate(title="High", priority=TaskPriority.HIGH))
-        all_tasks = await self.tm.list_tasks()
-        assert all_tasks[0].title == "Urgent"
-        assert all_tasks[1].title == "High"
+    @pytest.mark.parametrize("filter_priority,expected_titles", [
+        (TaskPriority.URGENT, ["Urgent"]),
+        (TaskPriority.MEDIUM, []),
+        (None, ["Urgent", "High", "Low"]),
+    ])
+    async def test_list_tasks_by_priority(self, prioritized_tm, filter_priority, expected_titles):
+        tasks = await prioritized_tm.list_tasks(priority=filter_priority)
+        assert [t.title for t in tasks] == expected_titles
 
 
 # ============================================
 # Thread Manager Tests
 # ============================================
 class TestThreadManager:
-    def setup_method(self):
-        self.thread = ThreadManager()
-
     @pytest.mark.asyncio
-    async def test_post_message(self):
-        task_id = uuid4()
-        msg = await self.thread.post_message(task_id, "optimus", "Hello team")
+    async def test_post_message(self, thread, fresh_uuid):
+        task_id = fresh_uuid
+        msg = await thread.post_message(task_id, "optimus", "Hello team")
         assert msg.from_agent == "optimus"
         assert msg.task_id == task_id
 
     @pytest.mark.asyncio
-    async def test_auto_subscribe_on_post(self):
-        task_id = uuid4()
-        await self.thread.post_message(task_id, "friday", "Working on it")
-        subscribers = await self.thread.get_subscribers(task_id)
+    async def test_auto_subscribe_on_post(self, thread, fresh_uuid):
+        task_id = fresh_uuid
+        await thread.post_message(task_id, "friday", "Working on it")
+        subscribers = await thread.get_subscribers(task_id)
         assert "friday" in subscribers
 
     @pytest.mark.asyncio
-    async def test_mention_parsing(self):
-        task_id = uuid4()
-        msg = await self.thread.post_message(task_id, "optimus", "Hey @friday check this")
+    async def test_mention_parsing(self, thread, fresh_uuid):
+        task_id = fresh_uuid
+        msg = await thread.post_message(task_id, "optimus", "Hey @friday check this")
         assert "friday" in msg.mentions
 
     @pytest.mark.asyncio
-    async def test_mentioned_agent_auto_subscribed(self):
-        task_id = uuid4()
-        await self.thread.post_message(task_id, "optimus", "Hey @fury take a look")
-        subscribers = await self.thread.get_subscribers(task_id)
+    async def test_mentioned_agent_auto_subscribed(self, thread, fresh_uuid):
+        task_id = fresh_uuid
+        await thread.post_message(task_id, "optimus", "Hey @fury take a look")
+        subscribers = await thread.get_subscribers(task_id)
         assert "fury" in subscribers
         assert "optimus" in subscribers
 
     @pytest.mark.asyncio
-    async def test_get_messages(self):
-        task_id = uuid4()
-        await self.thread.post_message(task_id, "optimus", "First")
-        await self.thread.post_message(task_id, "friday", "Second")
-        messages = await self.thread.get_messages(task_id)
+    async def test_get_messages(self, thread, fresh_uuid):
+        task_id = fresh_uuid
+        await asyncio.gather(
+            thread.post_message(task_id, "optimus", "First"),
+            thread.post_message(task_id, "friday", "Second"),
+        )
+        messages = await thread.get_messages(task_id)
         assert len(messages) == 2
 
     @pytest.mark.asyncio
-    async def test_thread_summary(self):
-        task_id = uuid4()
-        await self.thread.post_message(task_id, "optimus", "Msg 1")
-        await self.thread.post_message(task_id, "friday", "Msg 2")
-        summary = await self.thread.get_thread_summary(task_id)
+    async def test_thread_summary(self, thread, fresh_uuid):
+        task_id = fresh_uuid
+        await asyncio.gather(
+            thread.post_message(task_id, "optimus", "Msg 1"),
+            thread.post_message(task_id, "friday", "Msg 2"),
+        )
+        summary = await thread.get_thread_summary(task_id)
         assert summary["message_count"] == 2
         assert set(summary["participants"]) == {"optimus", "friday"}
 
@@ -149,108 +201,157 @@ class TestThreadManager:
 # Notification Service Tests
 # ============================================
 class TestNotificationService:
-    def setup_method(self):
-        self.ns = NotificationService()
-
     @pytest.mark.asyncio
-    async def test_send_notification(self):
-        n = await self.ns.send("friday", "task_assigned", "Nova task para você")
+    async def test_send_notification(self, ns):
+        n = await ns.send("friday", "task_assigned", "Nova task para você")
         assert n.target_agent == "friday"
         assert not n.delivered
 
     @pytest.mark.asyncio
-    async def test_get_pending(self):
-        await self.ns.send("friday", "system", "Msg 1")
-        await self.ns.send("friday", "system", "Msg 2")
-        pending = await self.ns.get_pending("friday")
+    async def test_get_pending(self, ns):
+        await ns.send("friday", "system", "Msg 1")
+        await ns.send("friday", "system", "Msg 2")
+        pending = await ns.get_pending("friday")
         assert len(pending) == 2
 
     @pytest.mark.asyncio
-    async def test_mark_delivered(self):
-        n = await self.ns.send("fury", "mention", "You were mentioned")
-        await self.ns.mark_delivered(n.id, "fury")
-        pending = await self.ns.get_pending("fury")
+    async def test_mark_delivered(self, ns):
+        n = await ns.send("fury", "mention", "You were mentioned")
+        await ns.mark_delivered(n.id, "fury")
+        pending = await ns.get_pending("fury")
         assert len(pending) == 0
 
     @pytest.mark.asyncio
-    async def test_mark_all_delivered(self):
-        await self.ns.send("optimus", "system", "A")
-        await self.ns.send("optimus", "system", "B")
-        count = await self.ns.mark_all_delivered("optimus")
+    async def test_mark_all_delivered(self, ns):
+        _seed_pending(ns, "optimus", n=2)
+        count = await ns.mark_all_delivered("optimus")
         assert count == 2
-        assert await self.ns.get_pending_count("optimus") == 0
+        assert await ns.get_pending_count("optimus") == 0
+
+    @pytest.mark.asyncio
+    async def test_get_all_newest_first_with_limit(self, ns):
+        _seed_pending(ns, "optimus", n=5)
+        latest = await ns.get_all("optimus", limit=2)
+        assert [n.content for n in latest] == ["Seed 4", "Seed 3"]
+        assert await ns.get_all("nobody") == []
+
+    @pytest.mark.asyncio
+    async def test_send_many_queues_once_per_agent(self, ns, fresh_uuid):
+        sent = await ns.send_task_assigned_many(["friday", "fury", "friday"], "Deploy", fresh_uuid, "optimus")
+        assert [n.target_agent for n in sent] == ["friday", "fury"]
+        for agent in ("friday", "fury"):
+            pending = await ns.get_pending(agent)
+            assert len(pending) == 1
+            assert pending[0].content == "Nova task atribuída: Deploy"
+            assert pending[0].task_id == fresh_uuid
+        assert await ns.send_many([], "system", "Nada") == []
+
+    @pytest.mark.asyncio
+    async def test_send_many_isolates_failing_recipient(self, ns, fresh_uuid):
+        sent = await ns.send_task_assigned_many(["friday", None, "fury"], "Deploy", fresh_uuid)
+        assert [n.target_agent for n in sent] == ["friday", "fury"]
+        assert len(await ns.get_pending("fury")) == 1
+
+    @pytest.mark.asyncio
+    async def test_send_to_subscribers_skips_sender(self, ns):
+        sent = await ns.send_to_subscribers(["friday", "fury"], "new_message", "Oi", exclude_agent="fury")
+        assert [n.target_agent for n in sent] == ["friday"]
+        assert await ns.get_pending_count("fury") == 0
 
 
 # ============================================
 # Activity Feed Tests
 # ============================================
 class TestActivityFeed:
-    def setup_method(self):
-        self.feed = ActivityFeed(max_size=100)
-
     @pytest.mark.asyncio
-    async def test_record_activity(self):
-        a = await self.feed.record("task_created", "Task criada", agent_name="optimus")
+    async def test_record_activity(self, feed):
+        a = await feed.record("task_created", "Task criada", agent_name="optimus")
         assert a.type == "task_created"
         assert a.agent_name == "optimus"
 
     @pytest.mark.asyncio
-    async def test_get_recent(self):
-        await self.feed.record("task_created", "T1")
-        await self.feed.record("message_sent", "M1")
-        recent = await self.feed.get_recent(limit=10)
+    async def test_get_recent(self, feed):
+        await feed.record("task_created", "T1")
+        await feed.record("message_sent", "M1")
+        recent = await feed.get_recent(limit=10)
         assert len(recent) == 2
 
     @pytest.mark.asyncio
-    async def test_get_by_agent(self):
-        await self.feed.record("llm_call", "Call 1", agent_name="friday")
-        await self.feed.record("llm_call", "Call 2", agent_name="fury")
-        friday = await self.feed.get_by_agent("friday")
+    async def test_get_by_agent(self, feed):
+        await feed.record("llm_call", "Call 1", agent_name="friday")
+        await feed.record("llm_call", "Call 2", agent_name="fury")
+        friday = await feed.get_by_agent("friday")
         assert len(friday) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_by_type_newest_first_with_limit(self, feed):
+        for i in range(4):
+            await feed.record("llm_call", f"Call {i}", agent_name="friday")
+            await feed.record("tool_call", f"Tool {i}", agent_name="friday")
+        calls = await feed.get_by_type("llm_call", limit=2)
+        assert [a.message for a in calls] == ["Call 3", "Call 2"]
+
     @pytest.mark.asyncio
     async def test_max_size_trim(self):
         feed = ActivityFeed(max_size=5)
-        for i in range(10):
-            await feed.record("test", f"Activity {i}")
+        await feed.record_many(
+            [{"activity_type": "test", "message": f"Activity {i}"} for i in range(10)]
+        )
         recent = await feed.get_recent(limit=100)
         assert len(recent) == 5
+        assert {a.message for a in recent} == {f"Activity {i}" for i in range(5, 10)}
 
     @pytest.mark.asyncio
-    async def test_daily_summary(self):
-        await self.feed.record("task_created", "T1", agent_name="optimus")
-        await self.feed.record("llm_call", "L1", agent_name="friday")
-        summary = await self.feed.get_daily_summary()
+    async def test_record_many_keeps_order_and_fields(self, feed, fresh_uuid):
+        recorded = await feed.record_many([
+            {"activity_type": "task_created", "message": "T1"},
+            {"activity_type": "message_sent", "message": "M1", "task_id": fresh_uuid, "agent_name": "friday"},
+        ])
+        assert recorded[1].agent_name == "friday"
+        assert recorded[1].task_id == fresh_uuid
+        assert recorded[0].task_id is None
+        recent = await feed.get_recent(limit=10)
+        assert [a.message for a in recent] == ["M1", "T1"]
+
+    @pytest.mark.asyncio
+    async def test_daily_summary(self, feed):
+        await asyncio.gather(
+            feed.record("task_created", "T1", agent_name="optimus"),
+            feed.record("llm_call", "L1", agent_name="friday"),
+        )
+        summary = await feed.get_daily_summary()
         assert summary["total_activities"] == 2
         assert "optimus" in summary["active_agents"]
 
+    @pytest.mark.asyncio
+    async def test_daily_summary_other_day_is_empty(self, feed):
+        await feed.record("task_created", "T1", agent_name="optimus")
+        summary = await feed.get_daily_summary("2000-01-01")
+        assert summary["total_activities"] == 0
+        assert (await feed.get_daily_summary("not-a-date"))["total_activities"] == 0
+
 
 # ============================================
 # Standup Generator Tests
 # ============================================
 class TestStandupGenerator:
-    def setup_method(self):
-        self.feed = ActivityFeed()
-        self.tasks = TaskManager()
-        self.standup = StandupGenerator(feed=self.feed, tasks=self.tasks)
-
     @pytest.mark.asyncio
-    async def test_agent_standup_empty(self):
-        report = await self.standup.generate_agent_standup("optimus")
+    async def test_agent_standup_empty(self, standup):
+        report = await standup.generate_agent_standup("optimus")
         assert "Standup — optimus" in report
         assert "Sem atividades" in report
 
     @pytest.mark.asyncio
-    async def test_team_standup(self):
-        await self.feed.record("task_created", "Test", agent_name="optimus")
-        report = await self.standup.generate_team_standup()
+    async def test_team_standup(self, feed, standup):
+        await feed.record("task_created", "Test", agent_name="optimus")
+        report = await standup.generate_team_standup()
         assert "Team Standup" in report
 
     @pytest.mark.asyncio
-    async def test_standup_includes_tasks(self):
-        await self.tasks.create(TaskCreate(title="Active Task"))
-        task = (await self.tasks.list_tasks())[0]
-        await self.tasks.transition(task.id, TaskStatus.ASSIGNED)
-        await self.tasks.transition(task.id, TaskStatus.IN_PROGRESS)
-        report = await self.standup.generate_agent_standup("optimus")
+    async def test_standup_includes_tasks(self, tm, standup):
+        await tm.create(TaskCreate(title="Active Task"))
+        task = (await tm.list_tasks())[0]
+        await tm.transition(task.id, TaskStatus.ASSIGNED)
+        await tm.transition(task.id, TaskStatus.IN_PROGRESS)
+        report = await standup.generate_agent_standup("optimus")
         assert "Active Task" in report
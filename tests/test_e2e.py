@@ -3,17 +3,36 @@ Tests End-to-End — Agent Optimus.
 Fluxos completos: message → gateway → agent → response.
 """
 
+import asyncio
+import functools
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.channels.base_channel import IncomingMessage, ChannelType
 from src.channels.chat_commands import ChatCommandHandler
-from src.core.a2a_protocol import A2AProtocol, AgentCard, DelegationRequest
-from src.collaboration.task_manager import TaskCreate, TaskManager, TaskPriority
+from src.core.a2a_protocol import AgentCard, DelegationRequest
+from src.collaboration.task_manager import (
+    TaskCreate, TaskManager, TaskPriority, TaskStatus, TaskUpdate,
+)
 from src.collaboration.notification_service import NotificationService
-from src.core.security import SecurityManager, Permission
-from src.core.performance import ContextCompactor, QueryCache, SessionPruner
-from src.core.events import EventBus, Event, EventType
+from src.core.security import Permission
+from src.core.performance import ContextCompactor, QueryCache
+from src.core.events import Event, EventType, event_bus
+from src.core.cron_scheduler import CronJob, cron_scheduler
+from src.core import gateway as _gateway_mod
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_handler() -> ChatCommandHandler:
+    return ChatCommandHandler()
+
+
+@pytest.fixture
+def handler():
+    """ChatCommandHandler keeps no per-user state, so one instance serves every test."""
+    return _shared_handler()
 
 
 # ============================================
@@ -22,28 +41,25 @@ from src.core.events import EventBus, Event, EventType
 class TestE2ECommands:
     """Test message flow through chat commands."""
 
-    def setup_method(self):
-        self.handler = ChatCommandHandler()
-
     @pytest.mark.asyncio
-    async def test_help_command(self):
-        result = await self.handler.handle("/help", "user1")
+    async def test_help_command(self, handler):
+        result = await handler.handle("/help", "user1")
         assert result is not None
         assert "Comandos" in result or "help" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_status_command(self):
-        result = await self.handler.handle("/status", "user1")
+    async def test_status_command(self, handler):
+        result = await handler.handle("/status", "user1")
         assert result is not None
 
     @pytest.mark.asyncio
-    async def test_agents_command(self):
-        result = await self.handler.handle("/agents", "user1")
+    async def test_agents_command(self, handler):
+        result = await handler.handle("/agents", "user1")
         assert result is not None
 
     @pytest.mark.asyncio
-    async def test_unknown_command(self):
-        result = await self.handler.handle("/nonexistent", "user1")
+    async def test_unknown_command(self, handler):
+        result = await handler.handle("/nonexistent", "user1")
         # Should return None or help text
         assert result is None or isinstance(result, str)
 
@@ -51,6 +67,14 @@ class TestE2ECommands:
 # ============================================
 # E2E: Task Create → Notification
 # ============================================
+LIFECYCLE = (
+    TaskStatus.ASSIGNED,
+    TaskStatus.IN_PROGRESS,
+    TaskStatus.REVIEW,
+    TaskStatus.DONE,
+)
+
+
 class TestE2ETaskFlow:
     """Test task creation → notification flow."""
 
@@ -83,20 +107,14 @@ class TestE2ETaskFlow:
         assert len(notifs) >= 1
 
     @pytest.mark.asyncio
-    async def test_task_lifecycle_flow(self):
-        # Create → Assign → InProgress → Review → Done
+    @pytest.mark.parametrize("step", range(len(LIFECYCLE)), ids=[s.value for s in LIFECYCLE])
+    async def test_task_lifecycle_flow(self, step):
+        # Create → Assign → InProgress → Review → Done, reported per step
         task = await self.tasks.create(TaskCreate(title="Lifecycle test"))
+        await self.tasks.bulk_transition(task.id, list(LIFECYCLE[:step]))
 
-        from src.collaboration.task_manager import TaskStatus, TaskUpdate
-        transitions = [
-            TaskStatus.ASSIGNED,
-            TaskStatus.IN_PROGRESS,
-            TaskStatus.REVIEW,
-            TaskStatus.DONE,
-        ]
-        for status in transitions:
-            updated = await self.tasks.update(task.id, TaskUpdate(status=status))
-            assert updated.status == status
+        updated = await self.tasks.update(task.id, TaskUpdate(status=LIFECYCLE[step]))
+        assert updated.status == LIFECYCLE[step]
 
 
 # ============================================
@@ -105,17 +123,14 @@ class TestE2ETaskFlow:
 class TestE2ADelegation:
     """Test agent-to-agent delegation flow."""
 
-    def setup_method(self):
-        self.a2a = A2AProtocol()
-
     @pytest.mark.asyncio
-    async def test_full_delegation_flow(self):
+    async def test_full_delegation_flow(self, a2a):
         # 1. Register agents
-        self.a2a.register_agent(AgentCard(
+        a2a.register_agent(AgentCard(
             name="optimus", role="Lead", level="lead",
             capabilities=["planning", "delegation"],
         ))
-        self.a2a.register_agent(AgentCard(
+        a2a.register_agent(AgentCard(
             name="friday", role="Developer", level="specialist",
             capabilities=["code", "debug"],
         ))
@@ -127,21 +142,21 @@ class TestE2ADelegation:
             task_description="Implement authentication module",
             context="FastAPI + JWT",
         )
-        msg = await self.a2a.delegate(request)
+        msg = await a2a.delegate(request)
 
         # 3. Verify load increased
-        friday_card = self.a2a.get_card("friday")
+        friday_card = a2a.get_card("friday")
         assert friday_card.current_load == 1
 
         # 4. Friday completes the work
-        await self.a2a.complete_delegation(msg.id, "Auth module done with JWT + refresh tokens")
+        await a2a.complete_delegation(msg.id, "Auth module done with JWT + refresh tokens")
 
         # 5. Verify load decreased
-        friday_card = self.a2a.get_card("friday")
+        friday_card = a2a.get_card("friday")
         assert friday_card.current_load == 0
 
         # 6. Verify response sent back to optimus
-        optimus_messages = await self.a2a.get_messages("optimus", message_type="response")
+        optimus_messages = await a2a.get_messages("optimus", message_type="response")
         assert len(optimus_messages) >= 1
         assert "Auth module done" in optimus_messages[0].content
 
@@ -152,30 +167,27 @@ class TestE2ADelegation:
 class TestE2ESecurity:
     """Test security permission enforcement flow."""
 
-    def setup_method(self):
-        self.sec = SecurityManager()
-
-    def test_intern_cannot_write_db(self):
-        allowed = self.sec.check_permission("intern_bot", "intern", Permission.DB_WRITE, "users_table")
+    def test_intern_cannot_write_db(self, sec):
+        allowed = sec.check_permission("intern_bot", "intern", Permission.DB_WRITE, "users_table")
         assert allowed is False
 
         # Verify audit trail recorded it
-        audit = self.sec.get_denied_actions(limit=1)
+        audit = sec.get_denied_actions(limit=1)
         assert len(audit) == 1
         assert audit[0].agent_name == "intern_bot"
 
-    def test_lead_full_access_flow(self):
+    def test_lead_full_access_flow(self, sec):
         # Lead should have all permissions
         for perm in Permission:
-            assert self.sec.check_permission("optimus", "lead", perm)
+            assert sec.check_permission("optimus", "lead", perm)
 
-    def test_custom_permission_override(self):
+    def test_custom_permission_override(self, sec):
         # Intern normally can't write
-        assert not self.sec.check_permission("special", "intern", Permission.FS_WRITE)
+        assert not sec.check_permission("special", "intern", Permission.FS_WRITE)
 
         # Grant custom permission
-        self.sec.grant_permission("special", Permission.FS_WRITE)
-        assert self.sec.check_permission("special", "intern", Permission.FS_WRITE)
+        sec.grant_permission("special", Permission.FS_WRITE)
+        assert sec.check_permission("special", "intern", Permission.FS_WRITE)
 
 
 # ============================================
@@ -184,21 +196,18 @@ class TestE2ESecurity:
 class TestE2EEvents:
     """Test event-driven architecture flow."""
 
-    def setup_method(self):
-        self.bus = EventBus()
-
     @pytest.mark.asyncio
-    async def test_task_event_triggers_notification(self):
+    async def test_task_event_triggers_notification(self, bus):
         """Simulate: task created → event emitted → handler notifies."""
         notifications_sent = []
 
         async def on_task_created(event: Event):
             notifications_sent.append(event.data.get("title"))
 
-        self.bus.on(EventType.TASK_CREATED.value, on_task_created)
+        bus.on(EventType.TASK_CREATED.value, on_task_created)
 
         # Emit task created event
-        await self.bus.emit(Event(
+        await bus.emit(Event(
             type=EventType.TASK_CREATED,
             source="task_manager",
             data={"title": "New feature", "assignee": "friday"},
@@ -208,16 +217,16 @@ class TestE2EEvents:
         assert notifications_sent[0] == "New feature"
 
     @pytest.mark.asyncio
-    async def test_webhook_event_flow(self):
+    async def test_webhook_event_flow(self, bus):
         """Simulate: GitHub webhook → event → handler."""
         processed = []
 
         async def on_webhook(event: Event):
             processed.append(event.data)
 
-        self.bus.on(EventType.WEBHOOK_GITHUB.value, on_webhook)
+        bus.on(EventType.WEBHOOK_GITHUB.value, on_webhook)
 
-        await self.bus.emit(Event(
+        await bus.emit(Event(
             type=EventType.WEBHOOK_GITHUB,
             source="github",
             data={"action": "push", "branch": "main"},
@@ -230,6 +239,11 @@ class TestE2EEvents:
 # ============================================
 # E2E: Performance — Cache + Compact Flow
 # ============================================
+_MSGS_20 = tuple(
+    {"role": "user", "content": f"Message number {i} with some content"} for i in range(20)
+)
+
+
 class TestE2EPerformance:
     """Test performance optimization flow."""
 
@@ -255,8 +269,8 @@ class TestE2EPerformance:
 
     @pytest.mark.asyncio
     async def test_context_compacting_saves_tokens(self):
-        # 20 messages (exceeds max of 5)
-        messages = [{"role": "user", "content": f"Message number {i} with some content"} for i in range(20)]
+        # 20 messages (exceeds max of 5); compact() only reads them, so the dicts are shared
+        messages = list(_MSGS_20)
 
         before_tokens = self.compactor.estimate_tokens(messages)
         result = await self.compactor.compact(messages)
@@ -276,7 +290,7 @@ class TestE2EFullPipeline:
     """Simulate a complete user interaction pipeline."""
 
     @pytest.mark.asyncio
-    async def test_message_to_response_pipeline(self):
+    async def test_message_to_response_pipeline(self, sec, bus):
         """
         Simulates:
         1. User sends message on Telegram
@@ -301,12 +315,10 @@ class TestE2EFullPipeline:
         assert response is not None
 
         # 3. Security check (user level)
-        sec = SecurityManager()
         allowed = sec.check_permission("optimus", "lead", Permission.MCP_EXECUTE)
         assert allowed
 
         # 4. Event emission
-        bus = EventBus()
         events_log = []
 
         async def log_event(event):
@@ -332,36 +344,10 @@ class TestGatewayChatCommandsIntegration:
     Validates REGRA DE OURO checkpoint #2: "test that fails without the feature".
     """
 
-    @pytest.mark.asyncio
-    async def test_slash_command_intercepted_before_agent(self):
-        """
-        Test that slash commands are handled BEFORE routing to agents.
-
-        Flow:
-        User sends "/help" → Gateway → ChatCommands → Response (no agent)
-
-        If this test passes but feature is removed, the gateway would route
-        "/help" to the LLM agent instead of executing the command.
-        """
-        from src.core.gateway import gateway
-
-        # Send /help command
-        result = await gateway.route_message(
-            message="/help",
-            user_id="test_user",
-        )
-
-        # CRITICAL: Must be handled by chat_commands, NOT by agent
-        assert result["agent"] == "chat_commands", \
-            "Command was NOT intercepted! Gateway routed to agent instead of chat_commands."
-
-        assert result["is_command"] is True
-        assert "Comandos Disponíveis" in result["content"] or "/help" in result["content"].lower()
-
     @pytest.mark.asyncio
     async def test_normal_message_not_intercepted(self):
         """Test that normal messages still go to agents."""
-        from src.core.gateway import gateway
+        gateway = _gateway_mod.gateway
 
         result = await gateway.route_message(
             message="Hello, how are you?",
@@ -372,22 +358,37 @@ class TestGatewayChatCommandsIntegration:
         assert result["agent"] != "chat_commands"
         assert result.get("is_command") is not True
 
+    @pytest.mark.parametrize("text,expected", [
+        ("/help", True), ("  /agents", True), ("hello /help", False), ("", False), ("   ", False),
+    ])
+    def test_command_precheck_matches_is_command(self, text, expected):
+        from src.channels.chat_commands import chat_commands
+        assert _gateway_mod._maybe_command(text) is expected
+        assert chat_commands.is_command(text) is expected
+
     @pytest.mark.asyncio
-    async def test_all_commands_work_via_gateway(self):
-        """Test that all slash commands are accessible via Gateway."""
-        from src.core.gateway import gateway
+    @pytest.mark.parametrize("cmd", ["/help", "/status", "/agents"], ids=["help", "status", "agents"])
+    async def test_slash_command_intercepted(self, cmd):
+        """
+        Test that slash commands are handled BEFORE routing to agents.
 
-        commands_to_test = ["/help", "/status", "/agents"]
+        Flow:
+        User sends "/help" → Gateway → ChatCommands → Response (no agent)
 
-        for cmd in commands_to_test:
-            result = await gateway.route_message(message=cmd, user_id="test_user")
+        If this test passes but feature is removed, the gateway would route
+        the command to the LLM agent instead of executing it.
+        """
+        result = await _gateway_mod.gateway.route_message(message=cmd, user_id="test_user")
 
-            assert result["agent"] == "chat_commands", \
-                f"Command {cmd} was not intercepted by chat_commands"
+        # CRITICAL: Must be handled by chat_commands, NOT by agent
+        assert result["agent"] == "chat_commands", \
+            f"Command {cmd} was NOT intercepted! Gateway routed to agent instead of chat_commands."
 
-            assert result["is_command"] is True
-            assert isinstance(result["content"], str)
-            assert len(result["content"]) > 0
+        assert result["is_command"] is True
+        assert isinstance(result["content"], str)
+        assert len(result["content"]) > 0
+        if cmd == "/help":
+            assert "Comandos Disponíveis" in result["content"] or "/help" in result["content"].lower()
 
 
 # ============================================
@@ -409,18 +410,17 @@ class TestCronSchedulerIntegration:
         If this test passes but cron_scheduler.start() is NOT called in main.py,
         jobs will never execute in production.
         """
-        from src.core.cron_scheduler import cron_scheduler
-
         # Start scheduler (this is what main.py lifespan should do)
         if not cron_scheduler._running:
             await cron_scheduler.start()
 
-        # Verify it started successfully
-        assert cron_scheduler._running is True, \
-            "CronScheduler failed to start!"
-
-        # Cleanup
-        await cron_scheduler.stop()
+        try:
+            # Verify it started successfully
+            assert cron_scheduler._running is True, \
+                "CronScheduler failed to start!"
+        finally:
+            # Cleanup: the event loop is shared by the whole session
+            await cron_scheduler.stop()
 
     @pytest.mark.asyncio
     async def test_cron_job_execution(self):
@@ -429,15 +429,12 @@ class TestCronSchedulerIntegration:
 
         Creates a simple job and verifies it runs when due.
         """
-        from src.core.cron_scheduler import cron_scheduler, CronJob
-        from src.core.events import event_bus, EventType
-        from datetime import datetime, timezone, timedelta
-
-        # Track if job was executed via event
-        executed_jobs = []
+        # Resolved by the handler as soon as the job's event is delivered
+        triggered = asyncio.get_running_loop().create_future()
 
         async def on_cron_triggered(event):
-            executed_jobs.append(event.data.get("job_name"))
+            if not triggered.done():
+                triggered.set_result(event.data.get("job_name"))
 
         event_bus.on(EventType.CRON_TRIGGERED.value, on_cron_triggered)
 
@@ -452,19 +449,24 @@ class TestCronSchedulerIntegration:
 
         job_id = cron_scheduler.add(job)
 
-        # Wait for job to execute (scheduler checks every 60s, but we can run_now)
-        await cron_scheduler.run_now(job_id)
+        try:
+            # Drive the job directly instead of waiting for the 60s scheduler tick
+            await cron_scheduler.run_now(job_id)
+            job_name = await asyncio.wait_for(triggered, 0.5)
+        except TimeoutError:
+            job_name = None
+        finally:
+            # Cleanup: don't leave the handler on the session-wide event_bus
+            event_bus.off(EventType.CRON_TRIGGERED.value, on_cron_triggered)
 
         # Verify job was executed
-        assert "test_job_immediate" in executed_jobs, \
+        assert job_name == "test_job_immediate", \
             "Cron job was NOT executed! Scheduler may not be running properly."
 
     @pytest.mark.asyncio
     async def test_cron_scheduler_can_list_jobs(self):
         """Test that we can add and list cron jobs."""
-        from src.core.cron_scheduler import cron_scheduler, CronJob
-
-        initial_count = len(cron_scheduler.list_jobs())
+        initial_count = cron_scheduler.job_count
 
         # Add a test job
         job = CronJob(
@@ -476,8 +478,8 @@ class TestCronSchedulerIntegration:
         job_id = cron_scheduler.add(job)
 
         # List jobs
-        jobs = cron_scheduler.list_jobs()
-        assert len(jobs) == initial_count + 1
+        assert cron_scheduler.job_count == initial_count + 1
+        assert job in cron_scheduler.list_jobs()
 
         # Cleanup
         cron_scheduler.remove(job_id)
@@ -562,14 +564,13 @@ class TestNotificationServiceIntegration:
     """
 
     @pytest.mark.asyncio
-    async def test_notification_sent_on_task_created(self):
+    async def test_notification_sent_on_task_created(self, tid):
         """
         Test that notification is sent when a task is created with assignees.
 
         If TaskManager.create() does NOT emit TASK_CREATED event,
         or notification_handlers is NOT registered, this test FAILS.
         """
-        from uuid import uuid4
         from src.collaboration.task_manager import task_manager, TaskCreate
         from src.collaboration.notification_service import notification_service
         from src.collaboration.notification_handlers import register_notification_handlers
@@ -578,7 +579,7 @@ class TestNotificationServiceIntegration:
         # Register handlers (simulating main.py lifespan)
         register_notification_handlers()
 
-        assignee_id = f"agent-{uuid4().hex[:8]}"
+        assignee_id = tid("agent")
         creator_id = "test-agent"
 
         # Clear any existing notifications
@@ -593,7 +594,6 @@ class TestNotificationServiceIntegration:
 
         # Since asyncio.create_task needs an event loop iteration, simulate the event directly
         from src.core.events import Event
-        import asyncio
 
         await event_bus.emit(Event(
             type=EventType.TASK_CREATED,
@@ -606,9 +606,6 @@ class TestNotificationServiceIntegration:
             }
         ))
 
-        # Allow async handlers to complete
-        await asyncio.sleep(0)
-
         # Verify notification was sent to assignee
         notifications = await notification_service.get_all(assignee_id)
         assert len(notifications) > 0, \
@@ -619,7 +616,7 @@ class TestNotificationServiceIntegration:
             f"Notification content wrong: {n.content}"
 
     @pytest.mark.asyncio
-    async def test_notification_sent_on_task_completed(self):
+    async def test_notification_sent_on_task_completed(self, tid):
         """
         Test that notification is sent to task creator when task is completed.
 
@@ -629,11 +626,10 @@ class TestNotificationServiceIntegration:
         from src.collaboration.notification_handlers import register_notification_handlers
         from src.core.events import event_bus, EventType, Event
         from uuid import uuid4
-        import asyncio
 
         register_notification_handlers()
 
-        creator_id = f"creator-{uuid4().hex[:8]}"
+        creator_id = tid("creator")
         task_id = str(uuid4())
 
         await notification_service.clear(creator_id)
@@ -650,8 +646,6 @@ class TestNotificationServiceIntegration:
             }
         ))
 
-        await asyncio.sleep(0)
-
         notifications = await notification_service.get_all(creator_id)
         assert len(notifications) > 0, \
             "No notifications sent on task completion! on_task_completed handler not working."
@@ -712,7 +706,7 @@ class TestTaskManagerIntegration:
         from src.core.gateway import gateway
         from src.collaboration.task_manager import task_manager
 
-        initial_count = len(await task_manager.list_tasks())
+        initial_count = await task_manager.count()
 
         # Send /task create command via gateway (full integration path)
         result = await gateway.route_message(
@@ -726,12 +720,11 @@ class TestTaskManagerIntegration:
         assert result["is_command"] is True
 
         # CRITICAL: A new task must have been created in TaskManager
-        tasks_after = await task_manager.list_tasks()
-        assert len(tasks_after) > initial_count, \
+        assert await task_manager.count() > initial_count, \
             "task_manager.create() was NOT called! /task create did not persist the task."
 
         # Verify the task has the correct title
-        titles = [t.title for t in tasks_after]
+        titles = [t.title for t in await task_manager.latest(5)]
         assert any("FASE 0 #21" in title for title in titles), \
             f"Task with expected title not found. Tasks: {titles}"
 
@@ -813,7 +806,7 @@ class TestActivityFeedIntegration:
     """
 
     @pytest.mark.asyncio
-    async def test_task_event_recorded_in_feed(self):
+    async def test_task_event_recorded_in_feed(self, tid):
         """
         Test that task creation events are recorded in ActivityFeed.
 
@@ -824,7 +817,6 @@ class TestActivityFeedIntegration:
         from src.collaboration.activity_feed import activity_feed
         from src.core.events import event_bus, EventType, Event
         from uuid import uuid4
-        import asyncio
 
         register_activity_handlers()
 
@@ -832,7 +824,7 @@ class TestActivityFeedIntegration:
         activity_feed._activities.clear()
 
         # Emit TASK_CREATED event
-        task_title = f"ActivityFeed test task {uuid4().hex[:6]}"
+        task_title = f"ActivityFeed test task {tid('t')}"
         await event_bus.emit(Event(
             type=EventType.TASK_CREATED,
             source="task_manager",
@@ -845,8 +837,6 @@ class TestActivityFeedIntegration:
             }
         ))
 
-        await asyncio.sleep(0)
-
         # CRITICAL: ActivityFeed must have recorded this event
         recent = await activity_feed.get_recent(limit=10)
         assert len(recent) > 0, \
@@ -867,7 +857,6 @@ class TestActivityFeedIntegration:
         from src.collaboration.activity_feed import activity_feed, ActivityType
         from src.core.events import event_bus, EventType, Event
         from uuid import uuid4
-        import asyncio
 
         register_activity_handlers()
         activity_feed._activities.clear()
@@ -882,8 +871,6 @@ class TestActivityFeedIntegration:
             }
         ))
 
-        await asyncio.sleep(0)
-
         recent = await activity_feed.get_recent(limit=10)
         assert len(recent) > 0, \
             "ActivityFeed is EMPTY after message! gateway did not emit MESSAGE_RECEIVED."
@@ -931,7 +918,7 @@ class TestStandupGeneratorIntegration:
 
         register_standup_handlers()
 
-        handlers = event_bus._handlers.get(EventType.CRON_TRIGGERED.value, [])
+        handlers = event_bus._keyed_handlers.get((EventType.CRON_TRIGGERED.value, "daily_standup"), ())
         assert len(handlers) > 0, \
             "No handler for CRON_TRIGGERED! register_standup_handlers() not called."
 
@@ -946,7 +933,6 @@ class TestStandupGeneratorIntegration:
               → standup_generator.generate_team_standup()
                 → report recorded in ActivityFeed
         """
-        import asyncio
         from src.collaboration.standup_handlers import register_standup_handlers
         from src.collaboration.activity_feed import activity_feed
         from src.core.events import event_bus, EventType, Event
@@ -972,8 +958,6 @@ class TestStandupGeneratorIntegration:
             },
         ))
 
-        await asyncio.sleep(0)
-
         # ActivityFeed must have standup_generated entry
         recent = await activity_feed.get_recent(limit=10)
         standup_entries = [a for a in recent if a.type == "standup_generated"]
@@ -985,7 +969,6 @@ class TestStandupGeneratorIntegration:
         """
         Test that the daily standup is written to workspace/standups/<date>.md.
         """
-        import asyncio
         from datetime import datetime, timezone
         from src.collaboration.standup_handlers import register_standup_handlers
         from src.collaboration.activity_feed import activity_feed
@@ -1010,8 +993,6 @@ class TestStandupGeneratorIntegration:
             },
         ))
 
-        await asyncio.sleep(0)
-
         date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         report_file = tmp_path / f"{date_str}.md"
 
@@ -1021,13 +1002,31 @@ class TestStandupGeneratorIntegration:
         assert "Standup" in content, \
             f"Standup file content is missing 'Standup' header. Got: {content[:200]}"
 
+    @pytest.mark.asyncio
+    async def test_standup_file_dated_by_cron_tick(self, tmp_path, monkeypatch):
+        """The report file is named after the tick that fired, not the time it finished."""
+        from datetime import datetime, timezone
+        from src.collaboration.standup_handlers import on_standup_cron_triggered
+        from src.core.events import EventType, Event
+
+        import src.collaboration.standup_handlers as sh_module
+        monkeypatch.setattr(sh_module, "STANDUP_DIR", tmp_path)
+
+        await on_standup_cron_triggered(Event(
+            type=EventType.CRON_TRIGGERED,
+            source="cron_scheduler",
+            data={"job_id": "test_job_tick", "job_name": "daily_standup"},
+            timestamp=datetime(2025, 12, 31, 23, 59, 59, tzinfo=timezone.utc),
+        ))
+
+        assert (tmp_path / "2025-12-31.md").exists()
+
     @pytest.mark.asyncio
     async def test_standup_cron_ignores_other_jobs(self):
         """
         Test that CRON_TRIGGERED events for other jobs are ignored.
         Only job_name='daily_standup' triggers report generation.
         """
-        import asyncio
         from src.collaboration.standup_handlers import register_standup_handlers
         from src.collaboration.activity_feed import activity_feed
         from src.core.events import event_bus, EventType, Event
@@ -1049,8 +1048,6 @@ class TestStandupGeneratorIntegration:
             },
         ))
 
-        await asyncio.sleep(0)
-
         recent = await activity_feed.get_recent(limit=10)
         standup_entries = [a for a in recent if a.type == "standup_generated"]
         assert len(standup_entries) == 0, \
@@ -1088,7 +1085,7 @@ class TestProactiveResearcherIntegration:
 
         register_research_handlers()
 
-        handlers = event_bus._handlers.get(EventType.CRON_TRIGGERED.value, [])
+        handlers = event_bus._keyed_handlers.get((EventType.CRON_TRIGGERED.value, "proactive_research"), ())
         assert len(handlers) > 0, \
             "No handler for CRON_TRIGGERED! register_research_handlers() not called."
 
@@ -1103,7 +1100,6 @@ class TestProactiveResearcherIntegration:
               → proactive_researcher.run_check_cycle()
                 → briefing saved to workspace/research/findings/<date>.md
         """
-        import asyncio
         from datetime import datetime, timezone
         from src.engine.research_handlers import register_research_handlers
         from src.engine.proactive_researcher import proactive_researcher, ResearchSource
@@ -1140,8 +1136,6 @@ class TestProactiveResearcherIntegration:
             },
         ))
 
-        await asyncio.sleep(0.1)  # Allow async handler to complete
-
         # Briefing file must exist
         date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         briefing_file = tmp_path / f"optimus-{date_str}.md"
@@ -1158,7 +1152,6 @@ class TestProactiveResearcherIntegration:
         Test that CRON_TRIGGERED events for other jobs are ignored.
         Only job_name='proactive_research' triggers research cycle.
         """
-        import asyncio
         from datetime import datetime, timezone
         from src.engine.research_handlers import register_research_handlers
         from src.core.events import event_bus, EventType, Event
@@ -1182,8 +1175,6 @@ class TestProactiveResearcherIntegration:
             },
         ))
 
-        await asyncio.sleep(0.1)
-
         # No briefing file should be created
         date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         briefing_file = tmp_path / f"optimus-{date_str}.md"
@@ -1223,7 +1214,7 @@ class TestReflectionEngineIntegration:
 
         register_reflection_handlers()
 
-        handlers = event_bus._handlers.get(EventType.CRON_TRIGGERED.value, [])
+        handlers = event_bus._keyed_handlers.get((EventType.CRON_TRIGGERED.value, "weekly_reflection"), ())
         assert len(handlers) > 0, \
             "No handler for CRON_TRIGGERED! register_reflection_handlers() not called."
 
@@ -1238,7 +1229,6 @@ class TestReflectionEngineIntegration:
               → reflection_engine.analyze_recent(agent_name, days=7)
                 → report saved to workspace/memory/reflections/<agent>/<year-W<week>>.md
         """
-        import asyncio
         from datetime import datetime, timezone
         from src.engine.reflection_handlers import register_reflection_handlers
         from src.engine.reflection_engine import reflection_engine
@@ -1264,8 +1254,6 @@ class TestReflectionEngineIntegration:
             },
         ))
 
-        await asyncio.sleep(0.1)  # Allow async handler to complete
-
         # Report file must exist (format: <agent>/<year-W<week>>.md)
         agent_dir = tmp_path / "optimus"
         assert agent_dir.exists(), \
@@ -1288,7 +1276,6 @@ class TestReflectionEngineIntegration:
         Test that CRON_TRIGGERED events for other jobs are ignored.
         Only job_name='weekly_reflection' triggers reflection analysis.
         """
-        import asyncio
         from datetime import datetime, timezone
         from src.engine.reflection_handlers import register_reflection_handlers
         from src.core.events import event_bus, EventType, Event
@@ -1312,8 +1299,6 @@ class TestReflectionEngineIntegration:
             },
         ))
 
-        await asyncio.sleep(0.1)
-
         # No report directory should be created
         agent_dir = tmp_path / "optimus"
         assert not agent_dir.exists(), \
@@ -1352,7 +1337,7 @@ class TestIntentPredictorIntegration:
 
         register_intent_handlers()
 
-        handlers = event_bus._handlers.get(EventType.CRON_TRIGGERED.value, [])
+        handlers = event_bus._keyed_handlers.get((EventType.CRON_TRIGGERED.value, "pattern_learning"), ())
         assert len(handlers) > 0, \
             "No handler for CRON_TRIGGERED! register_intent_handlers() not called."
 
@@ -1367,7 +1352,6 @@ class TestIntentPredictorIntegration:
               → intent_predictor.learn_patterns(agent_name, days=30)
                 → patterns saved to workspace/patterns/<agent>.json
         """
-        import asyncio
         from src.engine.intent_handlers import register_intent_handlers
         from src.engine.intent_predictor import intent_predictor
         from src.core.events import event_bus, EventType, Event
@@ -1392,8 +1376,6 @@ class TestIntentPredictorIntegration:
             },
         ))
 
-        await asyncio.sleep(0.1)  # Allow async handler to complete
-
         # Patterns file must exist (format: <agent>.json)
         patterns_file = tmp_path / "optimus.json"
 
@@ -1412,7 +1394,6 @@ class TestIntentPredictorIntegration:
         Test that CRON_TRIGGERED events for other jobs are ignored.
         Only job_name='pattern_learning' triggers pattern learning.
         """
-        import asyncio
         from src.engine.intent_handlers import register_intent_handlers
         from src.core.events import event_bus, EventType, Event
 
@@ -1435,8 +1416,6 @@ class TestIntentPredictorIntegration:
             },
         ))
 
-        await asyncio.sleep(0.1)
-
         # No patterns file should be created
         patterns_file = tmp_path / "optimus.json"
         assert not patterns_file.exists(), \
@@ -1679,7 +1658,6 @@ class TestIntentClassifierIntegration:
         This test WILL FAIL before integration and PASS after.
         It directly tests the REGRA DE OURO checkpoint #2.
         """
-        from unittest.mock import AsyncMock, patch
         from src.engine.intent_classifier import IntentResult
 
         # We'll mock the agent.process() to capture the context it receives
@@ -1960,7 +1938,6 @@ class TestWebChatChannelIntegration:
             → yields chunks from _response_queues[session_id]
         """
         from src.channels.webchat import webchat_channel
-        import asyncio
 
         await webchat_channel.start()
 
@@ -5841,7 +5818,6 @@ class TestFase12AuditTrail:
         except ImportError:
             pytest.skip("sqlalchemy not available in local env — runs in Docker")
 
-        from unittest.mock import AsyncMock, patch
         from src.core.gateway import Gateway
 
         gw = Gateway()
@@ -6229,7 +6205,6 @@ class TestFase15ContradictionDetection:
     async def test_check_returns_none_for_empty_similar(self):
         """_find_similar vazio → check() retorna None (nada para comparar)."""
         from src.core.contradiction_service import ContradictionService
-        from unittest.mock import AsyncMock, patch
 
         svc = ContradictionService()
         with patch.object(svc, "_find_similar", new=AsyncMock(return_value=[])):
@@ -6243,7 +6218,6 @@ class TestFase15ContradictionDetection:
             ContradictionService,
             ContradictionType,
         )
-        from unittest.mock import AsyncMock, patch
 
         svc = ContradictionService()
         mock_entry = {
@@ -6304,7 +6278,6 @@ class TestFase15ContradictionDetection:
         """force=True deve salvar sem chamar contradiction_service.check()."""
         from src.core.contradiction_service import contradiction_service
         from src.memory.collective_intelligence import CollectiveIntelligence
-        from unittest.mock import AsyncMock, patch
 
         ci = CollectiveIntelligence()
 
@@ -6329,7 +6302,6 @@ class TestFase15ContradictionDetection:
             contradiction_service,
         )
         from src.memory.collective_intelligence import CollectiveIntelligence
-        from unittest.mock import AsyncMock, patch
 
         ci = CollectiveIntelligence()
         mock_result = ContradictionResult(
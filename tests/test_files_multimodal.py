@@ -2,9 +2,11 @@
 Tests for Phase 14: Files Service + Multimodal.
 """
 
-import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from src.core.files_service import FilesService, ALLOWED_MIME_TYPES, MAX_FILE_SIZE_BYTES
+
+import pytest
+
+from src.core.files_service import ALLOWED_MIME_TYPES, MAX_FILE_SIZE_BYTES, FilesService
 
 
 class TestFilesServiceValidation:
@@ -65,7 +67,7 @@ class TestMultimodalContentBuilding:
     """Tests for BaseAgent._build_multimodal_content."""
 
     def test_builds_text_plus_image_parts(self):
-        from src.agents.base import BaseAgent, AgentConfig
+        from src.agents.base import AgentConfig, BaseAgent
 
         config = AgentConfig(name="test", role="tester")
         agent = BaseAgent(config)
@@ -84,7 +86,7 @@ class TestMultimodalContentBuilding:
         assert result[1]["image_url"]["url"] == "https://storage.example.com/img.png"
 
     def test_pdf_also_included(self):
-        from src.agents.base import BaseAgent, AgentConfig
+        from src.agents.base import AgentConfig, BaseAgent
 
         config = AgentConfig(name="test", role="tester")
         agent = BaseAgent(config)
@@ -99,7 +101,7 @@ class TestMultimodalContentBuilding:
         assert result[1]["type"] == "image_url"
 
     def test_empty_attachments_returns_text_only(self):
-        from src.agents.base import BaseAgent, AgentConfig
+        from src.agents.base import AgentConfig, BaseAgent
 
         config = AgentConfig(name="test", role="tester")
         agent = BaseAgent(config)
@@ -138,3 +140,56 @@ class TestReActLoopMultimodal:
         assert content_parts[0]["type"] == "text"
         assert content_parts[1]["type"] == "image_url"
         assert "screenshot.jpg" in content_parts[1]["image_url"]["url"]
+
+
+class TestKnowledgeBasePdfExtraction:
+    """Test that large PDFs are split across the shared worker pool."""
+
+    @staticmethod
+    def _blank_pdf(pages: int) -> bytes:
+        import io
+
+        import pypdf
+
+        writer = pypdf.PdfWriter()
+        for _ in range(pages):
+            writer.add_blank_page(width=200, height=200)
+        buf = io.BytesIO()
+        writer.write(buf)
+        return buf.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_parallel_extraction_matches_sequential(self, monkeypatch):
+        from src.core import knowledge_base as kb_module
+
+        kb = kb_module.KnowledgeBase()
+        content = self._blank_pdf(5)
+
+        monkeypatch.setattr(kb_module, "PDF_PARALLEL_MIN_PAGES", 100)
+        sequential = await kb._extract_text_from_pdf(content)
+        monkeypatch.setattr(kb_module, "PDF_PARALLEL_MIN_PAGES", 2)
+        parallel = await kb._extract_text_from_pdf(content)
+
+        assert parallel == sequential
+        assert parallel.count("\n") == 4
+
+        from src.core import pdf_worker
+
+        await pdf_worker.shutdown_pdf_pool()
+        assert pdf_worker._pdf_pool is None
+        await pdf_worker.shutdown_pdf_pool()  # idempotent
+
+    def test_worker_module_skips_app_imports(self):
+        import subprocess
+        import sys
+
+        probe = "import sys, src.core.pdf_worker; print(sorted(m for m in sys.modules if m.startswith('src.')))"
+        out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "['src.core', 'src.core.pdf_worker']"
+
+    @pytest.mark.asyncio
+    async def test_invalid_pdf_raises_value_error(self):
+        from src.core.knowledge_base import KnowledgeBase
+
+        with pytest.raises(ValueError, match="Failed to parse PDF"):
+            await KnowledgeBase()._extract_text_from_pdf(b"not a pdf")
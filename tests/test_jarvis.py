@@ -160,6 +160,20 @@ class TestContextAwareness:
         ctx = self.ctx_awareness.build_context(timezone_offset=0)
         assert ctx.timezone_offset == 0
 
+    def test_build_context_matches_clock(self):
+        before = datetime.now(timezone.utc).strftime("%H:%M UTC")
+        ctx = self.ctx_awareness.build_context(timezone_offset=0)
+        after = datetime.now(timezone.utc).strftime("%H:%M UTC")
+        assert ctx.utc_time in (before, after)
+        assert ctx.local_time == ctx.utc_time.removesuffix(" UTC")
+
+    def test_build_context_returns_independent_copies(self):
+        first = self.ctx_awareness.build_context(timezone_offset=-3)
+        first.yesterday_summary = "3 atividades registradas"
+        second = self.ctx_awareness.build_context(timezone_offset=-3)
+        assert second is not first
+        assert second.yesterday_summary == ""
+
     def test_time_slot_classification(self):
         assert self.ctx_awareness._get_time_slot(8) == "morning"
         assert self.ctx_awareness._get_time_slot(15) == "afternoon"
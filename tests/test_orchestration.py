@@ -108,18 +108,56 @@ class TestMCPTools:
         assert "db_query" in manifest
         assert "fs_read" in manifest
 
+    def test_iter_manifest_matches_generate_manifest(self):
+        chunks = list(self.registry.iter_manifest())
+        assert len(chunks) > 1
+        assert "".join(chunks) == self.registry.generate_manifest()
+
+    @pytest.mark.asyncio
+    async def test_generate_tools_manifest_returns_text_when_saving(self, tmp_path):
+        from src.skills.tools_manifest import generate_tools_manifest
+
+        out = tmp_path / "TOOLS.md"
+        manifest = await generate_tools_manifest(str(out))
+        assert manifest == out.read_text(encoding="utf-8")
+
     @pytest.mark.asyncio
     async def test_fs_read_not_found(self):
         result = await self.registry.execute("fs_read", {"path": "/nonexistent/file.txt"})
         assert result.success
         assert "not found" in result.output.lower()
 
+    @pytest.mark.asyncio
+    async def test_fs_read_truncates_large_file(self, tmp_path):
+        big = tmp_path / "big.log"
+        big.write_text("a" * 50_000, encoding="utf-8")
+        result = await self.registry.execute("fs_read", {"path": str(big)})
+        assert result.success
+        assert len(result.output) == 10_000
+
     @pytest.mark.asyncio
     async def test_fs_list_not_found(self):
         result = await self.registry.execute("fs_list", {"path": "/nonexistent/dir"})
         assert result.success
         assert "not found" in result.output.lower()
 
+    @pytest.mark.asyncio
+    async def test_fetch_url_reuses_shared_client(self):
+        import httpx
+
+        def handler(request):
+            if request.url.host == "r.jina.ai":
+                return httpx.Response(503)
+            return httpx.Response(200, text="x" * 50_000)
+
+        self.registry._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = await self.registry._get_http()
+        output = await self.registry._tool_research_fetch_url("https://example.com")
+        assert len(output) == 10_000
+        assert await self.registry._get_http() is client
+        await self.registry.close()
+        assert self.registry._http is None
+
 
 # ============================================
 # MCP Plugin Loader Tests
@@ -180,6 +218,23 @@ class TestA2AProtocol:
         assert len(coders) == 1
         assert coders[0].name == "friday"
 
+    def test_register_accepts_str_subclass_name(self):
+        class AgentName(str):
+            pass
+
+        self.a2a.register_agent(AgentCard(name=AgentName("friday"), role="Dev", level="specialist"))
+        assert self.a2a.get_card("friday") is not None
+
+    def test_capability_index_follows_reregister_and_unregister(self):
+        self.a2a.register_agent(AgentCard(name="friday", role="Dev", level="specialist", capabilities=["code"]))
+        self.a2a.register_agent(AgentCard(name="friday", role="Dev", level="specialist", capabilities=["debug"]))
+        assert self.a2a.discover(capability="code") == []
+        assert [a.name for a in self.a2a.discover(capability="debug")] == ["friday"]
+
+        self.a2a.unregister_agent("friday")
+        assert self.a2a.discover(capability="debug") == []
+        assert self.a2a._by_capability == {}
+
     def test_discover_available_only(self):
         self.a2a.register_agent(AgentCard(name="bot1", role="R", level="intern", status="available"))
         self.a2a.register_agent(AgentCard(name="bot2", role="R", level="intern", status="busy"))
@@ -228,6 +283,26 @@ class TestA2AProtocol:
         assert len(msgs_fur) == 1
         assert len(msgs_opt) == 0  # Sender excluded
 
+    @pytest.mark.asyncio
+    async def test_get_messages_by_type_is_indexed(self):
+        self.a2a.register_agent(AgentCard(name="opt", role="L", level="lead"))
+        await self.a2a.send(A2AMessage(from_agent="x", to_agent="opt", content="a"))
+        await self.a2a.send(A2AMessage(from_agent="x", to_agent="opt", message_type="response", content="b"))
+
+        responses = await self.a2a.get_messages("opt", message_type="response")
+        assert [m.content for m in responses] == ["b"]
+        assert [m.content for m in await self.a2a.get_messages("opt")] == ["b", "a"]
+        assert await self.a2a.get_messages("opt", message_type="delegation") == []
+        assert ("opt", "delegation") not in self.a2a._inbox
+
+    @pytest.mark.asyncio
+    async def test_get_messages_keeps_full_history(self):
+        self.a2a.register_agent(AgentCard(name="opt", role="L", level="lead"))
+        for i in range(1_500):
+            await self.a2a.send(A2AMessage(from_agent="x", to_agent="opt", content=str(i)))
+        assert len(await self.a2a.get_messages("opt")) == 1_500
+        assert len(await self.a2a.get_messages("opt", message_type="request")) == 1_500
+
     @pytest.mark.asyncio
     async def test_delegation(self):
         self.a2a.register_agent(AgentCard(name="optimus", role="Lead", level="lead"))
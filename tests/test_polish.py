@@ -2,16 +2,28 @@
 Tests for Phase 6 — Polish: Security, Performance, Events, Skills, Agents.
 """
 
-import pytest
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 
-from src.core.security import (
-    Permission, SandboxLevel, SecurityManager, PERMISSION_MATRIX, SANDBOX_BY_LEVEL,
-)
+import pytest
+
+from src.core.events import Event, EventBus, EventType, HeartbeatManager, WebhookReceiver
 from src.core.performance import (
-    ContextCompactor, QueryCache, SessionPruner,
+    ContextCompactor,
+    QueryCache,
+    SessionPruner,
+    normalize_query,
+    prune_noise_lines,
+)
+from src.core.security import (
+    LEVEL_MASKS,
+    PERMISSION_MATRIX,
+    SANDBOX_BY_LEVEL,
+    Permission,
+    SandboxLevel,
+    SecurityManager,
 )
-from src.core.events import Event, EventBus, EventType, HeartbeatManager, WebhookReceiver
 from src.skills.skills_registry import Skill, SkillsRegistry
 
 
@@ -40,6 +52,13 @@ class TestSecurity:
         result = self.sec.check_permission("intern_bot", "intern", Permission.DB_WRITE)
         assert result is False
 
+    def test_level_masks_match_matrix(self):
+        for level, perms in PERMISSION_MATRIX.items():
+            for perm in Permission:
+                assert self.sec.check_permission("x", level, perm) == (perm in perms)
+        assert set(LEVEL_MASKS) == set(PERMISSION_MATRIX)
+        assert not self.sec.check_permission("x", "unknown", Permission.DB_READ)
+
     def test_sandbox_levels(self):
         assert SANDBOX_BY_LEVEL["lead"] == SandboxLevel.FULL_ACCESS
         assert SANDBOX_BY_LEVEL["intern"] == SandboxLevel.ISOLATED
@@ -71,6 +90,16 @@ class TestSecurity:
         denied = self.sec.get_denied_actions()
         assert len(denied) >= 1
 
+    def test_denied_actions_by_agent_newest_first(self):
+        self.sec.check_permission("bot", "intern", Permission.SYSTEM_CONFIG)
+        self.sec.check_permission("other", "intern", Permission.NETWORK)
+        self.sec.check_permission("bot", "intern", Permission.DB_WRITE)
+        self.sec.check_permission("bot", "intern", Permission.DB_READ)  # allowed
+        denied = self.sec.get_denied_actions(agent_name="bot")
+        assert [e.permission for e in denied] == ["db_write", "system_config"]
+        assert self.sec.get_denied_actions(limit=1)[0].permission == "db_write"
+        assert self.sec.get_denied_actions(agent_name="nobody") == []
+
     def test_audit_stats(self):
         self.sec.check_permission("a", "lead", Permission.DB_READ)
         self.sec.check_permission("b", "intern", Permission.DB_WRITE)
@@ -127,6 +156,56 @@ class TestContextCompactor:
         assert result["compacted"]
         assert result["compacted_count"] < 30
 
+    def test_summary_caps_rendered_messages(self):
+        messages = [{"role": "user", "content": f"message {i}"} for i in range(45)]
+        summary = self.compactor._summarize_messages(messages)
+        assert summary.count("\n- [user]") == 29
+        assert "message 29" in summary
+        assert "message 30" not in summary
+        assert summary.endswith("... e mais 15 mensagens.")
+
+    def test_summary_folds_runs_of_identical_messages(self):
+        messages = [{"role": "tool", "content": "timeout"} for _ in range(5)]
+        messages.append({"role": "user", "content": "ok"})
+        messages += [{"role": "tool", "content": "timeout"} for _ in range(2)]
+        summary = self.compactor._summarize_messages(messages)
+        assert summary.splitlines() == [
+            "- [tool]: timeout (×5)",
+            "- [user]: ok",
+            "- [tool]: timeout (×2)",
+        ]
+
+    def test_summary_keeps_messages_differing_in_numbers(self):
+        messages = [{"role": "tool", "content": f"order {i} created"} for i in range(3)]
+        summary = self.compactor._summarize_messages(messages)
+        assert summary.splitlines() == [
+            "- [tool]: order 0 created",
+            "- [tool]: order 1 created",
+            "- [tool]: order 2 created",
+        ]
+
+    def test_summary_prunes_bounded_prefix(self, monkeypatch):
+        import src.core.performance as perf
+
+        scanned = []
+        monkeypatch.setattr(perf, "prune_noise_lines", lambda text: scanned.append(len(text)) or text)
+        summary = self.compactor._summarize_messages([{"role": "tool", "content": "x\n" * 100_000}])
+        assert scanned == [perf.SUMMARY_SCAN_CHARS]
+        assert len(summary) <= len("- [tool]: ") + 200
+
+    def test_prune_noise_lines_is_verbatim(self):
+        text = "\x1b[31mError: boom\x1b[0m\n\n  at f (a.py:1)\n  at f (a.py:1)\nsrc/app.py:42"
+        assert prune_noise_lines(text) == "Error: boom\n  at f (a.py:1)\nsrc/app.py:42"
+        assert prune_noise_lines("single line") == "single line"
+
+    @pytest.mark.asyncio
+    async def test_compact_reports_compression_ratio(self):
+        messages = [{"role": "user", "content": "x" * 400} for _ in range(20)]
+        result = await self.compactor.compact(messages)
+        assert 0 < result["compression_ratio"] < 1
+        short = await self.compactor.compact(messages[:2])
+        assert short["compression_ratio"] == 1.0
+
     def test_estimate_tokens(self):
         messages = [{"role": "user", "content": "a" * 400}]
         tokens = self.compactor.estimate_tokens(messages)
@@ -160,6 +239,70 @@ class TestQueryCache:
         assert stats["misses"] == 1
         assert stats["hit_rate"] == "50.0%"
 
+    def test_long_keys_stored_as_digest(self):
+        long_a = "contexto " * 100 + "pergunta A"
+        long_b = "contexto " * 100 + "pergunta B"
+        self.cache.set(long_a, "A")
+        self.cache.set(long_b, "B")
+        assert self.cache.get(long_a) == "A"
+        assert self.cache.get(long_b) == "B"
+        assert all(len(k) == 32 for k in self.cache._cache)
+        self.cache.invalidate(long_a)
+        assert self.cache.get(long_a) is None
+
+    def test_eviction_is_lru(self):
+        self.cache.set("a", "1")
+        self.cache.set("b", "2")
+        self.cache.set("c", "3")
+        self.cache.get("a")  # a becomes most recently used
+        self.cache.set("d", "4")
+        assert self.cache.get("a") == "1"
+        assert self.cache.get("b") is None
+
+    def test_negative_cache(self):
+        assert self.cache.get("k") is None
+        assert self.cache.get("k") is None
+        assert self.cache.get_stats()["neg_hits"] == 1
+        self.cache.set("k", "v")  # set clears the negative entry
+        assert self.cache.get("k") == "v"
+
+    def test_purge_expired(self):
+        cache = QueryCache(max_size=10, ttl_seconds=0, negative_ttl_seconds=0)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("missing")
+        time.sleep(0.001)
+        cache.purge_expired()
+        assert cache.get_stats()["size"] == 0
+        assert not cache._neg
+
+    def test_expired_entries_drop_on_next_op_via_heap(self):
+        cache = QueryCache(max_size=10, ttl_seconds=0)
+        cache.set("old", "1")
+        time.sleep(0.001)
+        cache.ttl_seconds = 60
+        cache.set("new", "2")  # pops "old" from the expiry heap, no scan
+        assert list(cache._cache) == ["new"]
+        cache.set("new", "3")
+        assert cache.get("new") == "3"
+
+    def test_expiry_heap_is_compacted(self):
+        cache = QueryCache(max_size=2, ttl_seconds=60)
+        for i in range(50):
+            cache.set("k", str(i))
+        assert len(cache._expiry) <= 2 * cache.max_size + 1
+
+    @pytest.mark.asyncio
+    async def test_purger_task_sweeps(self):
+        cache = QueryCache(max_size=10, ttl_seconds=0)
+        cache.set("a", "1")
+        await cache.start_purger(interval_seconds=0.01)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            await cache.stop_purger()
+        assert cache.get_stats()["size"] == 0
+
     def test_invalidate(self):
         self.cache.set("k", "v")
         self.cache.invalidate("k")
@@ -171,6 +314,21 @@ class TestQueryCache:
         self.cache.clear()
         assert self.cache.get_stats()["size"] == 0
 
+    def test_normalize_query(self):
+        assert normalize_query("  What is   Python?! ") == "what is python"
+        assert normalize_query("¿Qué es “Python”…") == "qué es “python”"
+        assert normalize_query("What is C++?") != normalize_query("what is C?")
+        assert normalize_query("What is C#") != normalize_query("what is c")
+        assert normalize_query("2+2") != normalize_query("22")
+
+    def test_normalized_keys_share_entry(self):
+        cache = QueryCache(max_size=10, ttl_seconds=60, normalize_keys=True)
+        cache.set("What is Python?", "a language")
+        assert cache.get("what is python") == "a language"
+        assert self.cache.get("what is python") is None  # exact-match by default
+        cache.invalidate("WHAT IS PYTHON")
+        assert cache.get("What is Python?") is None
+
 
 # ============================================
 # Event System Tests
@@ -213,6 +371,133 @@ class TestEventBus:
         await self.bus.emit(Event(type="test", source="test"))
         assert len(received) == 0
 
+    @pytest.mark.asyncio
+    async def test_subscribe_during_emit_applies_next_time(self):
+        received = []
+
+        async def late(event: Event):
+            received.append("late")
+
+        async def first(event: Event):
+            received.append("first")
+            self.bus.on("test", late)
+
+        self.bus.on("test", first)
+        await self.bus.emit(Event(type="test", source="test"))
+        assert received == ["first"]
+        assert isinstance(self.bus._handlers["test"], tuple)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_subscribe_is_ignored(self):
+        received = []
+
+        async def handler(event: Event):
+            received.append(event)
+
+        self.bus.on("test", handler)
+        self.bus.on("test", handler)
+        await self.bus.emit(Event(type="test", source="test"))
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_single_handler_error_is_logged_not_raised(self):
+        async def boom(event: Event):
+            raise RuntimeError("boom")
+
+        self.bus.on("test", boom)
+        await self.bus.emit(Event(type="test", source="test"))
+        assert len(self.bus.get_recent_events()) == 1
+
+    @pytest.mark.asyncio
+    async def test_emit_many_logs_in_order(self):
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.type)
+
+        self.bus.on("*", handler)
+        await self.bus.emit_many([Event(type="a"), Event(type="b"), Event(type="c")])
+        assert sorted(received) == ["a", "b", "c"]
+        assert [e.type for e in self.bus._event_log] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_enum_member_event_type_subscribes(self):
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.type)
+
+        self.bus.on(EventType.CRON_TRIGGERED, handler)
+        self.bus.on_keyed(EventType.CRON_TRIGGERED, "daily_standup", handler)
+        await self.bus.emit(Event(type=EventType.CRON_TRIGGERED.value, data={"job_name": "daily_standup"}))
+        assert len(received) == 2
+        self.bus.off(EventType.CRON_TRIGGERED, handler)
+        self.bus.off_keyed(EventType.CRON_TRIGGERED, "daily_standup", handler)
+        await self.bus.emit(Event(type=EventType.CRON_TRIGGERED, data={"job_name": "daily_standup"}))
+        assert len(received) == 2
+
+    @pytest.mark.asyncio
+    async def test_keyed_handler_only_wakes_for_its_job(self):
+        received = []
+
+        async def standup(event: Event):
+            received.append(("standup", event.data["job_name"]))
+
+        async def any_cron(event: Event):
+            received.append(("any", event.data["job_name"]))
+
+        self.bus.on_keyed("cron", "daily_standup", standup)
+        self.bus.on_keyed("cron", "daily_standup", standup)  # idempotent
+        self.bus.on("cron", any_cron)
+        await self.bus.emit(Event(type="cron", data={"job_name": "other"}))
+        await self.bus.emit(Event(type="cron", data={"job_name": "daily_standup"}))
+        assert sorted(received) == [("any", "daily_standup"), ("any", "other"), ("standup", "daily_standup")]
+
+        self.bus.off_keyed("cron", "daily_standup", standup)
+        received.clear()
+        await self.bus.emit(Event(type="cron", data={"job_name": "daily_standup"}))
+        assert received == [("any", "daily_standup")]
+
+    @pytest.mark.asyncio
+    async def test_event_log_keeps_newest_up_to_cap(self):
+        bus = EventBus()
+        cap = bus._max_log_size
+        await bus.emit_many([Event(type=f"e{i}") for i in range(cap + 5)])
+        assert len(bus._event_log) == cap
+        assert bus._event_log[0].type == "e5"
+        assert bus._event_log[-1].type == f"e{cap + 4}"
+
+    @pytest.mark.asyncio
+    async def test_emit_nowait_holds_task_until_done(self):
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.type)
+
+        self.bus.on("x", handler)
+        task = self.bus.emit_nowait(Event(type="x"))
+        assert task in self.bus._background
+        await task
+        assert received == ["x"]
+        assert not self.bus._background
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_chained_background_emits(self):
+        received = []
+
+        async def first(event: Event):
+            self.bus.emit_nowait(Event(type="second"))
+
+        async def second(event: Event):
+            received.append(event.type)
+
+        self.bus.on("first", first)
+        self.bus.on("second", second)
+        self.bus.emit_nowait(Event(type="first"))
+        await self.bus.flush()
+        assert received == ["second"]
+        assert not self.bus._background
+
     @pytest.mark.asyncio
     async def test_recent_events(self):
         await self.bus.emit_simple("a.b", source="s1")
@@ -277,6 +562,31 @@ class TestSkillsRegistry:
         skills = self.registry.list_skills()
         assert len(skills) >= 8
 
+    def test_skill_has_no_instance_dict(self):
+        skill = Skill(name="slotted", description="Uses __slots__")
+        assert not hasattr(skill, "__dict__")
+
+    def test_registry_has_no_instance_dict(self):
+        registry = SkillsRegistry(install_builtins=False)
+        assert not hasattr(registry, "__dict__")
+        with pytest.raises(AttributeError):
+            registry.unexpected = True
+
+    def test_empty_registry_without_builtins(self):
+        registry = SkillsRegistry(install_builtins=False)
+        assert registry.list_skills(enabled_only=False) == []
+
+    def test_builtins_not_shared_between_registries(self):
+        other = SkillsRegistry()
+        other.disable("code_generation")
+        assert self.registry.get("code_generation").enabled is True
+
+    def test_builtin_tuple_fields_are_shared(self):
+        other = SkillsRegistry()
+        mine, theirs = self.registry.get("code_review"), other.get("code_review")
+        assert mine.agent_compatibility == ("friday", "guardian", "all")
+        assert mine.tools is theirs.tools
+
     def test_install_skill(self):
         skill = Skill(name="custom_skill", description="A custom skill", category="custom")
         self.registry.install(skill)
@@ -292,6 +602,54 @@ class TestSkillsRegistry:
         code_skills = self.registry.list_skills(category="code")
         assert all(s.category == "code" for s in code_skills)
 
+    def test_filter_by_agent(self):
+        self.registry.install(Skill(
+            name="fury_only", description="Fury skill", agent_compatibility=["fury"],
+        ))
+        fury_names = [s.name for s in self.registry.list_skills(agent="fury")]
+        friday_names = [s.name for s in self.registry.list_skills(agent="friday")]
+        assert "fury_only" in fury_names
+        assert "fury_only" not in friday_names
+        assert "task_management" in friday_names  # agent_compatibility=["all"]
+        assert fury_names == sorted(fury_names)
+
+    def test_filter_by_unknown_agent_returns_universal_skills(self):
+        names = {s.name for s in self.registry.list_skills(agent="nobody")}
+        assert names == {
+            s.name for s in self.registry.list_skills() if "all" in s.agent_compatibility
+        }
+
+    def test_shared_skill_keeps_per_registry_agent_masks(self):
+        first = SkillsRegistry(install_builtins=False)
+        second = SkillsRegistry(install_builtins=False)
+        first.install(Skill(name="warmup", description="x", agent_compatibility=("alpha",)))
+        shared = Skill(name="shared", description="x", agent_compatibility=("beta",))
+        first.install(shared)
+        second.install(shared)
+        assert [s.name for s in first.list_skills(agent="beta")] == ["shared"]
+        assert [s.name for s in second.list_skills(agent="beta")] == ["shared"]
+        assert second.list_skills(agent="alpha") == []
+
+    def test_reinstall_updates_indexes(self):
+        self.registry.install(Skill(name="moving", description="x", category="alpha"))
+        self.registry.install(Skill(name="moving", description="x", category="beta"))
+        assert [s.name for s in self.registry.list_skills(category="alpha")] == []
+        assert [s.name for s in self.registry.list_skills(category="beta")] == ["moving"]
+
+    def test_sparse_filter_sorted(self):
+        registry = SkillsRegistry(install_builtins=False)
+        for i in range(40):
+            registry.install(Skill(name=f"skill_{i:02d}", description="x", category="bulk"))
+        for name in ("zeta", "alpha", "mid"):
+            registry.install(Skill(name=name, description="x", category="rare"))
+        assert [s.name for s in registry.list_skills(category="rare")] == ["alpha", "mid", "zeta"]
+        assert len(registry.list_skills(enabled_only=False)) == 43
+
+    def test_disabled_skill_hidden_by_default(self):
+        self.registry.disable("code_review")
+        assert "code_review" not in [s.name for s in self.registry.list_skills()]
+        assert "code_review" in [s.name for s in self.registry.list_skills(enabled_only=False)]
+
     def test_disable_enable(self):
         self.registry.disable("code_generation")
         disabled = self.registry.get("code_generation")
@@ -306,12 +664,135 @@ class TestSkillsRegistry:
         assert "code" in categories
         assert "research" in categories
 
+    def test_categories_track_install_and_uninstall(self):
+        registry = SkillsRegistry(install_builtins=False)
+        registry.install(Skill(name="b", description="B", category="zeta"))
+        registry.install(Skill(name="a", description="A", category="alpha"))
+        registry.install(Skill(name="c", description="C", category="alpha"))
+        assert registry.get_categories() == ["alpha", "zeta"]
+        registry.uninstall("a")
+        assert registry.get_categories() == ["alpha", "zeta"]
+        registry.uninstall("c")
+        registry.install(Skill(name="b", description="B", category="mid"))
+        assert registry.get_categories() == ["mid"]
+
     def test_generate_catalogue(self):
         catalogue = self.registry.generate_catalogue()
         assert "Skills Catalogue" in catalogue
         assert "code_generation" in catalogue
 
+    def test_skill_render_markdown(self):
+        skill = Skill(name="render_me", description="Renders", tools=["fs_read"])
+        rendered = skill.render_markdown()
+        assert "### ✅ render_me (v1.0.0)" in rendered
+        assert "**Tools:** fs_read" in rendered
+        assert skill.render_markdown() is rendered
+
+    def test_catalogue_cache_invalidated_on_mutation(self):
+        first = self.registry.generate_catalogue()
+        assert self.registry.generate_catalogue() is first
+        self.registry.disable("code_generation")
+        updated = self.registry.generate_catalogue()
+        assert updated is not first
+        assert "⏸️ code_generation" in updated
+
     @pytest.mark.asyncio
     async def test_load_nonexistent_dir(self):
         count = await self.registry.load_from_directory("/nonexistent/skills")
         assert count == 0
+
+    @pytest.mark.asyncio
+    async def test_dir_created_after_miss_is_loaded(self, tmp_path):
+        skills_dir = tmp_path / "skills"
+        assert await self.registry.load_from_directory(str(skills_dir)) == 0
+        (skills_dir / "late").mkdir(parents=True)
+        (skills_dir / "late" / "SKILL.md").write_text("# late_skill\nLate\n", encoding="utf-8")
+        assert await self.registry.load_from_directory(str(skills_dir)) == 1
+
+    def test_parse_skill_md_plain(self):
+        skill = self.registry._parse_skill_md(
+            "# pdf_tools\n\nWork with PDF files\nCategory: documents\n", "x/SKILL.md"
+        )
+        assert skill.name == "pdf_tools"
+        assert skill.description == "Work with PDF files"
+        assert skill.category == "documents"
+
+    def test_parse_skill_md_crlf(self):
+        skill = self.registry._parse_skill_md(
+            "# T\r\nDescription: hi\r\nCategory: docs\r\n", "x/SKILL.md"
+        )
+        assert skill.name == "T"
+        assert skill.description == "hi"
+        assert skill.category == "docs"
+
+    def test_parse_skill_md_frontmatter(self):
+        content = (
+            "---\nname: sheets\ndescription: \"Spreadsheet helpers\"\ncategory: analysis\n---\n"
+            "# Sheets\n\nLonger body text.\n"
+        )
+        skill = self.registry._parse_skill_md(content, "x/SKILL.md")
+        assert skill.name == "sheets"
+        assert skill.description == "Spreadsheet helpers"
+        assert skill.category == "analysis"
+
+    @pytest.mark.asyncio
+    async def test_load_from_directory(self, tmp_path):
+        for name in ("alpha", "beta"):
+            skill_dir = tmp_path / name
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(
+                f"# {name}_skill\nDescription: The {name} skill\nCategory: custom\n",
+                encoding="utf-8",
+            )
+        (tmp_path / "alpha" / "README.md").write_text("# not a skill\n", encoding="utf-8")
+        count = await self.registry.load_from_directory(str(tmp_path))
+        assert count == 2
+        skill = self.registry.get("alpha_skill")
+        assert skill.description == "The alpha skill"
+        assert skill.category == "custom"
+
+    @pytest.mark.asyncio
+    async def test_load_from_directory_bounds_concurrent_reads(self, tmp_path, monkeypatch):
+        from src.skills import skills_registry as registry_module
+
+        for i in range(12):
+            (tmp_path / f"s{i}").mkdir()
+            (tmp_path / f"s{i}" / "SKILL.md").write_text(f"# skill_{i}\n", encoding="utf-8")
+
+        active = peak = 0
+        real_to_thread = asyncio.to_thread
+
+        async def tracking_to_thread(func, *args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(0)
+                return await real_to_thread(func, *args, **kwargs)
+            finally:
+                active -= 1
+
+        monkeypatch.setattr(registry_module, "MAX_CONCURRENT_READS", 3)
+        monkeypatch.setattr(registry_module.asyncio, "to_thread", tracking_to_thread)
+        count = await self.registry.load_from_directory(str(tmp_path))
+        assert count == 12
+        assert peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_load_from_directory_skips_cancelled_reads(self, tmp_path, monkeypatch):
+        for name in ("good", "cancelled"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "SKILL.md").write_text(f"# {name}\n", encoding="utf-8")
+
+        real_read = SkillsRegistry._read_and_parse
+
+        async def read_or_cancel(self, skill_md, sem):
+            if "cancelled" in skill_md:
+                raise asyncio.CancelledError
+            return await real_read(self, skill_md, sem)
+
+        # SkillsRegistry uses __slots__, so patch the class rather than the instance
+        monkeypatch.setattr(SkillsRegistry, "_read_and_parse", read_or_cancel)
+        registry = SkillsRegistry(install_builtins=False)
+        assert await registry.load_from_directory(str(tmp_path)) == 1
+        assert [s.name for s in registry.list_skills()] == ["good"]
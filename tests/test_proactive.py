@@ -96,6 +96,42 @@ class TestSessionBootstrap:
     def test_is_stale_when_no_cache(self):
         assert self.bootstrap._is_stale("uncached_agent")
 
+    @pytest.mark.asyncio
+    async def test_recent_context_skips_stale_check(self, monkeypatch):
+        import src.memory.session_bootstrap as sb
+
+        checks = []
+        monkeypatch.setattr(self.bootstrap, "_is_stale", lambda name: checks.append(name) or False)
+        ctx = BootstrapContext(agent_name="a", soul="soul")
+        self.bootstrap._cache["a"] = ctx
+        self.bootstrap._checked_at["a"] = sb.time.monotonic()
+
+        assert await self.bootstrap.load_context("a") is ctx
+        assert checks == []
+
+        self.bootstrap._checked_at["a"] -= sb.STALE_CHECK_TTL_SECONDS
+        assert await self.bootstrap.load_context("a") is ctx
+        assert checks == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_add_learning_invalidates_cached_context(self, tmp_path, monkeypatch):
+        import src.memory.session_bootstrap as sb
+        from src.memory.long_term import LongTermMemory
+
+        async def no_db(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(sb, "session_bootstrap", self.bootstrap)
+        self.bootstrap._cache["a"] = BootstrapContext(agent_name="a")
+        self.bootstrap._checked_at["a"] = sb.time.monotonic()
+
+        ltm = LongTermMemory(memory_dir=tmp_path)
+        monkeypatch.setattr(ltm, "_insert_to_db", no_db)
+        await ltm.add_learning("a", "técnico", "FastAPI é rápido")
+
+        assert "a" not in self.bootstrap._cache
+        assert "a" not in self.bootstrap._checked_at
+
 
 # ============================================
 # Auto Journal Tests
@@ -258,12 +294,29 @@ class TestCronScheduler:
         assert job_id == job.id
         assert job.id in self.scheduler._jobs
 
+    def test_add_many_saves_once(self, monkeypatch):
+        saves = []
+        monkeypatch.setattr(self.scheduler, "_save", lambda: saves.append(1))
+        jobs = [self.CronJob(name=f"Batch {i}", schedule_type="every", schedule_value="1h") for i in range(3)]
+        ids = self.scheduler.add_many(jobs)
+        assert ids == [j.id for j in jobs]
+        assert all(j.next_run for j in jobs)
+        assert self.scheduler.job_count == 3
+        assert saves == [1]
+
     def test_remove_job(self):
         job = self.CronJob(name="To Remove", schedule_type="at", schedule_value="2026-12-31T00:00:00Z")
         self.scheduler.add(job)
         assert self.scheduler.remove(job.id)
         assert job.id not in self.scheduler._jobs
 
+    def test_remove_wakes_loop(self):
+        job = self.CronJob(name="Wake", schedule_type="every", schedule_value="1h")
+        self.scheduler.add(job)
+        self.scheduler._wake = asyncio.Event()
+        self.scheduler.remove(job.id)
+        assert self.scheduler._wake.is_set()
+
     def test_remove_nonexistent(self):
         assert not self.scheduler.remove("nonexistent-id")
 
@@ -322,6 +375,107 @@ class TestCronScheduler:
         job.next_run = job.schedule_value
         assert not self.scheduler._is_due(job)
 
+    @pytest.mark.asyncio
+    async def test_kept_one_shot_job_not_due_after_run(self):
+        job = self.CronJob(
+            name="Once",
+            schedule_type="at",
+            schedule_value=(datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat(),
+        )
+        self.scheduler.add(job)
+        assert self.scheduler._is_due(job)
+        await self.scheduler.run_now(job.id)
+        assert job.id in self.scheduler._jobs
+        assert not self.scheduler._is_due(job)
+
+    @pytest.mark.asyncio
+    async def test_run_now_keeps_future_one_shot_scheduled(self):
+        when = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        job = self.CronJob(name="Later", schedule_type="at", schedule_value=when)
+        self.scheduler.add(job)
+        await self.scheduler.run_now(job.id)
+        assert job.run_count == 1
+        assert job.next_run == when
+
+    @pytest.mark.asyncio
+    async def test_recurring_jobs_advance_or_park_after_run(self):
+        stale_cron = self.CronJob(name="Stale cron", schedule_type="cron", schedule_value="0 9 * * *")
+        bogus = self.CronJob(name="Bogus", schedule_type="every", schedule_value="bogus")
+        self.scheduler.add_many([stale_cron, bogus])
+        stale_cron.next_run = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+
+        await self.scheduler.run_now(stale_cron.id)
+        await self.scheduler.run_now(bogus.id)
+        assert not self.scheduler._is_due(stale_cron)
+        assert datetime.fromisoformat(stale_cron.next_run) > datetime.now(timezone.utc)
+        assert bogus.next_run == ""
+
+    @pytest.mark.asyncio
+    async def test_loop_does_not_spin_on_stale_job(self, monkeypatch):
+        from src.core.cron_scheduler import MIN_IDLE_SECONDS
+        from src.core.events import EventType, event_bus
+
+        fired = []
+
+        async def on_cron(event):
+            if event.data.get("job_name") == "Stale cron":
+                fired.append(event)
+
+        job = self.CronJob(name="Stale cron", schedule_type="cron", schedule_value="0 9 * * *")
+        self.scheduler.add(job)
+        # Simulate a job whose next_run never advances (e.g. _execute_job kept failing)
+        monkeypatch.setattr(self.scheduler, "_calculate_next_run", lambda j: job.next_run)
+        job.next_run = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        assert self.scheduler._seconds_until_next_due() == MIN_IDLE_SECONDS
+
+        event_bus.on(EventType.CRON_TRIGGERED.value, on_cron)
+        await self.scheduler.start()
+        try:
+            await asyncio.sleep(0.3)
+        finally:
+            await self.scheduler.stop()
+            event_bus.off(EventType.CRON_TRIGGERED.value, on_cron)
+        assert len(fired) == 1
+
+    def test_seconds_until_next_due(self):
+        from src.core.cron_scheduler import MAX_IDLE_SECONDS
+
+        assert self.scheduler._seconds_until_next_due() == MAX_IDLE_SECONDS
+        soon = self.CronJob(
+            name="Soon",
+            schedule_type="at",
+            schedule_value=(datetime.now(timezone.utc) + timedelta(seconds=5)).isoformat(),
+        )
+        self.scheduler.add(soon)
+        assert 1 <= self.scheduler._seconds_until_next_due() <= 5
+        soon.enabled = False
+        assert self.scheduler._seconds_until_next_due() == MAX_IDLE_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_loop_fires_job_when_due_without_polling_tick(self):
+        from src.core.events import EventType, event_bus
+
+        fired = asyncio.get_running_loop().create_future()
+
+        async def on_cron(event):
+            if event.data.get("job_name") == "Precise" and not fired.done():
+                fired.set_result(True)
+
+        event_bus.on(EventType.CRON_TRIGGERED.value, on_cron)
+        await self.scheduler.start()
+        try:
+            # Added after start(): add() must wake the sleeping loop to re-arm
+            self.scheduler.add(self.CronJob(
+                name="Precise",
+                schedule_type="at",
+                schedule_value=(datetime.now(timezone.utc) + timedelta(milliseconds=100)).isoformat(),
+                delete_after_run=True,
+            ))
+            assert await asyncio.wait_for(fired, 2)
+        finally:
+            await self.scheduler.stop()
+            event_bus.off(EventType.CRON_TRIGGERED.value, on_cron)
+
     def test_job_serialization(self):
         job = self.CronJob(name="Serialize Me", schedule_type="every", schedule_value="1h")
         d = job.to_dict()
@@ -368,6 +522,13 @@ class TestSkillsDiscovery:
         assert "categories" in stats
         assert isinstance(stats["indexed_skills"], int)
 
+    def test_rebuild_skipped_when_registry_unchanged(self):
+        self.discovery._rebuild_index()
+        index = self.discovery._index
+        first = index[next(iter(index))]
+        self.discovery._rebuild_index()
+        assert self.discovery._index[next(iter(index))] is first
+
 
 # ============================================
 # Cron Native Jobs Tests
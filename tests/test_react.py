@@ -196,6 +196,38 @@ class TestModelRouter:
         assert result["content"] == "History reply"
         assert "raw_message" in result
 
+    def test_lazy_module_imports_on_first_access(self):
+        from src.infra.model_router import _LazyModule
+
+        loaded = []
+        lazy = _LazyModule("json", on_load=loaded.append)
+        assert loaded == []
+        assert lazy.dumps({"a": 1}) == '{"a": 1}'
+        assert lazy.loads("[]") == []
+        assert loaded == [json]
+
+    @pytest.mark.asyncio
+    async def test_preload_sdks_imports_off_loop(self, monkeypatch):
+        import threading
+
+        import src.infra.model_router as mr
+
+        loaded_in = []
+        lazy = mr._LazyModule("json", on_load=lambda m: loaded_in.append(threading.current_thread()))
+        monkeypatch.setattr(mr, "litellm", lazy)
+        await mr.preload_sdks()
+        assert loaded_in and loaded_in[0] is not threading.main_thread()
+        assert lazy.dumps([]) == "[]"
+
+    @pytest.mark.asyncio
+    async def test_lazy_module_missing_falls_back_to_dummy(self):
+        from src.infra.model_router import _LazyModule
+
+        lazy = _LazyModule("not_a_real_sdk_xyz")
+        assert lazy.anything is None
+        with pytest.raises(ImportError):
+            await lazy.acompletion(model="x")
+
 
 # ============================================
 # 3. ReAct Loop Tests